@@ -38,6 +38,7 @@ def main():
             batch=4,  # 以此降低显存压力
             workers=0,  # 内存保护
             conf=0.001,  # 置信度阈值设低一点，为了画出完整的 PR 曲线
+            val_cache=True,  # 复用相同权重和数据的缓存预测, 跳过重复推理
             iou=0.6,  # NMS IoU 阈值
             plots=True,  # ✅ 核心：必须为 True 才会画图
             save_json=True,
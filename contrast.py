@@ -29,7 +29,7 @@ def main():
         try:
             model_base = YOLO(baseline_path)
             # 运行验证模式 (val) 获取指标
-            metrics_base = model_base.val(data=dataset_yaml, split='test', device=device, plots=False)
+            metrics_base = model_base.val(data=dataset_yaml, split='test', device=device, plots=False, val_cache=True)
             map_base = metrics_base.box.map
             print(f"   ---> Baseline mAP50-95: {map_base:.4f}")
         except Exception as e:
@@ -51,7 +51,7 @@ def main():
         try:
             model_our = YOLO(pconv_path)
             # 运行验证模式 (val)
-            metrics_our = model_our.val(data=dataset_yaml, split='test', device=device, plots=False)
+            metrics_our = model_our.val(data=dataset_yaml, split='test', device=device, plots=False, val_cache=True)
             map_our = metrics_our.box.map
             print(f"   ---> Ours mAP50-95: {map_our:.4f}")
         except Exception as e:
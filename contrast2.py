@@ -16,7 +16,7 @@ def get_model_metrics(model_path, dataset_yaml, device):
     try:
         model = YOLO(model_path)
         # 运行验证模式 (val)，关闭 verbose 减少刷屏
-        metrics = model.val(data=dataset_yaml, split='test', device=device, plots=False, verbose=False)
+        metrics = model.val(data=dataset_yaml, split='test', device=device, plots=False, verbose=False, val_cache=True)
         return metrics.box.map
     except Exception as e:
         print(f"⚠️ 加载失败 {model_path}: {e}")
@@ -35,7 +35,7 @@ def main():
         print("⏩ 跳过训练，直接加载模型...")
         try:
             model_base = YOLO(baseline_path)
-            metrics_base = model_base.val(data=dataset_yaml, split='test', device=device, plots=False)
+            metrics_base = model_base.val(data=dataset_yaml, split='test', device=device, plots=False, val_cache=True)
             map_base = metrics_base.box.map
         except Exception as e:
             print(f"⚠️ 读取旧模型失败: {e}")
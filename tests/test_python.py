@@ -2,6 +2,9 @@
 
 import contextlib
 import csv
+import json
+import threading
+import time
 import urllib
 from copy import copy
 from pathlib import Path
@@ -14,7 +17,7 @@ from PIL import Image
 
 from tests import CFG, MODEL, MODELS, SOURCE, SOURCES_LIST, TASK_MODEL_DATA
 from ultralytics import RTDETR, YOLO
-from ultralytics.cfg import TASK2DATA, TASKS
+from ultralytics.cfg import TASK2DATA, TASKS, get_cfg
 from ultralytics.data.build import load_inference_source
 from ultralytics.data.utils import check_det_dataset
 from ultralytics.utils import (
@@ -74,6 +77,121 @@ def test_model_profile():
     _ = model.predict(im, profile=True)
 
 
+def test_predict_profile_layers(tmp_path):
+    """Test per-layer latency collection and Chrome trace export with `profile_layers=True`."""
+    model = YOLO("yolo11-pconv.yaml")
+    for _ in range(2):
+        results = model.predict(
+            torch.rand(2, 3, 64, 64), profile_layers=True, project=tmp_path, name="a", save=True, exist_ok=True
+        )
+    assert "4 C3_PConv" in results[0].speed["layers"]
+    stats = model.predictor.layer_profiler.summary()
+    assert stats["22 Detect"]["calls"] == 2 and stats["22 Detect"]["p90"] > 0
+    trace = json.loads((tmp_path / "a" / "layers_trace.json").read_text())
+    assert len(trace["traceEvents"]) == 2 * len(model.model.model)
+    model.predict(torch.rand(1, 3, 64, 64), profile_layers=True, project=tmp_path, name="b")
+    assert not (tmp_path / "b" / "layers_trace.json").exists()  # no trace without save=True
+
+
+def test_predict_pipeline():
+    """Test that pipelined prediction returns the same results in source order as sequential prediction."""
+    model = YOLO("yolo11-pconv.yaml")
+    source = [np.random.randint(0, 255, (64, 96, 3), dtype=np.uint8) for _ in range(5)]
+    results = model.predict(source, batch=2, conf=0.0, max_det=10)
+    pipelined = model.predict(source, batch=2, conf=0.0, max_det=10, pipeline=True)
+    assert len(pipelined) == len(results)
+    for r, p in zip(results, pipelined):
+        assert r.orig_img is p.orig_img and torch.allclose(r.boxes.data, p.boxes.data)
+    n = threading.active_count()
+    for _ in model.predict(source, stream=True, pipeline=True):  # early exit stops the pipeline threads
+        break
+    assert threading.active_count() == n
+
+
+def test_predict_pipeline_save_txt(tmp_path):
+    """Test that pipelined prediction names saved labels with the source state of each batch, not of later ones."""
+    source = tmp_path / "source"
+    source.mkdir()
+    cv2.imwrite(str(source / "a.jpg"), np.random.randint(0, 255, (64, 96, 3), dtype=np.uint8))
+    writer = cv2.VideoWriter(str(source / "b.mp4"), cv2.VideoWriter_fourcc(*"mp4v"), 30, (96, 64))
+    for _ in range(4):
+        writer.write(np.random.randint(0, 255, (64, 96, 3), dtype=np.uint8))
+    writer.release()
+
+    model = YOLO("yolo11-pconv.yaml")
+    model.add_callback("on_predict_batch_start", lambda p: time.sleep(0.05))  # let the reader run ahead
+    for pipeline in False, True:
+        model.predict(source, imgsz=64, conf=0.0, save_txt=True, pipeline=pipeline, project=tmp_path, name=pipeline)
+    expected = {"a.txt", *(f"b_{i}.txt" for i in range(1, 5))}
+    for pipeline in False, True:
+        assert {f.name for f in (tmp_path / str(pipeline) / "labels").iterdir()} == expected
+
+
+def test_track_pipeline_reid(tmp_path):
+    """Test that pipelined tracking hands each batch its own Detect features for native BoT-SORT ReID."""
+    video = str(tmp_path / "video.mp4")
+    writer = cv2.VideoWriter(video, cv2.VideoWriter_fourcc(*"mp4v"), 30, (96, 64))
+    for _ in range(8):
+        writer.write(np.random.randint(0, 255, (64, 96, 3), dtype=np.uint8))
+    writer.release()
+    tracker = tmp_path / "botsort-reid.yaml"
+    YAML.save(tracker, {**YAML.load(ROOT / "cfg/trackers/botsort.yaml"), "with_reid": True, "model": "auto"})
+
+    model, feats = YOLO("yolo11-pconv.yaml"), {False: [], True: []}
+    model.add_callback("on_predict_batch_start", lambda p: time.sleep(0.05))  # let inference run ahead
+    model.add_callback("on_predict_postprocess_end", lambda p: feats[p.args.pipeline].append(p._feats[0].clone()))
+    for pipeline in False, True:
+        model.predictor = None
+        model.track(video, imgsz=64, conf=0.0, max_det=5, tracker=tracker, pipeline=pipeline)
+    assert len(feats[True]) == 8 and all(torch.allclose(a, b) for a, b in zip(feats[False], feats[True]))
+
+
+def test_predict_input_buffers():
+    """Test that pooled letterbox preprocessing matches stacked `pre_transform` outputs and reuses its buffers."""
+    model = YOLO("yolo11-pconv.yaml")
+    model.predict(np.zeros((64, 64, 3), dtype=np.uint8), imgsz=64)
+    predictor = model.predictor
+    for shapes in ((48, 80, 3), (48, 80, 3)), ((48, 80, 3), (70, 30, 3)), ((40, 50, 1),):
+        im = [np.random.randint(0, 255, s, dtype=np.uint8) for s in shapes]
+        ref = np.stack(predictor.pre_transform(im))
+        ref = ref[..., ::-1] if ref.shape[-1] == 3 else ref
+        x = predictor.pre_transform_into(im)
+        assert np.array_equal(x.numpy(), ref.transpose(0, 3, 1, 2))
+        assert predictor.pre_transform_into(im).data_ptr() == x.data_ptr()
+
+
+def test_inference_server():
+    """Test that the local inference server batches concurrent requests across several models."""
+    from ultralytics.engine.server import HEADER, InferenceClient, InferenceServer
+
+    models = {"n": "yolo11n.yaml", "pconv": "yolo11-pconv.yaml"}
+    # A long max_wait makes every batch wait for max_batch requests, so the 4 requests of a model form one batch
+    with InferenceServer(models, address=("127.0.0.1", 0), max_batch=4, max_wait=60, verbose=False) as server:
+        responses = []
+
+        def request(name):
+            with InferenceClient(server.address) as client:
+                im = np.random.randint(0, 255, (48, 64, 3), dtype=np.uint8)
+                responses.append(client.predict(im, model=name, imgsz=64, conf=0.0, max_det=3))
+
+        threads = [threading.Thread(target=request, args=(name,)) for name in list(models) * 4]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        with InferenceClient(server.address) as client:
+            metrics = client.metrics()
+            with pytest.raises(RuntimeError, match="Unknown model"):
+                client.predict(np.zeros((8, 8, 3), dtype=np.uint8), model="x")
+            client.sock.sendall(HEADER.pack(4, 0) + b"{bad")  # malformed JSON header
+            n, m = HEADER.unpack(client.recv(HEADER.size))
+            assert "JSONDecodeError" in json.loads(client.recv(n))["error"]
+            assert client.metrics() == metrics  # connection still open
+    assert len(responses) == 8 and all(r["shape"] == [48, 64] and len(r["results"]) <= 3 for r in responses)
+    assert all(r["batch"] == 4 for r in responses)
+    assert all(m["requests"] == 4 and m["batches"] == 1 and m["queue_depth"] == 0 for m in metrics.values())
+
+
 def test_predict_txt(tmp_path):
     """Test YOLO predictions with file, directory, and pattern sources listed in a text file."""
     file = tmp_path / "sources_multi_row.txt"
@@ -136,6 +254,55 @@ def test_predict_visualize(model):
     YOLO(WEIGHTS_DIR / model)(SOURCE, imgsz=32, visualize=True)
 
 
+@pytest.mark.parametrize(
+    "backend",
+    [
+        "cv2",
+        pytest.param(
+            "pyav", marks=pytest.mark.skipif(not checks.check_requirements("av", install=False), reason="av missing")
+        ),
+    ],
+)
+def test_video_decoder_backend(tmp_path, backend):
+    """Test video decoding with vid_stride, reduced resolution and grayscale output for each decoder backend."""
+    file = tmp_path / "video.avi"
+    writer = cv2.VideoWriter(str(file), cv2.VideoWriter_fourcc(*"MJPG"), 30, (64, 48))
+    for i in range(20):
+        writer.write(np.full((48, 64, 3), i * 10, dtype=np.uint8))
+    writer.release()
+    for channels in 3, 1:
+        dataset = load_inference_source(str(file), vid_stride=3, channels=channels, vid_backend=backend, vid_scale=0.5)
+        frames = [im for _, ims, _ in dataset for im in ims]
+        assert len(frames) == 6 and frames[0].shape == (24, 32, channels)
+        assert [round(im.mean() / 10) for im in frames] == [2, 5, 8, 11, 14, 17]  # every 3rd frame
+    with pytest.raises(ValueError):
+        load_inference_source(str(file), vid_backend="unknown")
+    with pytest.raises(ValueError):
+        load_inference_source(str(file), vid_backend=backend, vid_scale=0.0)
+    with pytest.raises(ValueError):
+        get_cfg(overrides={"vid_scale": 0.0})
+
+
+def test_load_streams_micro_batch(tmp_path):
+    """Test that stream micro-batches hold ready streams only and keep the source of each frame."""
+    from ultralytics.data.loaders import LoadStreams
+
+    for name, n in ("a.avi", 20), ("b.avi", 5):
+        writer = cv2.VideoWriter(str(tmp_path / name), cv2.VideoWriter_fourcc(*"MJPG"), 30, (64, 48))
+        for _ in range(n):
+            writer.write(np.zeros((48, 64, 3), dtype=np.uint8))
+        writer.release()
+    streams = tmp_path / "list.streams"
+    streams.write_text(f"{tmp_path / 'a.avi'}\n{tmp_path / 'b.avi'}\n{tmp_path / 'a.avi'}")
+    loader = LoadStreams(str(streams), buffer=True, max_batch=2, max_wait=0.01)
+    assert len(set(loader.sources)) == 3  # duplicate sources get unique names
+    seen = set()
+    for paths, images, s in loader:
+        assert 0 < len(paths) == len(images) == len(s) <= 2 and set(paths) <= set(loader.sources)
+        seen.update(paths)
+    assert seen == set(loader.sources)
+
+
 def test_predict_gray_and_4ch(tmp_path):
     """Test YOLO prediction on SOURCE converted to grayscale and 4-channel images with various filenames."""
     im = Image.open(SOURCE)
@@ -194,6 +361,131 @@ def test_track_stream(model, tmp_path):
         model.track(video_url, imgsz=160, tracker=custom_yaml)
 
 
+def test_track_store():
+    """Test that batched Kalman updates through the track store match per-track updates and free removed tracks."""
+    from ultralytics.trackers.basetrack import TrackState, TrackStore
+    from ultralytics.trackers.byte_tracker import STrack
+    from ultralytics.trackers.utils.kalman_filter import KalmanFilterXYAH
+
+    kf, store = KalmanFilterXYAH(), TrackStore(capacity=2)  # forces the store to grow
+    boxes = np.random.default_rng(0).uniform(50, 100, (5, 4))
+    tracks = [STrack(np.r_[b, i], 0.9, 0) for i, b in enumerate(boxes)]
+    reference = [STrack(np.r_[b, i], 0.9, 0) for i, b in enumerate(boxes)]
+    for st, ref in zip(tracks, reference):
+        st.activate(kf, 1, store)
+        ref.activate(kf, 1)
+    dets = [STrack(np.r_[b + 2, i], 0.8, 1) for i, b in enumerate(boxes)]
+
+    for group in tracks, reference:
+        group[0].mark_lost()
+        STrack.multi_predict(group)
+        STrack.multi_gmc(group, np.array([[1, 0, 3], [0, 1, -2]]))
+    STrack.multi_update(tracks, dets, 2)
+    reference[0].re_activate(dets[0], 2)
+    for ref, det in zip(reference[1:], dets[1:]):
+        ref.update(det, 2)
+    for st, ref in zip(tracks, reference):
+        assert np.allclose(st.mean, ref.mean) and np.allclose(st.covariance, ref.covariance)
+        assert st.state == TrackState.Tracked and st.tracklet_len == ref.tracklet_len
+    assert len(store) == 5
+
+    store.collect(tracks[2:])
+    assert len(store) == 3 and tracks[0].slot is None and np.allclose(tracks[0].mean, reference[0].mean)
+
+
+def test_track_reid_cache():
+    """Test that BOTSORT reuses cached embeddings for unambiguous stationary tracks and refreshes them periodically."""
+    from ultralytics.engine.results import Boxes
+    from ultralytics.trackers import BOTSORT
+    from ultralytics.utils import IterableSimpleNamespace
+
+    cfg = {**YAML.load(ROOT / "cfg/trackers/botsort.yaml"), "gmc_method": "none", "reid_refresh": 5}
+    tracker = BOTSORT(IterableSimpleNamespace(**cfg))
+    tracker.args.with_reid, tracker.args.model = True, "reid.pt"
+    calls = []
+    tracker.encoder = lambda img, dets: calls.append(len(dets)) or list(np.random.rand(len(dets), 8).astype(np.float32))
+
+    # Three isolated boxes and two overlapping boxes whose association appearance could change
+    boxes = np.array([[10, 10, 50, 90], [100, 10, 140, 90], [200, 10, 240, 90], [300, 10, 340, 90], [310, 10, 350, 90]])
+    data = np.concatenate([boxes, np.full((5, 1), 0.9), np.zeros((5, 1))], 1).astype(np.float32)
+    img = np.zeros((100, 400, 3), dtype=np.uint8)
+    for _ in range(8):
+        tracks = tracker.update(Boxes(data, img.shape[:2]), img)
+    assert len(tracks) == 5
+    assert calls == [5, 2, 2, 2, 2, 5, 2, 2]
+
+
+def test_track_gated_assignment():
+    """Test that gated linear assignment over connected components finds assignments as good as the dense solve."""
+    from ultralytics.trackers.utils.matching import linear_assignment
+    from ultralytics.utils.benchmarks import benchmark_matching
+
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        cost = np.where(rng.random((40, 50)) < 0.1, rng.random((40, 50)), 1.0)
+        dense, ua, ub = linear_assignment(cost, thresh=0.8, gated=False)
+        gated, ga, gb = linear_assignment(cost, thresh=0.8, gated=True)
+        assert len(dense) == len(gated) and np.isclose(cost[tuple(dense.T)].sum(), cost[tuple(gated.T)].sum())
+        assert np.array_equal(np.sort(ua), np.sort(ga)) and np.array_equal(np.sort(ub), np.sort(gb))
+        assert len(ga) + len(gated) == 40 and len(gb) + len(gated) == 50
+    assert benchmark_matching(track_counts=(10, 200), runs=1)["Match"].all()
+
+
+def test_track_gmc_interval():
+    """Test that frame-skipping GMC accumulates the same camera motion and short-circuits static cameras."""
+    from ultralytics.trackers.utils.gmc import GMC
+
+    rng = np.random.default_rng(0)
+    base = cv2.resize(rng.integers(0, 255, (60, 80, 3), dtype=np.uint8), (800, 600), interpolation=cv2.INTER_CUBIC)
+    frames = [np.roll(base, (-2 * i, 3 * i), axis=(0, 1))[100:500, 100:700].copy() for i in range(7)]
+    for interval in 1, 3:
+        gmc, total = GMC("sparseOptFlow", interval=interval, static_thresh=0.25), np.eye(3)
+        for frame in frames:
+            total = np.vstack([gmc.apply(frame), (0, 0, 1)]) @ total
+        assert np.allclose(total[:2, 2], (18, -12), atol=0.5)
+        assert gmc.stats["estimates"] == len(frames[::interval])
+
+    gmc = GMC("sparseOptFlow", interval=2, static_thresh=0.25)
+    assert all(np.array_equal(gmc.apply(frames[0]), np.eye(2, 3)) for _ in range(4)) and gmc.static
+
+
+def test_track_manager():
+    """Test that TrackerManager tracks streams in parallel like separate trackers and hands streams over."""
+    from ultralytics.engine.results import Boxes
+    from ultralytics.trackers import BYTETracker, TrackerManager
+    from ultralytics.utils import IterableSimpleNamespace
+
+    cfg = IterableSimpleNamespace(**YAML.load(ROOT / "cfg/trackers/bytetrack.yaml"))
+    rng = np.random.default_rng(0)
+    starts = {s: rng.uniform(0, 500, (6, 2)) for s in ("cam0", "cam1", "cam2")}
+    frames = [
+        {
+            s: Boxes(np.c_[xy + 4 * t, xy + 4 * t + 40, np.full(6, 0.9), np.zeros(6)], (640, 640))
+            for s, xy in starts.items()
+        }
+        for t in range(10)
+    ]
+
+    manager, other = TrackerManager(cfg, workers=3), TrackerManager(cfg)
+    single = {s: BYTETracker(cfg) for s in starts}
+    for t, frame in enumerate(frames):
+        if t == 5:  # hand cam2 over to another manager
+            other.restore("cam2", manager.snapshot("cam2"))
+            manager.remove("cam2")
+        streams = list(frame) if t < 5 else ["cam0", "cam1"]
+        tracks = manager.update(streams, [frame[s] for s in streams], [None] * len(streams))
+        if t >= 5:
+            streams, tracks = [*streams, "cam2"], tracks + other.update(["cam2"], [frame["cam2"]], [None])
+        for s, track in zip(streams, tracks):
+            assert np.array_equal(track, single[s].update(frame[s]))
+    assert len(manager) == 2 and "cam2" in other
+    assert sorted(tracks[2][:, 4]) == [1, 2, 3, 4, 5, 6]  # IDs are per stream
+
+    cfg = IterableSimpleNamespace(**{**YAML.load(ROOT / "cfg/trackers/botsort.yaml"), "with_reid": True})
+    bot = TrackerManager(cfg)
+    assert bot.get("cam0").encoder is bot.get("cam1").encoder is bot.encoder  # one ReID encoder for all streams
+
+
 @pytest.mark.parametrize("task,weight,data", TASK_MODEL_DATA)
 def test_val(task: str, weight: str, data: str) -> None:
     """Test the validation mode of the YOLO model."""
@@ -209,6 +501,67 @@ def test_val(task: str, weight: str, data: str) -> None:
         metrics.confusion_matrix.to_json()
 
 
+def test_val_cache(tmp_path):
+    """Test that val_cache reuses post-NMS predictions and filters them for a higher conf like a fresh run."""
+    for d in ("images", "labels"):
+        (tmp_path / d).mkdir()
+    for i in range(4):
+        cv2.imwrite(str(tmp_path / "images" / f"{i}.png"), np.random.randint(0, 255, (48, 64, 3), dtype=np.uint8))
+        (tmp_path / "labels" / f"{i}.txt").write_text(f"0 0.5 0.5 0.{i + 1} 0.3\n")
+    YAML.save(tmp_path / "data.yaml", {"path": str(tmp_path), "train": "images", "val": "images", "names": {0: "a"}})
+
+    model = YOLO("yolo11n.yaml")
+    args = dict(data=str(tmp_path / "data.yaml"), imgsz=64, batch=2, plots=False, project=tmp_path)
+    cache = tmp_path / "cache"
+    for conf in 0.001, 0.001, 0.01:
+        cached = model.val(val_cache=cache, conf=conf, **args)
+        assert cached.box.all_ap.tolist() == model.val(conf=conf, **args).box.all_ap.tolist()
+    assert len(list(cache.glob("*.pt"))) == 1
+
+
+def test_val_metric_bins():
+    """Test that binned constant-memory metrics closely match exact per-prediction metrics."""
+    from ultralytics.utils.metrics import SegmentMetrics
+
+    names = {i: str(i) for i in range(5)}
+    exact, binned = SegmentMetrics(names), SegmentMetrics(names)
+    binned.bins = 1000
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        n = rng.integers(0, 30)
+        conf, pred_cls = rng.random(n), rng.integers(0, 5, n).astype(float)
+        tp = rng.random((n, 1)) < conf[:, None] * np.linspace(1, 0.3, 10)
+        target_cls = np.concatenate([pred_cls[tp[:, 0]], rng.integers(0, 5, rng.integers(0, 3)).astype(float)])
+        stat = dict(tp=tp, tp_m=tp[:, ::-1], conf=conf, pred_cls=pred_cls)
+        exact.update_stats({**stat, "target_cls": target_cls, "target_img": np.unique(target_cls)})
+        binned.update_stats({**stat, "target_cls": target_cls, "target_img": np.unique(target_cls)})
+    exact.process()
+    binned.process()
+    assert binned.hist["n_pred"].shape == (5, 1000)
+    assert (exact.nt_per_class == binned.nt_per_class).all() and (exact.nt_per_image == binned.nt_per_image).all()
+    for m in "box", "seg":
+        assert abs(getattr(exact, m).map - getattr(binned, m).map) < 1e-3
+        assert np.allclose(getattr(exact, m).all_ap, getattr(binned, m).all_ap, atol=1e-2)
+
+
+def test_train_async_val(tmp_path):
+    """Test that async_val logs every validated epoch one epoch late, leaves skipped epochs blank and saves best.pt."""
+    for d in ("images", "labels"):
+        (tmp_path / d).mkdir()
+    for i in range(4):
+        cv2.imwrite(str(tmp_path / "images" / f"{i}.png"), np.random.randint(0, 255, (48, 64, 3), dtype=np.uint8))
+        (tmp_path / "labels" / f"{i}.txt").write_text(f"0 0.5 0.5 0.{i + 1} 0.3\n")
+    YAML.save(tmp_path / "data.yaml", {"path": str(tmp_path), "train": "images", "val": "images", "names": {0: "a"}})
+
+    model = YOLO("yolo11n.yaml")
+    args = dict(data=str(tmp_path / "data.yaml"), imgsz=64, batch=2, workers=0, plots=False, project=tmp_path)
+    model.train(epochs=4, async_val=True, val_period=2, **args)
+    rows = list(csv.DictReader(model.trainer.csv.open()))
+    assert [int(float(r["epoch"])) for r in rows] == [1, 2, 3, 4]
+    assert [r["metrics/mAP50(B)"] != "" for r in rows] == [False, True, False, True]  # val_period=2
+    assert model.trainer.best.exists() and model.trainer.val_job is None
+
+
 @pytest.mark.skipif(IS_JETSON or IS_RASPBERRYPI, reason="Edge devices not intended for training")
 def test_train_scratch():
     """Test training the YOLO model from scratch using the provided configuration."""
@@ -453,6 +806,101 @@ def test_utils_benchmarks():
     ProfileModels(["yolo11n.yaml"], imgsz=32, min_time=1, num_timed_runs=3, num_warmup_runs=1).run()
 
 
+def test_utils_benchmarks_blocks(tmp_path):
+    """Profile individual model blocks with 'ProfileBlocks' and check regressions against the saved baseline."""
+    from ultralytics.utils.benchmarks import ProfileBlocks
+
+    kwargs = dict(blocks="C3_PConv,SPPF", imgsz=64, num_timed_runs=3, num_warmup_runs=1, save_dir=tmp_path)
+    results = ProfileBlocks(["yolo11-pconv.yaml"], **kwargs).run()
+    assert {r["block"] for r in results} == {"C3_PConv", "SPPF"}
+    assert (tmp_path / "blocks.csv").is_file()
+
+    # Any positive latency is a regression against a zero-latency baseline
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps([{**r, "latency_ms": 0.0} for r in results]))
+    assert all(r["regression"] for r in ProfileBlocks(["yolo11-pconv.yaml"], baseline=baseline, **kwargs).run())
+    cfg = get_cfg(
+        overrides={"mode": "benchmark", "blocks": "SPPF", "blocks_baseline": str(baseline), "blocks_tolerance": 1}
+    )
+    assert cfg.blocks_baseline == str(baseline) and cfg.blocks_tolerance == 1  # CLI-usable regression thresholds
+
+
+def test_utils_nms_batched():
+    """Test that batched NMS keeps the same detections as the per-image loop and benchmark both paths."""
+    from ultralytics.utils.benchmarks import benchmark_nms
+    from ultralytics.utils.nms import TorchNMS, non_max_suppression
+
+    torch.manual_seed(0)
+    pred = torch.cat((torch.rand(4, 2, 500) * 320, torch.rand(4, 2, 500) * 60 + 2, torch.rand(4, 8, 500) ** 8), 1)
+    for kwargs in ({}, {"multi_label": True}, {"agnostic": True, "max_det": 20}, {"classes": [1, 2]}):
+        a, ia = non_max_suppression(pred.clone(), 0.25, 0.5, batched=False, return_idxs=True, **kwargs)
+        b, ib = non_max_suppression(pred.clone(), 0.25, 0.5, batched=True, return_idxs=True, **kwargs)
+        for x, y, xi, yi in zip(a, b, ia, ib):
+            assert torch.equal(x[x[:, 4].argsort()], y[y[:, 4].argsort()])
+            assert set(xi.tolist()) == set(yi.tolist())
+
+    boxes = torch.tensor([[0, 0, 10, 10], [1, 1, 10, 10], [0, 0, 10, 10], [20, 20, 30, 30]]).float()
+    keep = TorchNMS.padded_nms(boxes, torch.tensor([0, 0, 1, 1]), torch.tensor([0, 1, 0, 1]), 0.5)
+    assert keep.tolist() == [0, 2, 3]
+    assert benchmark_nms(batch_sizes=(1, 4), anchors=1000, runs=1)["Match"].all()
+
+
+@pytest.mark.parametrize("rotated", [False, True])
+def test_utils_nms_modes(rotated):
+    """Test that top-k and tiled NMS candidate strategies return exactly the default NMS detections."""
+    from ultralytics.utils.nms import non_max_suppression
+
+    torch.manual_seed(0)
+    pred = torch.cat((torch.rand(2, 2, 600) * 200, torch.rand(2, 2, 600) * 40 + 2, torch.rand(2, 3, 600)), 1)
+    if rotated:
+        pred = torch.cat((pred, torch.rand(2, 1, 600)), 1)
+    for kwargs in ({}, {"max_det": 10}, {"agnostic": True, "multi_label": True}):
+        ref = non_max_suppression(pred.clone(), 0.01, 0.5, nc=3, rotated=rotated, batched=False, **kwargs)
+        for mode in ("topk", "tiled"):
+            out = non_max_suppression(pred.clone(), 0.01, 0.5, nc=3, rotated=rotated, nms_mode=mode, **kwargs)
+            assert all(torch.equal(a, b) for a, b in zip(ref, out))
+
+
+def test_utils_ap_per_class():
+    """Test that vectorized ap_per_class returns exactly the per-class loop outputs and benchmark both paths."""
+    from ultralytics.utils.benchmarks import benchmark_ap_per_class
+    from ultralytics.utils.metrics import ap_per_class
+
+    rng = np.random.default_rng(0)
+    conf, pred_cls = rng.random(3000).round(2), rng.integers(0, 12, 3000).astype(float)  # rounded for tied scores
+    tp = rng.random((3000, 1)) < conf[:, None] * np.linspace(0.9, 0.2, 10)
+    target_cls = np.concatenate(
+        [pred_cls[tp[:, 0]], rng.integers(0, 10, 100).astype(float)]
+    )  # classes 10, 11 unlabeled
+    for n_pred in None, tp.sum(1) + rng.integers(1, 3, 3000):  # per-detection and binned rows
+        a = ap_per_class(tp, conf, pred_cls, target_cls, n_pred=n_pred, vectorized=False)
+        b = ap_per_class(tp, conf, pred_cls, target_cls, n_pred=n_pred)
+        assert all(np.array_equal(x, y) for x, y in zip(a, b))
+    assert benchmark_ap_per_class(class_counts=(1, 80), detections=5000, runs=1)["Match"].all()
+
+
+def test_utils_match_predictions():
+    """Test that batched prediction matching equals per-image matching and keeps greedy match semantics."""
+    from ultralytics.models.yolo.detect import DetectionValidator
+
+    validator = DetectionValidator()
+    validator.iouv = torch.linspace(0.5, 0.95, 10)
+    # label 0 matches prediction 0 (first), prediction 1 then takes no label, prediction 2 has the wrong class
+    iou = torch.tensor([[0.6, 0.9, 0.0], [0.0, 0.0, 0.8]])
+    tp = validator.match_predictions(torch.tensor([0.0, 0.0, 1.0]), torch.tensor([0.0, 0.0]), iou)
+    assert tp.sum(1).tolist() == [3, 6, 0]  # prediction 1 is correct above 0.6 IoU only
+    iou = torch.tensor([[0.7, 0.0], [0.7, 0.9]])  # prediction 0 ties both labels and takes the lowest index
+    tp = validator.match_predictions(torch.tensor([0.0, 0.0]), torch.tensor([0.0, 0.0]), iou)
+    assert tp.sum(1).tolist() == [5, 9]
+    preds, batches = [], []
+    for n, m in (5, 3), (0, 2), (40, 0), (30, 12):
+        xy, gt_xy = torch.rand(n, 2) * 50, torch.rand(m, 2) * 50
+        preds.append({"bboxes": torch.cat([xy, xy + 20], 1), "cls": torch.randint(0, 3, (n,)).float()})
+        batches.append({"bboxes": torch.cat([gt_xy, gt_xy + 20], 1), "cls": torch.randint(0, 3, (m,)).float()})
+    for tp, pred, batch in zip(validator._process_batches(preds, batches), preds, batches):
+        assert np.array_equal(tp["tp"], validator._process_batch(pred, batch)["tp"])
+
+
 def test_utils_torchutils():
     """Test Torch utility functions including profiling and FLOP calculations."""
     from ultralytics.nn.modules.conv import Conv
@@ -559,6 +1007,39 @@ def test_nn_modules_block():
     BottleneckCSP(c1, c2)(x)
 
 
+def test_pconv_fuse_parity():
+    """Test that fusing a PConv model into the in-place deploy path matches the training graph outputs."""
+    from ultralytics.nn.modules import PConv
+    from ultralytics.nn.tasks import DetectionModel
+
+    model = DetectionModel("yolo11-pconv.yaml", verbose=False).eval()
+    x = torch.rand(2, 3, 64, 64)
+    with torch.no_grad():
+        y = model(x)[0]
+        model.fuse(verbose=False)
+        assert all(m.forward == m.forward_fuse for m in model.modules() if isinstance(m, PConv))
+        y_fused = model(x)[0]
+    assert torch.allclose(y, y_fused, atol=1e-4)
+
+    # Autograd falls back to split/cat so the input is not modified in place
+    m, x = PConv(8), torch.rand(1, 8, 8, 8, requires_grad=True)
+    m.forward_fuse(x).sum().backward()
+    assert x.grad is not None
+
+
+def test_autobackend_channels_last():
+    """Test that AutoBackend channels-last (NHWC) inference matches the default NCHW memory format."""
+    from ultralytics.nn.autobackend import AutoBackend
+    from ultralytics.nn.tasks import DetectionModel
+
+    model = DetectionModel("yolo11-pconv.yaml", verbose=False).eval()
+    x = torch.rand(2, 3, 64, 64)
+    y = AutoBackend(model, verbose=False)(x)[0]
+    backend = AutoBackend(model, verbose=False, channels_last=True)
+    assert backend.model.model[0].conv.weight.is_contiguous(memory_format=torch.channels_last)
+    assert torch.allclose(y, backend(x)[0], atol=1e-4)
+
+
 @pytest.mark.skipif(not ONLINE, reason="environment is offline")
 def test_hub():
     """Test Ultralytics HUB functionalities."""
@@ -576,6 +1057,39 @@ def image():
     return cv2.imread(str(SOURCE))
 
 
+@pytest.mark.parametrize("perspective", [0.0, 0.0005])
+def test_batch_augment(perspective):
+    """Test that BatchAugment warps images and boxes like the per-sample cv2 RandomPerspective path."""
+    from ultralytics.data.augment import BatchAugment, RandomPerspective
+    from ultralytics.utils.instance import Instances
+    from ultralytics.utils.ops import xyxy2xywh
+
+    s = 64
+    img = cv2.GaussianBlur(np.random.randint(0, 255, (2 * s, 2 * s, 3), dtype=np.uint8), (7, 7), 3)  # mosaic canvas
+    boxes = np.array([[20, 30, 60, 80], [70, 70, 120, 100], [0, 0, 10, 10]], dtype=np.float32)
+    affine = RandomPerspective(degrees=10, translate=0.1, scale=0.5, shear=5, perspective=perspective)
+    affine.size = (s, s)  # output size, normally set in __call__ from the mosaic border
+    warped, M, scale = affine.affine_transform(img, (-s // 2, -s // 2))
+    affine.affine_transform = lambda *args: (warped, M, scale)  # replay the sampled matrix in __call__
+    labels = {
+        "img": img.copy(),
+        "cls": np.arange(3, dtype=np.float32)[:, None],
+        "instances": Instances(boxes.copy(), np.zeros((0, 1000, 2), np.float32), bbox_format="xyxy", normalized=False),
+        "mosaic_border": (-s // 2, -s // 2),
+    }
+    labels = affine(labels)
+
+    augment = BatchAugment(perspective=perspective)
+    M, scale = torch.from_numpy(M)[None], torch.tensor([scale])
+    im = augment.warp(torch.from_numpy(img).permute(2, 0, 1)[None].float() / 255, M, s)[0].permute(1, 2, 0) * 255
+    assert (im - torch.from_numpy(labels["img"]).float()).abs().max() <= 1.0  # uint8 rounding
+    bboxes = torch.from_numpy(xyxy2xywh(boxes) / (2 * s))
+    bboxes, keep = augment.apply_bboxes(bboxes, torch.zeros(3), M, scale, (2 * s, 2 * s), s)
+    labels["instances"].convert_bbox("xywh")
+    assert keep.nonzero().flatten().tolist() == labels["cls"].flatten().tolist()
+    assert np.allclose(bboxes[keep].numpy() * s, labels["instances"].bboxes, atol=1e-3)
+
+
 @pytest.mark.parametrize(
     "auto_augment, erasing, force_color_jitter",
     [
@@ -732,6 +1246,91 @@ def test_yoloe():
     model.val(data="coco128-seg.yaml", imgsz=32)
 
 
+def test_dataset_cache_shm(tmp_path):
+    """Test that cache='shm' serves read-only zero-copy views identical to cache='ram' and survives pickling."""
+    import gc
+    import pickle
+
+    from ultralytics.data.dataset import YOLODataset
+
+    for d in ("images", "labels"):
+        (tmp_path / d).mkdir()
+    for i, (h, w) in enumerate([(48, 64), (64, 40), (30, 30)]):
+        cv2.imwrite(str(tmp_path / "images" / f"{i}.png"), np.random.randint(0, 255, (h, w, 3), dtype=np.uint8))
+        (tmp_path / "labels" / f"{i}.txt").write_text("0 0.5 0.5 0.2 0.2\n")
+
+    kwargs = dict(img_path=str(tmp_path / "images"), imgsz=32, augment=False, data={"names": {0: "a"}, "channels": 3})
+    ram, shm = YOLODataset(cache="ram", **kwargs), YOLODataset(cache="shm", **kwargs)
+    assert shm.arena is not None and all(im is None for im in shm.ims)
+    for worker in (shm, pickle.loads(pickle.dumps(shm))):  # pickled as by spawned DataLoader workers
+        for i in range(shm.ni):
+            (a, _, hw), (b, *_) = worker.load_image(i), ram.load_image(i)
+            assert np.array_equal(a, b) and not a.flags.writeable and hw == a.shape[:2]
+            assert np.shares_memory(a, worker.arena._mmap)
+
+    path, other = shm.arena.path, YOLODataset(cache="shm", **kwargs)  # attaches to the arena of the first dataset
+    del shm, worker
+    gc.collect()
+    assert path.exists() and np.array_equal(other.load_image(0)[0], ram.load_image(0)[0])
+    del other
+    gc.collect()
+    assert not path.exists()  # removed with the last dataset using it
+
+
+def test_dataset_pack(tmp_path):
+    """Test that cache='pack' reads images and labels from a single-file pack identical to the source files."""
+    import pickle
+
+    from ultralytics.data.dataset import YOLODataset
+    from ultralytics.data.utils import pack_dataset
+
+    for d in ("images", "labels"):
+        (tmp_path / d).mkdir()
+    for i, (h, w) in enumerate([(48, 64), (64, 40), (30, 30)]):
+        cv2.imwrite(str(tmp_path / "images" / f"{i}.png"), np.random.randint(0, 255, (h, w, 3), dtype=np.uint8))
+        (tmp_path / "labels" / f"{i}.txt").write_text(f"0 0.5 0.5 0.{i + 1} 0.2\n")
+    YAML.save(tmp_path / "data.yaml", {"path": str(tmp_path), "train": "images", "val": "images", "names": {0: "a"}})
+    assert pack_dataset(str(tmp_path / "data.yaml"), imgsz=32) == [tmp_path / "images.pack"]
+
+    kwargs = dict(img_path=str(tmp_path / "images"), imgsz=32, augment=False, data={"names": {0: "a"}, "channels": 3})
+    files, packed = YOLODataset(**kwargs), YOLODataset(cache="pack", **kwargs)
+    assert packed.pack is not None and packed.im_files == files.im_files
+    for dataset in (packed, pickle.loads(pickle.dumps(packed))):  # pickled as by spawned DataLoader workers
+        for i in range(files.ni):
+            (a, *hw), (b, *hw_ref) = dataset.load_image(i), files.load_image(i)
+            assert np.array_equal(a, b) and hw == hw_ref
+            assert np.array_equal(dataset.labels[i]["bboxes"], files.labels[i]["bboxes"])
+
+
+def test_dataset_label_cache_incremental(tmp_path):
+    """Test that the label cache only verifies and appends new or changed image-label pairs."""
+    from ultralytics.data.dataset import YOLODataset
+    from ultralytics.data.utils import LabelCache
+
+    def write(i, label="0 0.5 0.5 0.2 0.2"):
+        cv2.imwrite(str(tmp_path / "images" / f"{i}.png"), np.random.randint(0, 255, (40, 50, 3), dtype=np.uint8))
+        (tmp_path / "labels" / f"{i}.txt").write_text(f"{label}\n")
+
+    for d in ("images", "labels"):
+        (tmp_path / d).mkdir()
+    for i in range(3):
+        write(i)
+    kwargs = dict(img_path=str(tmp_path / "images"), imgsz=32, augment=False, data={"names": {0: "a"}, "channels": 3})
+    cache = LabelCache(tmp_path / "labels.cache", key=(False, 1, 0, 0, False))
+    assert YOLODataset(**kwargs).ni == 3 and len(cache.load()) == 3 and cache.chunks == 1
+    write(3)
+    (tmp_path / "labels" / "0.txt").write_text("0 0.5 0.5 0.2 0.2\n0 0.1 0.1 0.1 0.1\n")
+    dataset = YOLODataset(**kwargs)
+    assert dataset.ni == 4 and len(dataset.labels[0]["bboxes"]) == 2
+    assert len(cache.load()) == 4 and cache.chunks == 2  # only the new and changed files were appended
+    assert YOLODataset(**kwargs).ni == 4 and cache.load() and cache.chunks == 2
+    (tmp_path / "images" / "1.png").unlink()
+    for n in range(2, 7):  # superseded records of a repeatedly changed label dominate, compacting the cache
+        (tmp_path / "labels" / "2.txt").write_text("0 0.5 0.5 0.2 0.2\n" * n)
+        assert YOLODataset(**kwargs).ni == 3
+    assert len(cache.load()) == 3 and cache.chunks < 7 and "1.png" not in {Path(f).name for f in cache.entries}
+
+
 def test_yolov10():
     """Test YOLOv10 model training, validation, and prediction functionality."""
     model = YOLO("yolov10n.yaml")
@@ -140,6 +140,7 @@ CLI_HELP_MSG = f"""
         yolo copy-cfg
         yolo cfg
         yolo solutions help
+        yolo data pack data=coco8.yaml imgsz=640
 
     Docs: https://docs.ultralytics.com
     Solutions: https://docs.ultralytics.com/solutions/
@@ -159,11 +160,14 @@ CFG_FLOAT_KEYS = frozenset(
         "time",
         "workspace",
         "batch",
+        "stream_wait",
+        "blocks_tolerance",
     }
 )
 CFG_FRACTION_KEYS = frozenset(
     {  # fractional float arguments with 0.0<=values<=1.0
         "dropout",
+        "vid_scale",
         "lr0",
         "lrf",
         "momentum",
@@ -198,9 +202,12 @@ CFG_INT_KEYS = frozenset(
         "mask_ratio",
         "max_det",
         "vid_stride",
+        "stream_batch",
+        "metric_bins",
         "line_width",
         "nbs",
         "save_period",
+        "val_period",
     }
 )
 CFG_BOOL_KEYS = frozenset(
@@ -216,6 +223,7 @@ CFG_BOOL_KEYS = frozenset(
         "val",
         "save_json",
         "half",
+        "channels_last",
         "dnn",
         "plots",
         "show",
@@ -237,6 +245,8 @@ CFG_BOOL_KEYS = frozenset(
         "simplify",
         "nms",
         "profile",
+        "profile_layers",
+        "pipeline",
         "multi_scale",
     }
 )
@@ -350,7 +360,7 @@ def check_cfg(cfg: dict, hard: bool = True) -> None:
     Notes:
         - The function modifies the input dictionary in-place.
         - None values are ignored as they may be from optional arguments.
-        - Fraction keys are checked to be within the range [0.0, 1.0].
+        - Fraction keys are checked to be within the range [0.0, 1.0], and 'vid_scale' to be above 0.0.
     """
     for k, v in cfg.items():
         if v is not None:  # None values may be from optional args
@@ -371,6 +381,8 @@ def check_cfg(cfg: dict, hard: bool = True) -> None:
                     cfg[k] = v = float(v)
                 if not (0.0 <= v <= 1.0):
                     raise ValueError(f"'{k}={v}' is an invalid value. Valid '{k}' values are between 0.0 and 1.0.")
+                if k == "vid_scale" and v == 0.0:  # frames can not be resized to 0x0
+                    raise ValueError(f"'{k}={v}' is an invalid value. Valid '{k}' values are > 0.0 and <= 1.0.")
             elif k in CFG_INT_KEYS and not isinstance(v, int):
                 if hard:
                     raise TypeError(
@@ -635,6 +647,36 @@ def handle_yolo_settings(args: list[str]) -> None:
         LOGGER.warning(f"settings error: '{e}'. Please see {url} for help.")
 
 
+def handle_yolo_data(args: list[str]) -> None:
+    """Handle YOLO dataset command-line interface (CLI) commands.
+
+    The 'pack' command builds a single-file memory-mapped dataset pack for every split of a dataset, holding decoded
+    images downscaled to at most 'imgsz' and their verified labels. Train and validate with cache='pack' to read images
+    and labels from the pack instead of the per-image files.
+
+    Args:
+        args (list[str]): A list of command line arguments, the command followed by 'arg=value' pairs for 'data', 'task'
+            and 'imgsz'.
+
+    Examples:
+        >>> handle_yolo_data(["pack", "data=coco8.yaml", "imgsz=640"])
+        >>> handle_yolo_data(["pack", "data=imagenet10", "task=classify", "imgsz=224"])
+    """
+    from ultralytics.data.utils import pack_dataset
+
+    if not args or args[0] != "pack":
+        raise SyntaxError(f"Invalid 'yolo data' command {args}, i.e. try 'yolo data pack data=coco8.yaml'")
+    overrides = dict(parse_key_value_pair(a) for a in merge_equals_args(args[1:]))
+    check_dict_alignment({k: DEFAULT_CFG_DICT[k] for k in ("data", "task", "imgsz")}, overrides)
+    data = overrides.get("data") or DEFAULT_CFG.data
+    if not data:
+        raise ValueError("'yolo data pack' requires a dataset, i.e. 'yolo data pack data=coco8.yaml'")
+    task = overrides.get("task") or ("detect" if str(data).endswith((".yaml", ".yml")) else "classify")
+    imgsz = overrides.get("imgsz", DEFAULT_CFG.imgsz)
+    for f in pack_dataset(data, task=task, imgsz=imgsz):
+        LOGGER.info(f"Packed {f}, train with cache='pack'")
+
+
 def handle_yolo_solutions(args: list[str]) -> None:
     """Process YOLO solutions arguments and run the specified computer vision solutions pipeline.
 
@@ -860,6 +902,7 @@ def entrypoint(debug: str = "") -> None:
         "logout": lambda: handle_yolo_hub(args),
         "copy-cfg": copy_default_cfg,
         "solutions": lambda: handle_yolo_solutions(args[1:]),
+        "data": lambda: handle_yolo_data(args[1:]),
         "help": lambda: LOGGER.info(CLI_HELP_MSG),  # help below hub for -h flag precedence
     }
     full_args_dict = {**DEFAULT_CFG_DICT, **{k: None for k in TASKS}, **{k: None for k in MODES}, **special}
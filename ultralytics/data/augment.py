@@ -18,7 +18,7 @@ from ultralytics.utils import LOGGER, IterableSimpleNamespace, colorstr
 from ultralytics.utils.checks import check_version
 from ultralytics.utils.instance import Instances
 from ultralytics.utils.metrics import bbox_ioa
-from ultralytics.utils.ops import segment2box, xywh2xyxy, xyxyxyxy2xywhr
+from ultralytics.utils.ops import segment2box, xywh2xyxy, xyxy2xywh, xyxyxyxy2xywhr
 from ultralytics.utils.torch_utils import TORCHVISION_0_10, TORCHVISION_0_11, TORCHVISION_0_13
 
 DEFAULT_MEAN = (0.0, 0.0, 0.0)
@@ -502,7 +502,7 @@ class Mosaic(BaseMixTransform):
         self.imgsz = imgsz
         self.border = (-imgsz // 2, -imgsz // 2)  # width, height
         self.n = n
-        self.buffer_enabled = self.dataset.cache != "ram"
+        self.buffer_enabled = self.dataset.cache not in {"ram", "shm", "pack"}
 
     def get_indexes(self):
         """Return a list of random indexes from the dataset for mosaic augmentation.
@@ -1506,6 +1506,268 @@ class RandomFlip:
         return labels
 
 
+class CanvasPad:
+    """Place training images on a fixed-size square canvas for batched augmentation.
+
+    With augment_device='batch', RandomPerspective runs batched in the trainer rather than per sample, so every sample
+    must share one shape. Mosaic images already fill the canvas, other images are letterboxed by `pre_transform` and
+    padded around the center. RandomPerspective warps about the image center and fills borders with the same value, so
+    padding leaves the warped result unchanged.
+
+    Attributes:
+        size (int): Canvas size, 2 * imgsz while mosaic is enabled, otherwise imgsz.
+        pre_transform (Callable | None): Transform applied to non-mosaic images before padding, i.e. LetterBox.
+
+    Methods:
+        __call__: Pad an image onto the canvas and shift its instances accordingly.
+
+    Examples:
+        >>> pad = CanvasPad(size=1280, pre_transform=LetterBox(new_shape=(640, 640)))
+        >>> labels = pad({"img": np.zeros((640, 640, 3), np.uint8), "cls": np.zeros((0, 1)), "instances": instances})
+        >>> assert labels["img"].shape[:2] == (1280, 1280)
+    """
+
+    def __init__(self, size: int, pre_transform=None) -> None:
+        """Initialize CanvasPad with the canvas size and an optional pre-transform for non-mosaic images.
+
+        Args:
+            size (int): Canvas size in pixels.
+            pre_transform (Callable | None): Transform applied to images without a mosaic border before padding.
+        """
+        self.size = size
+        self.pre_transform = pre_transform
+
+    def __call__(self, labels: dict[str, Any]) -> dict[str, Any]:
+        """Pad the image in `labels` onto the centered canvas and shift its instances by the padding.
+
+        Args:
+            labels (dict[str, Any]): Dictionary containing 'img', 'cls' and 'instances'.
+
+        Returns:
+            (dict[str, Any]): Labels with the padded image and shifted instances.
+        """
+        if self.pre_transform and "mosaic_border" not in labels:
+            labels = self.pre_transform(labels)
+        labels.pop("mosaic_border", None)
+        labels.pop("ratio_pad", None)  # do not need ratio pad
+        img = labels["img"]
+        h, w = img.shape[:2]
+        if (h, w) != (self.size, self.size):
+            top, left = (self.size - h) // 2, (self.size - w) // 2
+            canvas = np.full((self.size, self.size, img.shape[2]), 114, dtype=img.dtype)
+            canvas[top : top + h, left : left + w] = img
+            instances = labels["instances"]
+            instances.convert_bbox(format="xyxy")
+            instances.denormalize(w, h)
+            instances.add_padding(left, top)
+            labels["img"] = canvas
+        labels["resized_shape"] = labels["img"].shape[:2]
+        return labels
+
+
+class BatchAugment:
+    """Apply RandomPerspective, RandomHSV and RandomFlip augmentations to collated batches as tensor operations.
+
+    Used with augment_device='batch', where DataLoader workers only decode, mosaic and letterbox images onto a shared
+    canvas (see CanvasPad). Affine warps, HSV gains and flips then run batched on the training device. Boxes are
+    transformed, clipped and filtered alongside with the same candidate rules as the per-sample cv2 path, so label
+    semantics match RandomPerspective, RandomHSV and RandomFlip up to interpolation rounding.
+
+    Attributes:
+        degrees (float): Degree range for random rotations.
+        translate (float): Fraction of the output size for random translation.
+        scale (float): Scaling factor interval.
+        shear (float): Shear intensity in degrees.
+        perspective (float): Perspective distortion factor.
+        hgain (float): Maximum variation for hue.
+        sgain (float): Maximum variation for saturation.
+        vgain (float): Maximum variation for value.
+        flipud (float): Vertical flip probability.
+        fliplr (float): Horizontal flip probability.
+
+    Methods:
+        __call__: Augment a collated detection batch.
+        affine_matrices: Sample random 3x3 affine matrices like RandomPerspective.affine_transform.
+        warp: Warp a batch of images with per-image 3x3 matrices.
+        apply_bboxes: Transform, clip and filter boxes with per-image matrices.
+        hsv: Apply per-image HSV gains to a batch of RGB images.
+
+    Examples:
+        >>> augment = BatchAugment(degrees=10.0, translate=0.1, scale=0.5)
+        >>> batch = augment(batch, size=640)  # batch["img"] is a (B, 3, 1280, 1280) float tensor in [0, 1]
+    """
+
+    def __init__(
+        self,
+        degrees: float = 0.0,
+        translate: float = 0.1,
+        scale: float = 0.5,
+        shear: float = 0.0,
+        perspective: float = 0.0,
+        hgain: float = 0.5,
+        sgain: float = 0.5,
+        vgain: float = 0.5,
+        flipud: float = 0.0,
+        fliplr: float = 0.5,
+    ) -> None:
+        """Initialize BatchAugment with RandomPerspective, RandomHSV and RandomFlip parameters.
+
+        Args:
+            degrees (float): Degree range for random rotations.
+            translate (float): Fraction of the output size for random translation.
+            scale (float): Scaling factor interval, e.g. 0.5 allows a resize between 50%-150%.
+            shear (float): Shear intensity in degrees.
+            perspective (float): Perspective distortion factor.
+            hgain (float): Maximum variation for hue.
+            sgain (float): Maximum variation for saturation.
+            vgain (float): Maximum variation for value.
+            flipud (float): Vertical flip probability.
+            fliplr (float): Horizontal flip probability.
+        """
+        self.degrees = degrees
+        self.translate = translate
+        self.scale = scale
+        self.shear = shear
+        self.perspective = perspective
+        self.hgain = hgain
+        self.sgain = sgain
+        self.vgain = vgain
+        self.flipud = flipud
+        self.fliplr = fliplr
+
+    def affine_matrices(
+        self, n: int, shape: tuple[int, int], size: int, device=None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Sample `n` random affine matrices mapping a `shape` (h, w) canvas to a `size` output, like RandomPerspective.
+
+        Returns:
+            M (torch.Tensor): Transformation matrices with shape (n, 3, 3).
+            s (torch.Tensor): Scale factor of each matrix with shape (n,).
+        """
+
+        def uniform(a: float) -> torch.Tensor:
+            return (torch.rand(n, device=device) * 2 - 1) * a
+
+        eye = torch.eye(3, device=device).repeat(n, 1, 1)
+        C, P, R, S, T = eye.clone(), eye.clone(), eye.clone(), eye.clone(), eye.clone()
+        C[:, 0, 2], C[:, 1, 2] = -shape[1] / 2, -shape[0] / 2  # center
+        P[:, 2, 0], P[:, 2, 1] = uniform(self.perspective), uniform(self.perspective)  # perspective
+        a, s = uniform(self.degrees) * math.pi / 180, 1 + uniform(self.scale)  # rotation and scale
+        R[:, 0, 0], R[:, 0, 1], R[:, 1, 0], R[:, 1, 1] = s * a.cos(), s * a.sin(), -s * a.sin(), s * a.cos()
+        S[:, 0, 1] = torch.tan(uniform(self.shear) * math.pi / 180)  # x shear
+        S[:, 1, 0] = torch.tan(uniform(self.shear) * math.pi / 180)  # y shear
+        T[:, 0, 2], T[:, 1, 2] = (0.5 + uniform(self.translate)) * size, (0.5 + uniform(self.translate)) * size
+        return T @ S @ R @ P @ C, s  # order of operations (right to left) is IMPORTANT
+
+    @staticmethod
+    def warp(img: torch.Tensor, M: torch.Tensor, size: int, border: float = 114 / 255) -> torch.Tensor:
+        """Warp (B, C, H, W) images with (B, 3, 3) matrices to (B, C, size, size), matching cv2.warpPerspective.
+
+        Args:
+            img (torch.Tensor): Float images in [0, 1].
+            M (torch.Tensor): Forward transformation matrices from input to output pixel coordinates.
+            size (int): Output image size.
+            border (float): Fill value for pixels mapped from outside the input image.
+
+        Returns:
+            (torch.Tensor): Warped images.
+        """
+        h, w = img.shape[2:]
+        y, x = torch.meshgrid(
+            torch.arange(size, device=img.device), torch.arange(size, device=img.device), indexing="ij"
+        )
+        xy1 = torch.stack((x.flatten(), y.flatten(), torch.ones_like(x.flatten())), 0).to(M.dtype)  # 3, size*size
+        src = torch.linalg.inv(M) @ xy1  # output to input pixel coordinates
+        src = src[:, :2] / src[:, 2:3]
+        scale = torch.tensor([2 / w, 2 / h], device=img.device, dtype=src.dtype)
+        grid = ((src.transpose(1, 2) + 0.5) * scale - 1).view(-1, size, size, 2)  # pixel centers to [-1, 1]
+        # Sample with zero padding around the border value to reproduce cv2 BORDER_CONSTANT interpolation at edges
+        out = F.grid_sample(
+            img - border, grid.to(img.dtype), mode="bilinear", padding_mode="zeros", align_corners=False
+        )
+        return out + border
+
+    def apply_bboxes(
+        self, bboxes: torch.Tensor, idx: torch.Tensor, M: torch.Tensor, s: torch.Tensor, shape: tuple, size: int
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Transform normalized xywh boxes on a `shape` (h, w) canvas to normalized xywh boxes on the `size` output.
+
+        Args:
+            bboxes (torch.Tensor): Normalized xywh boxes with shape (N, 4).
+            idx (torch.Tensor): Batch index of each box with shape (N,).
+            M (torch.Tensor): Per-image transformation matrices with shape (B, 3, 3).
+            s (torch.Tensor): Per-image scale factors with shape (B,).
+            shape (tuple): Input canvas (h, w).
+            size (int): Output image size.
+
+        Returns:
+            bboxes (torch.Tensor): Transformed normalized xywh boxes with shape (N, 4).
+            keep (torch.Tensor): Boolean mask of boxes passing RandomPerspective.box_candidates with shape (N,).
+        """
+        if not len(bboxes):
+            return bboxes, torch.zeros(0, dtype=torch.bool, device=bboxes.device)
+        h, w = shape
+        box = xywh2xyxy(bboxes) * bboxes.new_tensor([w, h, w, h])
+        xy = box[:, [0, 1, 2, 3, 0, 3, 2, 1]].view(-1, 4, 2)  # x1y1, x2y2, x1y2, x2y1
+        xy = torch.cat((xy, torch.ones_like(xy[..., :1])), -1) @ M[idx.long()].transpose(1, 2)
+        xy = xy[..., :2] / xy[..., 2:3] if self.perspective else xy[..., :2]
+        new = torch.cat((xy.amin(1), xy.amax(1)), -1).clamp(0, size)  # clip
+        # Candidates, see RandomPerspective.box_candidates with area_thr=0.10
+        w1, h1 = (box[:, 2:] - box[:, :2]).T * s[idx.long()]
+        w2, h2 = (new[:, 2:] - new[:, :2]).T
+        ar = torch.maximum(w2 / (h2 + 1e-16), h2 / (w2 + 1e-16))
+        keep = (w2 > 2) & (h2 > 2) & (w2 * h2 / (w1 * h1 + 1e-16) > 0.10) & (ar < 100)
+        return xyxy2xywh(new) / size, keep
+
+    def hsv(self, img: torch.Tensor) -> torch.Tensor:
+        """Apply random per-image HSV gains to (B, 3, H, W) RGB images in [0, 1] like RandomHSV."""
+        if img.shape[1] != 3 or not (self.hgain or self.sgain or self.vgain):
+            return img
+        r = (torch.rand(len(img), 3, 1, 1, device=img.device) * 2 - 1) * img.new_tensor(
+            [self.hgain, self.sgain, self.vgain]
+        ).view(1, 3, 1, 1)
+        v, i = img.max(1)
+        delta = v - img.min(1).values
+        d = delta.clamp(min=1e-8)
+        red, green, blue = img.unbind(1)
+        hue = torch.where(
+            i == 0, ((green - blue) / d) % 6, torch.where(i == 1, (blue - red) / d + 2, (red - green) / d + 4)
+        )
+        hue = (torch.where(delta > 0, hue, 0) + r[:, 0] * 6) % 6  # hue in sextants, shifted by a fraction of the circle
+        sat = (torch.where(v > 0, delta / v.clamp(min=1e-8), 0) * (1 + r[:, 1])).clamp(0, 1)
+        v = (v * (1 + r[:, 2])).clamp(0, 1)
+        k = (torch.tensor([5, 3, 1], device=img.device).view(1, 3, 1, 1) + hue.unsqueeze(1)) % 6
+        return v.unsqueeze(1) * (1 - sat.unsqueeze(1) * torch.minimum(k, 4 - k).clamp(0, 1))
+
+    def __call__(self, batch: dict[str, Any], size: int) -> dict[str, Any]:
+        """Augment a collated detection batch with images on a shared canvas, producing `size` x `size` images.
+
+        Args:
+            batch (dict[str, Any]): Batch with 'img' as a (B, C, H, W) float tensor in [0, 1], and 'cls', 'bboxes'
+                (normalized xywh) and 'batch_idx' tensors.
+            size (int): Output image size.
+
+        Returns:
+            (dict[str, Any]): The augmented batch.
+        """
+        img = batch["img"]
+        shape = tuple(img.shape[2:])
+        M, s = self.affine_matrices(len(img), shape, size, device=img.device)
+        img = self.warp(img, M, size)
+        bboxes, keep = self.apply_bboxes(batch["bboxes"], batch["batch_idx"], M, s, shape, size)
+        bboxes, idx = bboxes[keep], batch["batch_idx"][keep]
+        batch["cls"] = batch["cls"][keep]
+        img = self.hsv(img)
+        for p, dim, x in ((self.flipud, 2, 1), (self.fliplr, 3, 0)):  # (probability, image dim, box coordinate)
+            if p:
+                flip = torch.rand(len(img), device=img.device) < p
+                img = torch.where(flip.view(-1, 1, 1, 1), img.flip(dim), img)
+                bboxes[:, x] = torch.where(flip[idx.long()], 1 - bboxes[:, x], bboxes[:, x])
+        batch["img"], batch["bboxes"], batch["batch_idx"] = img, bboxes, idx
+        batch["resized_shape"] = [(size, size)] * len(img)
+        return batch
+
+
 class LetterBox:
     """Resize image and padding for detection, instance segmentation, pose.
 
@@ -1522,6 +1784,7 @@ class LetterBox:
 
     Methods:
         __call__: Resize and pad image, update labels and bounding boxes.
+        get_params: Compute the resize size and padding for an image shape.
 
     Examples:
         >>> transform = LetterBox(new_shape=(640, 640))
@@ -1594,34 +1857,13 @@ class LetterBox:
         new_shape = labels.pop("rect_shape", self.new_shape)
         if isinstance(new_shape, int):
             new_shape = (new_shape, new_shape)
-
-        # Scale ratio (new / old)
-        r = min(new_shape[0] / shape[0], new_shape[1] / shape[1])
-        if not self.scaleup:  # only scale down, do not scale up (for better val mAP)
-            r = min(r, 1.0)
-
-        # Compute padding
-        ratio = r, r  # width, height ratios
-        new_unpad = round(shape[1] * r), round(shape[0] * r)
-        dw, dh = new_shape[1] - new_unpad[0], new_shape[0] - new_unpad[1]  # wh padding
-        if self.auto:  # minimum rectangle
-            dw, dh = np.mod(dw, self.stride), np.mod(dh, self.stride)  # wh padding
-        elif self.scale_fill:  # stretch
-            dw, dh = 0.0, 0.0
-            new_unpad = (new_shape[1], new_shape[0])
-            ratio = new_shape[1] / shape[1], new_shape[0] / shape[0]  # width, height ratios
-
-        if self.center:
-            dw /= 2  # divide padding into 2 sides
-            dh /= 2
+        new_unpad, ratio, (top, bottom, left, right) = self.get_params(shape, new_shape)
 
         if shape[::-1] != new_unpad:  # resize
             img = cv2.resize(img, new_unpad, interpolation=self.interpolation)
             if img.ndim == 2:
                 img = img[..., None]
 
-        top, bottom = round(dh - 0.1) if self.center else 0, round(dh + 0.1)
-        left, right = round(dw - 0.1) if self.center else 0, round(dw + 0.1)
         h, w, c = img.shape
         if c == 3:
             img = cv2.copyMakeBorder(
@@ -1643,6 +1885,48 @@ class LetterBox:
         else:
             return img
 
+    def get_params(
+        self, shape: tuple[int, int], new_shape: tuple[int, int] | None = None
+    ) -> tuple[tuple[int, int], tuple[float, float], tuple[int, int, int, int]]:
+        """Compute the resize size and padding that letterbox an image of `shape` into `new_shape`.
+
+        Args:
+            shape (tuple[int, int]): Image (height, width).
+            new_shape (tuple[int, int], optional): Target (height, width), defaults to `self.new_shape`.
+
+        Returns:
+            new_unpad (tuple[int, int]): Resized (width, height) before padding.
+            ratio (tuple[float, float]): Width and height scale ratios.
+            pad (tuple[int, int, int, int]): Top, bottom, left and right padding in pixels.
+        """
+        new_shape = self.new_shape if new_shape is None else new_shape
+        if isinstance(new_shape, int):
+            new_shape = (new_shape, new_shape)
+
+        # Scale ratio (new / old)
+        r = min(new_shape[0] / shape[0], new_shape[1] / shape[1])
+        if not self.scaleup:  # only scale down, do not scale up (for better val mAP)
+            r = min(r, 1.0)
+
+        # Compute padding
+        ratio = r, r  # width, height ratios
+        new_unpad = round(shape[1] * r), round(shape[0] * r)
+        dw, dh = new_shape[1] - new_unpad[0], new_shape[0] - new_unpad[1]  # wh padding
+        if self.auto:  # minimum rectangle
+            dw, dh = np.mod(dw, self.stride), np.mod(dh, self.stride)  # wh padding
+        elif self.scale_fill:  # stretch
+            dw, dh = 0.0, 0.0
+            new_unpad = (new_shape[1], new_shape[0])
+            ratio = new_shape[1] / shape[1], new_shape[0] / shape[0]  # width, height ratios
+
+        if self.center:
+            dw /= 2  # divide padding into 2 sides
+            dh /= 2
+
+        top, bottom = round(dh - 0.1) if self.center else 0, round(dh + 0.1)
+        left, right = round(dw - 0.1) if self.center else 0, round(dw + 0.1)
+        return new_unpad, ratio, (top, bottom, left, right)
+
     @staticmethod
     def _update_labels(labels: dict[str, Any], ratio: tuple[float, float], padw: float, padh: float) -> dict[str, Any]:
         """Update labels after applying letterboxing to an image.
@@ -2383,7 +2667,9 @@ def v8_transforms(dataset, imgsz: int, hyp: IterableSimpleNamespace, stretch: bo
         stretch (bool): If True, applies stretching to the image. If False, uses LetterBox resizing.
 
     Returns:
-        (Compose): A composition of image transformations to be applied to the dataset.
+        (Compose): A composition of image transformations to be applied to the dataset. With
+            hyp.augment_device='batch' images are only placed on a shared canvas and BatchAugment applies the affine,
+            HSV and flip augmentations to collated batches.
 
     Examples:
         >>> from ultralytics.data.dataset import YOLODataset
@@ -2399,15 +2685,23 @@ def v8_transforms(dataset, imgsz: int, hyp: IterableSimpleNamespace, stretch: bo
         >>> hyp.augmentations = augmentations
         >>> transforms = v8_transforms(dataset, imgsz=640, hyp=hyp)
     """
+    batch = getattr(hyp, "augment_device", "cpu") == "batch"
+    if batch and (dataset.use_segments or dataset.use_keypoints or dataset.use_obb):
+        LOGGER.warning("augment_device='batch' supports detection datasets only, using augment_device='cpu'.")
+        batch = False
     mosaic = Mosaic(dataset, imgsz=imgsz, p=hyp.mosaic)
-    affine = RandomPerspective(
-        degrees=hyp.degrees,
-        translate=hyp.translate,
-        scale=hyp.scale,
-        shear=hyp.shear,
-        perspective=hyp.perspective,
-        pre_transform=None if stretch else LetterBox(new_shape=(imgsz, imgsz)),
-    )
+    letterbox = None if stretch else LetterBox(new_shape=(imgsz, imgsz))
+    if batch:  # affine, HSV and flips run batched in the trainer, see BatchAugment
+        affine = CanvasPad(size=imgsz * 2 if hyp.mosaic else imgsz, pre_transform=letterbox)
+    else:
+        affine = RandomPerspective(
+            degrees=hyp.degrees,
+            translate=hyp.translate,
+            scale=hyp.scale,
+            shear=hyp.shear,
+            perspective=hyp.perspective,
+            pre_transform=letterbox,
+        )
 
     pre_transform = Compose([mosaic, affine])
     if hyp.copy_paste_mode == "flip":
@@ -2430,17 +2724,19 @@ def v8_transforms(dataset, imgsz: int, hyp: IterableSimpleNamespace, stretch: bo
         elif flip_idx and (len(flip_idx) != kpt_shape[0]):
             raise ValueError(f"data.yaml flip_idx={flip_idx} length must be equal to kpt_shape[0]={kpt_shape[0]}")
 
-    return Compose(
+    transforms = Compose(
         [
             pre_transform,
             MixUp(dataset, pre_transform=pre_transform, p=hyp.mixup),
             CutMix(dataset, pre_transform=pre_transform, p=hyp.cutmix),
             Albumentations(p=1.0, transforms=getattr(hyp, "augmentations", None)),
-            RandomHSV(hgain=hyp.hsv_h, sgain=hyp.hsv_s, vgain=hyp.hsv_v),
-            RandomFlip(direction="vertical", p=hyp.flipud, flip_idx=flip_idx),
-            RandomFlip(direction="horizontal", p=hyp.fliplr, flip_idx=flip_idx),
         ]
-    )  # transforms
+    )
+    if not batch:
+        transforms.append(RandomHSV(hgain=hyp.hsv_h, sgain=hyp.hsv_s, vgain=hyp.hsv_v))
+        transforms.append(RandomFlip(direction="vertical", p=hyp.flipud, flip_idx=flip_idx))
+        transforms.append(RandomFlip(direction="horizontal", p=hyp.fliplr, flip_idx=flip_idx))
+    return transforms
 
 
 # Classification augmentations -----------------------------------------------------------------------------------------
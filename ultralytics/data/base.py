@@ -15,7 +15,15 @@ import cv2
 import numpy as np
 from torch.utils.data import Dataset
 
-from ultralytics.data.utils import FORMATS_HELP_MSG, HELP_URL, IMG_FORMATS, check_file_speeds
+from ultralytics.data.utils import (
+    FORMATS_HELP_MSG,
+    HELP_URL,
+    IMG_FORMATS,
+    DatasetPack,
+    SharedImageCache,
+    check_file_speeds,
+    get_hash,
+)
 from ultralytics.utils import DEFAULT_CFG, LOCAL_RANK, LOGGER, NUM_THREADS, TQDM
 from ultralytics.utils.patches import imread
 
@@ -49,7 +57,9 @@ class BaseDataset(Dataset):
         im_hw0 (list): List of original image dimensions (h, w).
         im_hw (list): List of resized image dimensions (h, w).
         npy_files (list[Path]): List of numpy file paths.
-        cache (str): Cache images to RAM or disk during training.
+        cache (str): Cache images to RAM, shared memory or disk during training, or read them from a dataset pack.
+        arena (SharedImageCache | None): Shared-memory image cache used when cache='shm'.
+        pack (DatasetPack | None): Memory-mapped dataset pack used when cache='pack'.
         transforms (callable): Image transformation function.
         batch_shapes (np.ndarray): Batch shapes for rectangular training.
         batch (np.ndarray): Batch index of each image.
@@ -59,6 +69,7 @@ class BaseDataset(Dataset):
         update_labels: Update labels to include only specified classes.
         load_image: Load an image from the dataset.
         cache_images: Cache images to memory or disk.
+        cache_images_to_shm: Pack resized images into a shared-memory arena.
         cache_images_to_disk: Save an image as an *.npy file for faster loading.
         check_cache_disk: Check image caching requirements vs available disk space.
         check_cache_ram: Check image caching requirements vs available memory.
@@ -91,7 +102,8 @@ class BaseDataset(Dataset):
         Args:
             img_path (str | list[str]): Path to the folder containing images or list of image paths.
             imgsz (int): Image size for resizing.
-            cache (bool | str): Cache images to RAM or disk during training.
+            cache (bool | str): Cache images to RAM, shared memory ('shm') or disk during training, or read images and
+                labels from a dataset pack built with 'yolo data pack' ('pack').
             augment (bool): If True, data augmentation is applied.
             hyp (dict[str, Any]): Hyperparameters to apply data augmentation.
             prefix (str): Prefix to print in log messages.
@@ -114,6 +126,10 @@ class BaseDataset(Dataset):
         self.fraction = fraction
         self.channels = channels
         self.cv2_flag = cv2.IMREAD_GRAYSCALE if channels == 1 else cv2.IMREAD_COLOR
+        self.cache = cache.lower() if isinstance(cache, str) else "ram" if cache is True else None
+        self.pack = DatasetPack.load(img_path, channels, prefix) if self.cache == "pack" else None
+        if self.pack is None and self.cache == "pack":
+            self.cache = None
         self.im_files = self.get_img_files(self.img_path)
         self.labels = self.get_labels()
         self.update_labels(include_class=classes)  # single_cls and include_class
@@ -130,11 +146,13 @@ class BaseDataset(Dataset):
         self.buffer = []  # buffer size = batch size
         self.max_buffer_length = min((self.ni, self.batch_size * 8, 1000)) if self.augment else 0
 
-        # Cache images (options are cache = True, False, None, "ram", "disk")
+        # Cache images (options are cache = True, False, None, "ram", "shm", "disk", "pack")
         self.ims, self.im_hw0, self.im_hw = [None] * self.ni, [None] * self.ni, [None] * self.ni
         self.npy_files = [Path(f).with_suffix(".npy") for f in self.im_files]
-        self.cache = cache.lower() if isinstance(cache, str) else "ram" if cache is True else None
-        if self.cache == "ram" and self.check_cache_ram():
+        self.arena = None
+        if self.cache == "shm" and self.check_cache_ram():
+            self.cache_images()
+        elif self.cache == "ram" and self.check_cache_ram():
             if hyp.deterministic:
                 LOGGER.warning(
                     "cache='ram' may produce non-deterministic training results. "
@@ -159,6 +177,8 @@ class BaseDataset(Dataset):
         Raises:
             FileNotFoundError: If no images are found or the path doesn't exist.
         """
+        if self.pack is not None:  # file list stored in the pack, skip directory listing and file checks
+            return self.pack.im_files[: round(len(self.pack.im_files) * self.fraction)]
         try:
             f = []  # image files
             for p in img_path if isinstance(img_path, list) else [img_path]:
@@ -222,9 +242,14 @@ class BaseDataset(Dataset):
         Raises:
             FileNotFoundError: If the image file is not found.
         """
+        if self.arena is not None:  # zero-copy view into the shared-memory cache
+            return self.arena[i]
         im, f, fn = self.ims[i], self.im_files[i], self.npy_files[i]
         if im is None:  # not cached in RAM
-            if fn.exists():  # load npy
+            hw0 = None
+            if self.pack is not None:  # read-only view into the pack, stored downscaled to at most the pack imgsz
+                im, hw0, _ = self.pack[f]
+            elif fn.exists():  # load npy
                 try:
                     im = np.load(fn)
                 except Exception as e:
@@ -236,13 +261,13 @@ class BaseDataset(Dataset):
             if im is None:
                 raise FileNotFoundError(f"Image Not Found {f}")
 
-            h0, w0 = im.shape[:2]  # orig hw
+            h0, w0 = hw0 or im.shape[:2]  # orig hw
             if rect_mode:  # resize long side to imgsz while maintaining aspect ratio
                 r = self.imgsz / max(h0, w0)  # ratio
-                if r != 1:  # if sizes are not equal
-                    w, h = (min(math.ceil(w0 * r), self.imgsz), min(math.ceil(h0 * r), self.imgsz))
+                w, h = (min(math.ceil(w0 * r), self.imgsz), min(math.ceil(h0 * r), self.imgsz))
+                if im.shape[:2] != (h, w):  # if sizes are not equal
                     im = cv2.resize(im, (w, h), interpolation=cv2.INTER_LINEAR)
-            elif not (h0 == w0 == self.imgsz):  # resize by stretching image to square imgsz
+            elif im.shape[:2] != (self.imgsz, self.imgsz):  # resize by stretching image to square imgsz
                 im = cv2.resize(im, (self.imgsz, self.imgsz), interpolation=cv2.INTER_LINEAR)
             if im.ndim == 2:
                 im = im[..., None]
@@ -262,6 +287,8 @@ class BaseDataset(Dataset):
 
     def cache_images(self) -> None:
         """Cache images to memory or disk for faster training."""
+        if self.cache == "shm":
+            return self.cache_images_to_shm()
         b, gb = 0, 1 << 30  # bytes of cached images, bytes per gigabytes
         fcn, storage = (self.cache_images_to_disk, "Disk") if self.cache == "disk" else (self.load_image, "RAM")
         with ThreadPool(NUM_THREADS) as pool:
@@ -276,6 +303,25 @@ class BaseDataset(Dataset):
                 pbar.desc = f"{self.prefix}Caching images ({b / gb:.1f}GB {storage})"
             pbar.close()
 
+    def cache_images_to_shm(self) -> None:
+        """Pack resized images into a shared-memory arena that DataLoader workers and DDP ranks map without copies."""
+        key = get_hash([*self.im_files, str(self.imgsz), str(self.channels), type(self).__name__])
+        arena = SharedImageCache(key, self.ni)
+        if arena.attach():  # written by the first DDP rank on this node or an earlier dataset
+            LOGGER.info(f"{self.prefix}Attached to shared image cache {arena.path} ({arena.nbytes / (1 << 30):.1f}GB)")
+        else:
+            with ThreadPool(NUM_THREADS) as pool:
+                results = pool.imap(self.load_image, range(self.ni))
+                pbar = TQDM(enumerate(results), total=self.ni, disable=LOCAL_RANK > 0)
+                for i, (im, hw0, _) in pbar:
+                    arena.add(i, im, hw0)
+                    pbar.desc = f"{self.prefix}Caching images ({arena.nbytes / (1 << 30):.1f}GB shared memory)"
+                pbar.close()
+            arena.close()
+        self.ims, self.im_hw0, self.im_hw = [None] * self.ni, [None] * self.ni, [None] * self.ni  # drop buffered copies
+        self.buffer.clear()
+        self.arena = arena
+
     def cache_images_to_disk(self, i: int) -> None:
         """Save an image as an *.npy file for faster loading."""
         f = self.npy_files[i]
@@ -394,6 +394,10 @@ def load_inference_source(
     vid_stride: int = 1,
     buffer: bool = False,
     channels: int = 3,
+    stream_batch: int = 0,
+    stream_wait: float = 0.0,
+    vid_backend: str = "cv2",
+    vid_scale: float = 1.0,
 ):
     """Load an inference source for object detection and apply necessary transformations.
 
@@ -403,6 +407,10 @@ def load_inference_source(
         vid_stride (int, optional): The frame interval for video sources.
         buffer (bool, optional): Whether stream frames will be buffered.
         channels (int, optional): The number of input channels for the model.
+        stream_batch (int, optional): Maximum frames per stream micro-batch, 0 for all streams.
+        stream_wait (float, optional): Seconds a stream micro-batch waits for more ready streams.
+        vid_backend (str, optional): Video decoder backend for video and stream sources, 'cv2' or 'pyav'.
+        vid_scale (float, optional): Resize factor applied to decoded video frames.
 
     Returns:
         (Dataset): A dataset object for the specified input source with attached source_type attribute.
@@ -423,13 +431,24 @@ def load_inference_source(
     elif in_memory:
         dataset = source
     elif stream:
-        dataset = LoadStreams(source, vid_stride=vid_stride, buffer=buffer, channels=channels)
+        dataset = LoadStreams(
+            source,
+            vid_stride=vid_stride,
+            buffer=buffer,
+            channels=channels,
+            max_batch=stream_batch,
+            max_wait=stream_wait,
+            backend=vid_backend,
+            scale=vid_scale,
+        )
     elif screenshot:
         dataset = LoadScreenshots(source, channels=channels)
     elif from_img:
         dataset = LoadPilAndNumpy(source, channels=channels)
     else:
-        dataset = LoadImagesAndVideos(source, batch=batch, vid_stride=vid_stride, channels=channels)
+        dataset = LoadImagesAndVideos(
+            source, batch=batch, vid_stride=vid_stride, channels=channels, backend=vid_backend, scale=vid_scale
+        )
 
     # Attach source types to the dataset
     setattr(dataset, "source_type", source_type)
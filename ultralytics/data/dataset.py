@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from collections import defaultdict
 from itertools import repeat
+from multiprocessing import Pool, current_process
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from typing import Any
@@ -33,6 +34,8 @@ from .base import BaseDataset
 from .converter import merge_multi_segment
 from .utils import (
     HELP_URL,
+    DatasetPack,
+    LabelCache,
     check_file_speeds,
     get_hash,
     img2label_paths,
@@ -90,6 +93,9 @@ class YOLODataset(BaseDataset):
     def cache_labels(self, path: Path = Path("./labels.cache")) -> dict:
         """Cache dataset labels, check images and read shapes.
 
+        Only images and labels that are new or whose size or modification time changed since the last scan are
+        verified, in a process pool for large scans, and their results are appended to the cache file.
+
         Args:
             path (Path): Path where to save the cache file.
 
@@ -99,36 +105,47 @@ class YOLODataset(BaseDataset):
         x = {"labels": []}
         nm, nf, ne, nc, msgs = 0, 0, 0, 0, []  # number missing, found, empty, corrupt, messages
         desc = f"{self.prefix}Scanning {path.parent / path.stem}..."
-        total = len(self.im_files)
         nkpt, ndim = self.data.get("kpt_shape", (0, 0))
         if self.use_keypoints and (nkpt <= 0 or ndim not in {2, 3}):
             raise ValueError(
                 "'kpt_shape' in data.yaml missing or incorrect. Should be a list with [number of "
                 "keypoints, number of dims (2 for x,y or 3 for x,y,visible)], i.e. 'kpt_shape: [17, 3]'"
             )
-        with ThreadPool(NUM_THREADS) as pool:
-            results = pool.imap(
-                func=verify_image_label,
-                iterable=zip(
-                    self.im_files,
-                    self.label_files,
-                    repeat(self.prefix),
-                    repeat(self.use_keypoints),
-                    repeat(len(self.data["names"])),
-                    repeat(nkpt),
-                    repeat(ndim),
-                    repeat(self.single_cls),
-                ),
-            )
-            pbar = TQDM(results, desc=desc, total=total)
-            for im_file, lb, shape, segments, keypoint, nm_f, nf_f, ne_f, nc_f, msg in pbar:
-                nm += nm_f
-                nf += nf_f
-                ne += ne_f
-                nc += nc_f
-                if im_file:
-                    x["labels"].append(
-                        {
+        key = (self.use_keypoints, len(self.data["names"]), nkpt, ndim, self.single_cls)
+        cache = LabelCache(path, key)
+        entries = cache.load()
+        with ThreadPool(NUM_THREADS) as pool:  # stat() is I/O bound, i.e. on network filesystems
+            sigs = pool.map(LabelCache.signature, zip(self.im_files, self.label_files), chunksize=256)
+        current, todo = {}, []  # up-to-date entries of this dataset, indices of new or changed files
+        for i, (f, sig) in enumerate(zip(self.im_files, sigs)):
+            if f in entries and entries[f][0] == sig:
+                current[f] = entries[f]
+            else:
+                todo.append(i)
+        new = {}
+        if todo:
+            # Verification decodes images with PIL and is CPU bound, use processes unless the scan is small
+            pool = Pool(NUM_THREADS) if len(todo) >= 1024 and not current_process().daemon else ThreadPool(NUM_THREADS)
+            with pool:
+                results = pool.imap(
+                    func=verify_image_label,
+                    iterable=zip(
+                        (self.im_files[i] for i in todo),
+                        (self.label_files[i] for i in todo),
+                        repeat(""),
+                        repeat(self.use_keypoints),
+                        repeat(len(self.data["names"])),
+                        repeat(nkpt),
+                        repeat(ndim),
+                        repeat(self.single_cls),
+                    ),
+                    chunksize=16,
+                )
+                pbar = TQDM(zip(todo, results), desc=desc, total=len(todo))
+                for i, (im_file, lb, shape, segments, keypoint, nm_f, nf_f, ne_f, nc_f, msg) in pbar:
+                    label = None
+                    if im_file:
+                        label = {
                             "im_file": im_file,
                             "shape": shape,
                             "cls": lb[:, 0:1],  # n, 1
@@ -138,50 +155,57 @@ class YOLODataset(BaseDataset):
                             "normalized": True,
                             "bbox_format": "xywh",
                         }
-                    )
-                if msg:
-                    msgs.append(msg)
-                pbar.desc = f"{desc} {nf} images, {nm + ne} backgrounds, {nc} corrupt"
-            pbar.close()
-
-        if msgs:
+                    new[self.im_files[i]] = (sigs[i], label, (nm_f, nf_f, ne_f, nc_f), msg)
+                    pbar.desc = f"{desc} {len(new)}/{len(todo)} new or changed images verified"
+                pbar.close()
+            cache.append(new, self.prefix)
+            current.update(new)
+
+        for f in self.im_files:
+            _, label, (nm_f, nf_f, ne_f, nc_f), msg = current[f]
+            nm += nm_f
+            nf += nf_f
+            ne += ne_f
+            nc += nc_f
+            if label:
+                x["labels"].append(label)
+            if msg:
+                msgs.append(f"{self.prefix}{msg}")
+        if todo and msgs:
             LOGGER.info("\n".join(msgs))
         if nf == 0:
             LOGGER.warning(f"{self.prefix}No labels found in {path}. {HELP_URL}")
-        x["hash"] = get_hash(self.label_files + self.im_files)
         x["results"] = nf, nm, ne, nc, len(self.im_files)
         x["msgs"] = msgs  # warnings
-        save_dataset_cache_file(self.prefix, path, x, DATASET_CACHE_VERSION)
+        x["verified"] = len(todo)  # number of images verified in this scan
         return x
 
     def get_labels(self) -> list[dict]:
         """Return dictionary of labels for YOLO training.
 
-        This method loads labels from disk or cache, verifies their integrity, and prepares them for training.
+        This method loads labels from disk, cache or a dataset pack, verifies their integrity, and prepares them for
+        training.
 
         Returns:
             (list[dict]): List of label dictionaries, each containing information about an image and its annotations.
         """
         self.label_files = img2label_paths(self.im_files)
-        cache_path = Path(self.label_files[0]).parent.with_suffix(".cache")
-        try:
-            cache, exists = load_dataset_cache_file(cache_path), True  # attempt to load a *.cache file
-            assert cache["version"] == DATASET_CACHE_VERSION  # matches current version
-            assert cache["hash"] == get_hash(self.label_files + self.im_files)  # identical hash
-        except (FileNotFoundError, AssertionError, AttributeError, ModuleNotFoundError):
-            cache, exists = self.cache_labels(cache_path), False  # run cache ops
-
-        # Display cache
-        nf, nm, ne, nc, n = cache.pop("results")  # found, missing, empty, corrupt, total
-        if exists and LOCAL_RANK in {-1, 0}:
-            d = f"Scanning {cache_path}... {nf} images, {nm + ne} backgrounds, {nc} corrupt"
-            TQDM(None, desc=self.prefix + d, total=n, initial=n)  # display results
-            if cache["msgs"]:
-                LOGGER.info("\n".join(cache["msgs"]))  # display warnings
-
-        # Read cache
-        [cache.pop(k) for k in ("hash", "version", "msgs")]  # remove items
-        labels = cache["labels"]
+        if self.pack is not None:  # labels verified when packing, skip hashing and checking label files
+            cache_path, labels = self.pack.path, self.pack.labels[: len(self.im_files)]
+        else:
+            cache_path = Path(self.label_files[0]).parent.with_suffix(".cache")
+            cache = self.cache_labels(cache_path)  # verify new and changed files only
+
+            # Display cache
+            nf, nm, ne, nc, n = cache.pop("results")  # found, missing, empty, corrupt, total
+            if not cache.pop("verified") and LOCAL_RANK in {-1, 0}:
+                d = f"Scanning {cache_path}... {nf} images, {nm + ne} backgrounds, {nc} corrupt"
+                TQDM(None, desc=self.prefix + d, total=n, initial=n)  # display results
+                if cache["msgs"]:
+                    LOGGER.info("\n".join(cache["msgs"]))  # display warnings
+
+            # Read cache
+            labels = cache["labels"]
         if not labels:
             raise RuntimeError(
                 f"No valid images found in {cache_path}. Images with incorrectly formatted labels are ignored. {HELP_URL}"
@@ -697,6 +721,7 @@ class ClassificationDataset:
     Attributes:
         cache_ram (bool): Indicates if caching in RAM is enabled.
         cache_disk (bool): Indicates if caching on disk is enabled.
+        pack (DatasetPack | None): Memory-mapped dataset pack used when cache='pack'.
         samples (list): A list of tuples, each containing the path to an image, its class index, path to its .npy cache
             file (if caching on disk), and optionally the loaded image array (if caching in RAM).
         torch_transforms (callable): PyTorch transforms to be applied to the images.
@@ -719,20 +744,25 @@ class ClassificationDataset:
             augment (bool, optional): Whether to apply augmentations to the dataset.
             prefix (str, optional): Prefix for logging and cache filenames, aiding in dataset identification.
         """
-        import torchvision  # scope for faster 'import ultralytics'
-
-        # Base class assigned as attribute rather than used as base class to allow for scoping slow torchvision import
-        if TORCHVISION_0_18:  # 'allow_empty' argument first introduced in torchvision 0.18
-            self.base = torchvision.datasets.ImageFolder(root=root, allow_empty=True)
+        self.prefix = colorstr(f"{prefix}: ") if prefix else ""
+        self.pack = DatasetPack.load(root, prefix=self.prefix) if str(args.cache).lower() == "pack" else None
+        if self.pack is not None:  # samples stored in the pack, skip directory listing and image verification
+            self.samples = [(lb["im_file"], lb["cls"]) for lb in self.pack.labels]
+            self.root = str(root)
         else:
-            self.base = torchvision.datasets.ImageFolder(root=root)
-        self.samples = self.base.samples
-        self.root = self.base.root
+            import torchvision  # scope for faster 'import ultralytics'
+
+            # Base class assigned as attribute rather than used as base class to allow scoping slow torchvision import
+            if TORCHVISION_0_18:  # 'allow_empty' argument first introduced in torchvision 0.18
+                self.base = torchvision.datasets.ImageFolder(root=root, allow_empty=True)
+            else:
+                self.base = torchvision.datasets.ImageFolder(root=root)
+            self.samples = self.base.samples
+            self.root = self.base.root
 
         # Initialize attributes
         if augment and args.fraction < 1.0:  # reduce training fraction
             self.samples = self.samples[: round(len(self.samples) * args.fraction)]
-        self.prefix = colorstr(f"{prefix}: ") if prefix else ""
         self.cache_ram = args.cache is True or str(args.cache).lower() == "ram"  # cache images into RAM
         if self.cache_ram:
             LOGGER.warning(
@@ -741,7 +771,10 @@ class ClassificationDataset:
             )
             self.cache_ram = False
         self.cache_disk = str(args.cache).lower() == "disk"  # cache images on hard drive as uncompressed *.npy files
-        self.samples = self.verify_images()  # filter out bad images
+        if str(args.cache).lower() == "shm":
+            LOGGER.warning("Classification does not support cache='shm', reading images from disk instead.")
+        if self.pack is None:
+            self.samples = self.verify_images()  # filter out bad images
         self.samples = [[*list(x), Path(x[0]).with_suffix(".npy"), None] for x in self.samples]  # file, index, npy, im
         scale = (1.0 - args.scale, 1.0)  # (0.08, 1.0)
         self.torch_transforms = (
@@ -770,7 +803,9 @@ class ClassificationDataset:
             (dict): Dictionary containing the image and its class index.
         """
         f, j, fn, im = self.samples[i]  # filename, index, filename.with_suffix('.npy'), image
-        if self.cache_ram:
+        if self.pack is not None:  # read-only view into the memory-mapped pack
+            im = self.pack[f][0]
+        elif self.cache_ram:
             if im is None:  # Warning: two separate if statements required here, do not combine this with previous line
                 im = self.samples[i][3] = cv2.imread(f)
         elif self.cache_disk:
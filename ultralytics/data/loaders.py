@@ -9,7 +9,7 @@ import time
 import urllib
 from dataclasses import dataclass
 from pathlib import Path
-from threading import Thread
+from threading import Event, Thread
 from typing import Any
 
 import cv2
@@ -50,6 +50,198 @@ class SourceTypes:
     tensor: bool = False
 
 
+class VideoDecoder:
+    """Base class for the video decoders used by `LoadImagesAndVideos` and `LoadStreams`.
+
+    Subclasses open a video file, stream URL or webcam and return BGR (or grayscale) frames, advancing `vid_stride`
+    frames per read so each backend can skip frames in the cheapest way it supports.
+
+    Attributes:
+        source (str | int): Video file path, stream URL or webcam index.
+        vid_stride (int): Number of frames to advance per `read()`.
+        scale (float): Resize factor applied to decoded frames, 1.0 keeps the native resolution.
+        channels (int): Number of channels of returned frames (1 for grayscale, 3 for BGR).
+        width (int): Width of returned frames.
+        height (int): Height of returned frames.
+        fps (float): Native frame rate, 0 if unknown.
+        frames (int): Native number of frames, 0 if unknown (e.g. live streams).
+
+    Methods:
+        open: Open the source and read its properties.
+        is_opened: Return whether the source is open.
+        read: Advance `vid_stride` frames and return the last one.
+        release: Close the source.
+    """
+
+    def __init__(self, source: str | int, vid_stride: int = 1, scale: float = 1.0, channels: int = 3):
+        """Initialize the decoder and open the source.
+
+        Args:
+            source (str | int): Video file path, stream URL or webcam index.
+            vid_stride (int): Number of frames to advance per `read()`.
+            scale (float): Resize factor applied to decoded frames in (0.0, 1.0], 1.0 keeps the native resolution.
+            channels (int): Number of channels of returned frames (1 for grayscale, 3 for BGR).
+
+        Raises:
+            ValueError: If `scale` is not in (0.0, 1.0].
+        """
+        if not 0.0 < scale <= 1.0:
+            raise ValueError(f"Invalid video scale {scale}, valid values are > 0.0 and <= 1.0.")
+        self.source = source
+        self.vid_stride = max(int(vid_stride), 1)
+        self.scale = scale
+        self.channels = channels
+        self.width, self.height, self.fps, self.frames = 0, 0, 0.0, 0
+        self.open()
+
+    def open(self):
+        """Open the source and read its properties."""
+        raise NotImplementedError
+
+    def is_opened(self) -> bool:
+        """Return whether the source is open."""
+        raise NotImplementedError
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        """Advance `vid_stride` frames and return the last one, or `(False, None)` at the end of the video."""
+        raise NotImplementedError
+
+    def release(self):
+        """Close the source."""
+        raise NotImplementedError
+
+
+class CV2VideoDecoder(VideoDecoder):
+    """Video decoder based on `cv2.VideoCapture`, supporting files, streams and webcams.
+
+    Skipped frames are grabbed without being retrieved and resizing runs after decode.
+    """
+
+    def open(self):
+        """Open the source with `cv2.VideoCapture` and read its properties."""
+        self.cap = cv2.VideoCapture(self.source)
+        if self.cap.isOpened():
+            self.width = round(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH) * self.scale)
+            self.height = round(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT) * self.scale)
+            fps = self.cap.get(cv2.CAP_PROP_FPS)  # warning: may return 0 or nan
+            self.fps = fps if math.isfinite(fps) else 0.0
+            self.frames = max(int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT)), 0)
+
+    def is_opened(self) -> bool:
+        """Return whether the capture is open."""
+        return self.cap.isOpened()
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        """Grab `vid_stride` frames and retrieve the last one."""
+        for _ in range(self.vid_stride):
+            if not self.cap.grab():
+                return False, None
+        success, im = self.cap.retrieve()
+        if not success or im is None:
+            return False, None
+        if self.scale != 1.0:
+            im = cv2.resize(im, (self.width, self.height), interpolation=cv2.INTER_AREA)
+        return True, cv2.cvtColor(im, cv2.COLOR_BGR2GRAY)[..., None] if self.channels == 1 else im
+
+    def release(self):
+        """Release the capture."""
+        self.cap.release()
+
+
+class PyAVVideoDecoder(VideoDecoder):
+    """Video decoder based on PyAV (FFmpeg bindings) for files and network streams.
+
+    Decoding runs on FFmpeg frame and slice threads outside the GIL. Color conversion and resizing are done in a single
+    swscale pass into an FFmpeg-pooled frame that is returned as a NumPy view without further copies when rows are
+    unpadded. With `vid_stride` larger than the keyframe interval seen so far, files are seeked to the keyframe before
+    the next wanted frame instead of decoding every frame in between.
+
+    Attributes:
+        container (av.container.InputContainer | None): Open PyAV container.
+        stream (av.video.stream.VideoStream): Decoded video stream.
+        index (int): Index of the last decoded frame.
+        gop (int): Largest keyframe interval seen so far in frames, 0 until two keyframes were decoded.
+    """
+
+    def open(self):
+        """Open the source with PyAV and read its properties."""
+        check_requirements("av")
+        import av
+
+        if isinstance(self.source, int):
+            raise NotImplementedError(
+                "PyAV video decoding does not support webcam indices, use 'vid_backend=cv2' instead."
+            )
+        try:
+            self.container = av.open(str(self.source))
+        except Exception as e:
+            LOGGER.warning(f"PyAV failed to open {self.source}: {e}")
+            self.container = None
+            return
+        self.stream = self.container.streams.video[0]
+        self.stream.thread_type = "AUTO"  # frame and slice threading
+        rate = self.stream.average_rate or self.stream.guessed_rate
+        self.fps = float(rate) if rate else 0.0
+        self.frames = self.stream.frames or 0
+        self.width = round(self.stream.codec_context.width * self.scale)
+        self.height = round(self.stream.codec_context.height * self.scale)
+        self.start = self.stream.start_time or 0
+        self.decoder = self.container.decode(self.stream)
+        self.index, self.gop, self.last_key = -1, 0, None
+
+    def is_opened(self) -> bool:
+        """Return whether the container is open."""
+        return self.container is not None
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        """Decode up to the frame `vid_stride` frames ahead, seeking by keyframe when that skips decoding work."""
+        target = self.index + self.vid_stride
+        if self.gop and self.frames and self.fps and target - self.index > self.gop:
+            pts = self.start + int(target / self.fps / self.stream.time_base)
+            self.container.seek(pts, stream=self.stream, backward=True)  # nearest keyframe at or before pts
+            self.decoder = self.container.decode(self.stream)
+            self.last_key = None
+        try:
+            for frame in self.decoder:
+                if frame.pts is not None and self.fps:
+                    i = round(float((frame.pts - self.start) * self.stream.time_base) * self.fps)
+                else:
+                    i = self.index + 1
+                if frame.key_frame:
+                    if self.last_key is not None:
+                        self.gop = max(self.gop, i - self.last_key)
+                    self.last_key = i
+                self.index = i
+                if i >= target:
+                    return True, self.to_numpy(frame)
+        except Exception as e:  # corrupt packet or lost connection
+            LOGGER.warning(f"PyAV decode error in {self.source}: {e}")
+        return False, None
+
+    def to_numpy(self, frame) -> np.ndarray:
+        """Convert and resize a decoded frame in one swscale pass and return it as an (H, W, C) array."""
+        frame = frame.reformat(
+            width=self.width,
+            height=self.height,
+            format="gray" if self.channels == 1 else "bgr24",
+            interpolation="AREA",
+        )
+        plane, c = frame.planes[0], self.channels
+        im = np.frombuffer(plane, np.uint8).reshape(self.height, plane.line_size)
+        if plane.line_size != self.width * c:
+            im = np.ascontiguousarray(im[:, : self.width * c])  # drop row padding
+        return im.reshape(self.height, self.width, c)
+
+    def release(self):
+        """Close the container."""
+        if self.container is not None:
+            self.container.close()
+            self.container = None
+
+
+VIDEO_DECODERS = {"cv2": CV2VideoDecoder, "pyav": PyAVVideoDecoder}  # vid_backend name to decoder class
+
+
 class LoadStreams:
     """Stream Loader for various types of video streams.
 
@@ -67,12 +259,17 @@ class LoadStreams:
         frames (list[int]): List of total frames for each stream.
         threads (list[Thread]): List of threads for each stream.
         shape (list[tuple[int, int, int]]): List of shapes for each stream.
-        caps (list[cv2.VideoCapture]): List of cv2.VideoCapture objects for each stream.
+        caps (list[VideoDecoder]): List of video decoders for each stream.
         bs (int): Batch size for processing.
         cv2_flag (int): OpenCV flag for image reading (grayscale or color/BGR).
+        max_batch (int): Maximum number of frames per micro-batch, 0 for all streams.
+        max_wait (float): Seconds a micro-batch waits for more ready streams before it is returned.
+        micro_batch (bool): Whether batches are formed from the streams with a ready frame only.
+        frame_ready (Event): Set by the reader threads whenever a new frame is available.
 
     Methods:
         update: Read stream frames in daemon thread.
+        ready: Return the indices of streams with a frame available.
         close: Close stream loader and release resources.
         __iter__: Returns an iterator object for the class.
         __next__: Returns source paths, transformed, and original images for processing.
@@ -89,9 +286,21 @@ class LoadStreams:
         - The class uses threading to efficiently load frames from multiple streams simultaneously.
         - It automatically handles YouTube links, converting them to the best available stream URL.
         - The class implements a buffer system to manage frame storage and retrieval.
+        - With `max_batch` or `max_wait` set, batches hold only the streams that have a frame ready, so a slow stream
+          is skipped instead of stalling the others. Batch paths identify the source of each frame.
     """
 
-    def __init__(self, sources: str = "file.streams", vid_stride: int = 1, buffer: bool = False, channels: int = 3):
+    def __init__(
+        self,
+        sources: str = "file.streams",
+        vid_stride: int = 1,
+        buffer: bool = False,
+        channels: int = 3,
+        max_batch: int = 0,
+        max_wait: float = 0.0,
+        backend: str = "cv2",
+        scale: float = 1.0,
+    ):
         """Initialize stream loader for multiple video sources, supporting various stream types.
 
         Args:
@@ -99,13 +308,20 @@ class LoadStreams:
             vid_stride (int): Video frame-rate stride.
             buffer (bool): Whether to buffer input streams.
             channels (int): Number of image channels (1 for grayscale, 3 for color).
+            max_batch (int): Maximum number of frames per micro-batch, 0 for all streams.
+            max_wait (float): Seconds to wait for up to `max_batch` ready streams before returning a partial batch.
+            backend (str): Video decoder backend, a key of `VIDEO_DECODERS`.
+            scale (float): Resize factor applied to decoded frames.
         """
+        if backend not in VIDEO_DECODERS:
+            raise ValueError(f"Invalid video backend '{backend}', valid options are {list(VIDEO_DECODERS)}.")
         torch.backends.cudnn.benchmark = True  # faster for fixed-size inference
         self.buffer = buffer  # buffer input streams
         self.running = True  # running flag for Thread
         self.mode = "stream"
         self.vid_stride = vid_stride  # video frame-rate stride
         self.cv2_flag = cv2.IMREAD_GRAYSCALE if channels == 1 else cv2.IMREAD_COLOR  # grayscale or color (BGR)
+        decoder = VIDEO_DECODERS[backend]
 
         sources = Path(sources).read_text().rsplit() if os.path.isfile(sources) else [sources]
         n = len(sources)
@@ -117,6 +333,12 @@ class LoadStreams:
         self.imgs = [[] for _ in range(n)]  # images
         self.shape = [[] for _ in range(n)]  # image shapes
         self.sources = [ops.clean_str(x).replace(os.sep, "_") for x in sources]  # clean source names for later
+        self.sources = [x if x not in self.sources[:i] else f"{x}_{i}" for i, x in enumerate(self.sources)]  # unique
+        self.max_batch = min(max_batch, n) if max_batch > 0 else n
+        self.max_wait = max_wait
+        self.micro_batch = max_batch > 0 or max_wait > 0
+        self.frame_ready = Event()
+        self.next_source = 0  # round-robin start so every stream is served when max_batch < n
         for i, s in enumerate(sources):  # index, source
             # Start thread to read frames from video stream
             st = f"{i + 1}/{n}: {s}... "
@@ -129,48 +351,40 @@ class LoadStreams:
                     "'source=0' webcam not supported in Colab and Kaggle notebooks. "
                     "Try running 'source=0' in a local environment."
                 )
-            self.caps[i] = cv2.VideoCapture(s)  # store video capture object
-            if not self.caps[i].isOpened():
+            self.caps[i] = decoder(s, vid_stride=vid_stride, scale=scale, channels=channels)  # store video decoder
+            if not self.caps[i].is_opened():
                 raise ConnectionError(f"{st}Failed to open {s}")
-            w = int(self.caps[i].get(cv2.CAP_PROP_FRAME_WIDTH))
-            h = int(self.caps[i].get(cv2.CAP_PROP_FRAME_HEIGHT))
-            fps = self.caps[i].get(cv2.CAP_PROP_FPS)  # warning: may return 0 or nan
-            self.frames[i] = max(int(self.caps[i].get(cv2.CAP_PROP_FRAME_COUNT)), 0) or float(
-                "inf"
-            )  # infinite stream fallback
-            self.fps[i] = max((fps if math.isfinite(fps) else 0) % 100, 0) or 30  # 30 FPS fallback
+            w, h = self.caps[i].width, self.caps[i].height
+            self.frames[i] = self.caps[i].frames or float("inf")  # infinite stream fallback
+            self.fps[i] = max(self.caps[i].fps % 100, 0) or 30  # 30 FPS fallback
 
             success, im = self.caps[i].read()  # guarantee first frame
-            im = cv2.cvtColor(im, cv2.COLOR_BGR2GRAY)[..., None] if self.cv2_flag == cv2.IMREAD_GRAYSCALE else im
             if not success or im is None:
                 raise ConnectionError(f"{st}Failed to read images from {s}")
             self.imgs[i].append(im)
             self.shape[i] = im.shape
-            self.threads[i] = Thread(target=self.update, args=([i, self.caps[i], s]), daemon=True)
+            self.threads[i] = Thread(target=self.update, args=([i, self.caps[i]]), daemon=True)
             LOGGER.info(f"{st}Success ✅ ({self.frames[i]} frames of shape {w}x{h} at {self.fps[i]:.2f} FPS)")
             self.threads[i].start()
         LOGGER.info("")  # newline
 
-    def update(self, i: int, cap: cv2.VideoCapture, stream: str):
+    def update(self, i: int, cap: VideoDecoder):
         """Read stream frames in daemon thread and update image buffer."""
-        n, f = 0, self.frames[i]  # frame number, frame array
-        while self.running and cap.isOpened() and n < (f - 1):
+        n, f = cap.vid_stride, self.frames[i]  # frames consumed including the first read, total frames
+        while self.running and cap.is_opened() and n + cap.vid_stride <= f:
             if len(self.imgs[i]) < 30:  # keep a <=30-image buffer
-                n += 1
-                cap.grab()  # .read() = .grab() followed by .retrieve()
-                if n % self.vid_stride == 0:
-                    success, im = cap.retrieve()
-                    im = (
-                        cv2.cvtColor(im, cv2.COLOR_BGR2GRAY)[..., None] if self.cv2_flag == cv2.IMREAD_GRAYSCALE else im
-                    )
-                    if not success:
-                        im = np.zeros(self.shape[i], dtype=np.uint8)
-                        LOGGER.warning("Video stream unresponsive, please check your IP camera connection.")
-                        cap.open(stream)  # re-open stream if signal was lost
-                    if self.buffer:
-                        self.imgs[i].append(im)
-                    else:
-                        self.imgs[i] = [im]
+                n += cap.vid_stride
+                success, im = cap.read()  # decoder skips vid_stride - 1 frames
+                if not success:
+                    im = np.zeros(self.shape[i], dtype=np.uint8)
+                    LOGGER.warning("Video stream unresponsive, please check your IP camera connection.")
+                    cap.release()
+                    cap.open()  # re-open stream if signal was lost
+                if self.buffer:
+                    self.imgs[i].append(im)
+                else:
+                    self.imgs[i] = [im]
+                self.frame_ready.set()
             else:
                 time.sleep(0.01)  # wait until the buffer is empty
 
@@ -180,9 +394,9 @@ class LoadStreams:
         for thread in self.threads:
             if thread.is_alive():
                 thread.join(timeout=5)  # Add timeout
-        for cap in self.caps:  # Iterate through the stored VideoCapture objects
+        for cap in self.caps:  # Iterate through the stored video decoders
             try:
-                cap.release()  # release video capture
+                cap.release()  # release video decoder
             except Exception as e:
                 LOGGER.warning(f"Could not release VideoCapture object: {e}")
 
@@ -191,9 +405,16 @@ class LoadStreams:
         self.count = -1
         return self
 
+    def ready(self) -> list[int]:
+        """Return the indices of streams with a frame available, in round-robin order from `next_source`."""
+        n = len(self.imgs)
+        return [j for j in ((self.next_source + k) % n for k in range(n)) if self.imgs[j]]
+
     def __next__(self) -> tuple[list[str], list[np.ndarray], list[str]]:
         """Return the next batch of frames from multiple video streams for processing."""
         self.count += 1
+        if self.micro_batch:
+            return self.next_micro_batch()
 
         images = []
         for i, x in enumerate(self.imgs):
@@ -218,6 +439,37 @@ class LoadStreams:
 
         return self.sources, images, [""] * self.bs
 
+    def next_micro_batch(self) -> tuple[list[str], list[np.ndarray], list[str]]:
+        """Return a batch of frames from the streams that have one ready, waiting at most `max_wait` for more.
+
+        The batch is returned as soon as `max_batch` streams are ready or the deadline passes with at least one frame.
+        Streams without a new frame are left out rather than padded, and iteration stops once every stream has ended.
+        """
+        deadline = time.perf_counter() + self.max_wait
+        while True:
+            self.frame_ready.clear()  # clear before scanning so frames arriving during the scan are not missed
+            idx = self.ready()
+            remaining = deadline - time.perf_counter()
+            if len(idx) >= self.max_batch or (idx and remaining <= 0):
+                break
+            if not idx and not any(t.is_alive() for t in self.threads):
+                self.close()
+                raise StopIteration
+            self.frame_ready.wait(remaining if idx else 1 / min(self.fps))
+
+        idx = idx[: self.max_batch]
+        self.next_source = (idx[-1] + 1) % len(self.imgs)
+        idx.sort()
+        images = []
+        for j in idx:
+            x = self.imgs[j]
+            if self.buffer:
+                images.append(x.pop(0))
+            else:
+                images.append(x.pop(-1))
+                x.clear()
+        return [self.sources[j] for j in idx], images, [""] * len(idx)
+
     def __len__(self) -> int:
         """Return the number of video streams in the LoadStreams object."""
         return self.bs  # 1E12 frames = 32 streams at 30 FPS for 30 years
@@ -314,12 +566,15 @@ class LoadImagesAndVideos:
         mode (str): Current mode, 'image' or 'video'.
         vid_stride (int): Stride for video frame-rate.
         bs (int): Batch size.
-        cap (cv2.VideoCapture): Video capture object for OpenCV.
+        cap (VideoDecoder): Video decoder of the current video.
         frame (int): Frame counter for video.
         frames (int): Total number of frames in the video.
         count (int): Counter for iteration, initialized at 0 during __iter__().
         ni (int): Number of images.
         cv2_flag (int): OpenCV flag for image reading (grayscale or color/BGR).
+        channels (int): Number of image channels (1 for grayscale, 3 for color).
+        decoder (type[VideoDecoder]): Video decoder class used for video files.
+        scale (float): Resize factor applied to decoded video frames.
 
     Methods:
         __init__: Initialize the LoadImagesAndVideos object.
@@ -340,7 +595,15 @@ class LoadImagesAndVideos:
         - Can read from a text file containing paths to images and videos.
     """
 
-    def __init__(self, path: str | Path | list, batch: int = 1, vid_stride: int = 1, channels: int = 3):
+    def __init__(
+        self,
+        path: str | Path | list,
+        batch: int = 1,
+        vid_stride: int = 1,
+        channels: int = 3,
+        backend: str = "cv2",
+        scale: float = 1.0,
+    ):
         """Initialize dataloader for images and videos, supporting various input formats.
 
         Args:
@@ -348,7 +611,11 @@ class LoadImagesAndVideos:
             batch (int): Batch size for processing.
             vid_stride (int): Video frame-rate stride.
             channels (int): Number of image channels (1 for grayscale, 3 for color).
+            backend (str): Video decoder backend, a key of `VIDEO_DECODERS`.
+            scale (float): Resize factor applied to decoded video frames.
         """
+        if backend not in VIDEO_DECODERS:
+            raise ValueError(f"Invalid video backend '{backend}', valid options are {list(VIDEO_DECODERS)}.")
         parent = None
         if isinstance(path, str) and Path(path).suffix in {".txt", ".csv"}:  # txt/csv file with source paths
             parent, content = Path(path).parent, Path(path).read_text()
@@ -386,6 +653,9 @@ class LoadImagesAndVideos:
         self.vid_stride = vid_stride  # video frame-rate stride
         self.bs = batch
         self.cv2_flag = cv2.IMREAD_GRAYSCALE if channels == 1 else cv2.IMREAD_COLOR  # grayscale or color (BGR)
+        self.channels = channels
+        self.decoder = VIDEO_DECODERS[backend]
+        self.scale = scale
         if any(videos):
             self._new_video(videos[0])  # new video
         else:
@@ -411,30 +681,18 @@ class LoadImagesAndVideos:
             path = self.files[self.count]
             if self.video_flag[self.count]:
                 self.mode = "video"
-                if not self.cap or not self.cap.isOpened():
+                if not self.cap or not self.cap.is_opened():
                     self._new_video(path)
 
-                success = False
-                for _ in range(self.vid_stride):
-                    success = self.cap.grab()
-                    if not success:
-                        break  # end of video or failure
-
+                success, im0 = self.cap.read()  # decoder skips vid_stride - 1 frames
                 if success:
-                    success, im0 = self.cap.retrieve()
-                    im0 = (
-                        cv2.cvtColor(im0, cv2.COLOR_BGR2GRAY)[..., None]
-                        if self.cv2_flag == cv2.IMREAD_GRAYSCALE
-                        else im0
-                    )
-                    if success:
-                        self.frame += 1
-                        paths.append(path)
-                        imgs.append(im0)
-                        info.append(f"video {self.count + 1}/{self.nf} (frame {self.frame}/{self.frames}) {path}: ")
-                        if self.frame == self.frames:  # end of video
-                            self.count += 1
-                            self.cap.release()
+                    self.frame += 1
+                    paths.append(path)
+                    imgs.append(im0)
+                    info.append(f"video {self.count + 1}/{self.nf} (frame {self.frame}/{self.frames}) {path}: ")
+                    if self.frame == self.frames:  # end of video
+                        self.count += 1
+                        self.cap.release()
                 else:
                     # Move to the next file if the current video ended or failed to open
                     self.count += 1
@@ -469,13 +727,13 @@ class LoadImagesAndVideos:
         return paths, imgs, info
 
     def _new_video(self, path: str):
-        """Create a new video capture object for the given path and initialize video-related attributes."""
+        """Create a new video decoder for the given path and initialize video-related attributes."""
         self.frame = 0
-        self.cap = cv2.VideoCapture(path)
-        self.fps = int(self.cap.get(cv2.CAP_PROP_FPS))
-        if not self.cap.isOpened():
+        self.cap = self.decoder(path, vid_stride=self.vid_stride, scale=self.scale, channels=self.channels)
+        self.fps = int(self.cap.fps)
+        if not self.cap.is_opened():
             raise FileNotFoundError(f"Failed to open video {path}")
-        self.frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT) / self.vid_stride)
+        self.frames = int(self.cap.frames / self.vid_stride)
 
     def __len__(self) -> int:
         """Return the number of files (images and videos) in the dataset."""
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import json
+import math
 import os
 import random
+import shutil
 import subprocess
+import tempfile
 import time
+import weakref
 import zipfile
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
@@ -23,6 +27,7 @@ from ultralytics.utils import (
     DATASETS_DIR,
     LOGGER,
     NUM_THREADS,
+    RANK,
     ROOT,
     SETTINGS_FILE,
     TQDM,
@@ -739,6 +744,378 @@ class HUBDatasetStats:
         return self.im_dir
 
 
+_ARENA_REFS: dict[Path, int] = {}  # live SharedImageCache objects per arena written by this process
+
+
+class SharedImageCache:
+    """A memory-mapped image arena shared zero-copy between DataLoader workers and DDP ranks.
+
+    Resized images are packed back to back into a single file, placed in RAM-backed /dev/shm where available, and
+    indexed by (offset, height, width, channels, original height, original width). Pickling only transfers the path and
+    index, so forked or spawned workers and DDP ranks on the same node map the same physical pages instead of each
+    holding a copy-on-write duplicate of the cache. Images are returned as read-only views into the mapping. The writing
+    process keeps the arena until all of its cache objects using it, including later attached ones, are collected.
+
+    Attributes:
+        path (Path): Path to the arena file.
+        index (np.ndarray): Image index with shape (n, 6) holding offset, h, w, c, h0 and w0 of each image.
+        dtype (np.dtype): Data type of the cached images.
+        nbytes (int): Number of bytes written to the arena.
+
+    Methods:
+        attach: Attach to a complete arena written by another process.
+        add: Append an image to the arena.
+        close: Finish writing and publish the index so other processes can attach.
+
+    Examples:
+        >>> cache = SharedImageCache("coco8-train-640", n=8)
+        >>> if not cache.attach():
+        ...     for i, im in enumerate(images):
+        ...         cache.add(i, im, im.shape[:2])
+        ...     cache.close()
+        >>> im, hw0, hw = cache[0]
+    """
+
+    def __init__(self, key: str, n: int):
+        """Initialize the arena for `n` images identified by `key`.
+
+        Args:
+            key (str): Identifier shared by all processes using the same cache, i.e. a hash of the dataset settings.
+            n (int): Number of images in the dataset.
+        """
+        owner = os.getppid() if RANK != -1 else os.getpid()  # DDP ranks on one node share the launcher process
+        self.path = Path(tempfile.gettempdir()) / f"ultralytics-{key[:16]}-{owner}.arena"
+        self.index = np.zeros((n, 6), dtype=np.int64)
+        self.dtype = np.dtype(np.uint8)
+        self.nbytes = 0
+        self._file = self._mmap = self._finalizer = None
+
+    @staticmethod
+    def _remove(path: Path):
+        """Remove an arena file and its index."""
+        for f in (path, path.with_suffix(".npz")):
+            try:
+                f.unlink(missing_ok=True)
+            except OSError:  # still mapped by another process on Windows
+                pass
+
+    @staticmethod
+    def _release(path: Path, pid: int):
+        """Drop one reference to arena `path` of process `pid`, removing the arena when the last one is released."""
+        if pid != os.getpid():
+            return
+        _ARENA_REFS[path] -= 1
+        if not _ARENA_REFS[path]:
+            del _ARENA_REFS[path]
+            SharedImageCache._remove(path)
+
+    def _acquire(self):
+        """Reference the arena so it is kept until this object is garbage collected."""
+        _ARENA_REFS[self.path] = _ARENA_REFS.get(self.path, 0) + 1
+        self._finalizer = weakref.finalize(self, self._release, self.path, os.getpid())
+
+    def attach(self) -> bool:
+        """Attach to a complete arena with the same key written by another process or dataset, returning success."""
+        shm = Path("/dev/shm") / self.path.name
+        if shm.with_suffix(".npz").exists():
+            self.path = shm
+        try:
+            with np.load(self.path.with_suffix(".npz")) as x:
+                index, dtype = x["index"], np.dtype(str(x["dtype"]))
+        except (OSError, KeyError, ValueError):
+            return False
+        if index.shape != self.index.shape:
+            return False
+        if self.path in _ARENA_REFS:  # written by this process, keep it while attached
+            self._acquire()
+        self.index, self.dtype, self.nbytes = index, dtype, self.path.stat().st_size
+        self._mmap = np.memmap(self.path, dtype=np.uint8, mode="r")  # map now, the mapping outlives a removal
+        return True
+
+    def add(self, i: int, im: np.ndarray, hw0: tuple[int, int]):
+        """Append image `i` with original size `hw0` to the arena."""
+        if self._file is None:  # first image, place the arena and remove arenas left by dead processes
+            shm, required = Path("/dev/shm"), 1.5 * im.nbytes * len(self.index)  # estimate with 50% safety margin
+            if shm.is_dir() and os.access(shm, os.W_OK) and shutil.disk_usage(shm).free > required:
+                self.path = shm / self.path.name  # RAM-backed, otherwise the OS page cache shares the temporary file
+            for f in self.path.parent.glob("ultralytics-*-*.arena"):
+                try:
+                    os.kill(int(f.stem.rsplit("-", 1)[-1]), 0)
+                except ProcessLookupError:
+                    self._remove(f)
+                except (OSError, ValueError):
+                    pass
+            self._file = open(self.path, "wb")
+            self._acquire()
+            self.dtype = im.dtype
+        if im.dtype != self.dtype:
+            raise TypeError(f"SharedImageCache expects {self.dtype} images, but image {i} is {im.dtype}")
+        pad = -self.nbytes % 64  # align images to 64 bytes
+        self._file.write(b"\0" * pad)
+        self.nbytes += pad
+        self.index[i] = (self.nbytes, *im.shape[:2], im.shape[2] if im.ndim == 3 else 1, *hw0)
+        self._file.write(np.ascontiguousarray(im).data)
+        self.nbytes += im.nbytes
+
+    def close(self):
+        """Finish writing the arena and publish its index, making it visible to attaching processes."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        f = self.path.with_suffix(".tmp.npz")
+        np.savez(f, index=self.index, dtype=np.array(self.dtype.str))
+        os.replace(f, self.path.with_suffix(".npz"))  # atomic publish
+
+    def __getitem__(self, i: int) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
+        """Return a read-only view of image `i` with its original and resized (h, w) sizes."""
+        if self._mmap is None:
+            self._mmap = np.memmap(self.path, dtype=np.uint8, mode="r")
+        o, h, w, c, h0, w0 = self.index[i].tolist()
+        return np.ndarray((h, w, c), dtype=self.dtype, buffer=self._mmap, offset=o), (h0, w0), (h, w)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return state for pickling without the open file, mapping or ownership, so workers remap the arena."""
+        return {**self.__dict__, "_file": None, "_mmap": None, "_finalizer": None}
+
+
+class DatasetPack:
+    """A single-file memory-mapped dataset pack that replaces per-image *.npy disk caches.
+
+    Decoded images are stored back to back and 64-byte aligned in one file, followed by a footer holding the image index
+    (offset, height, width, channels, original height, original width), the image file list and the verified labels.
+    Opening a pack reads only the footer, so datasets start without listing image directories, hashing label files or
+    calling stat() on every file, and images are returned as read-only views into a single mapping with good page-cache
+    locality. Packs are built once with 'yolo data pack' and are not revalidated against the source files, so rebuild
+    them whenever images or labels change.
+
+    Attributes:
+        path (Path): Path to the pack file.
+        index (np.ndarray): Image index with shape (n, 6) holding offset, h, w, c, h0 and w0 of each image.
+        dtype (np.dtype): Data type of the stored images.
+        im_files (list[str]): Image file paths in pack order.
+        labels (list[dict]): Verified label dictionaries in pack order.
+        meta (dict): Pack settings such as task, imgsz and channels.
+        files (dict[str, int]): Mapping from image file path to pack index.
+
+    Methods:
+        path_for: Return the pack path for a dataset image path.
+        load: Load the pack for a dataset image path, returning None with a warning if unavailable.
+        create: Build a pack from image files and labels.
+
+    Examples:
+        >>> pack = DatasetPack.create("train.pack", im_files, labels, imgsz=640, task="detect", channels=3)
+        >>> im, hw0, hw = pack[im_files[0]]
+    """
+
+    magic = b"YOLOPACK"
+    version = "1.0.0"
+
+    def __init__(self, path: str | Path):
+        """Open a dataset pack and read its footer.
+
+        Args:
+            path (str | Path): Path to the pack file.
+
+        Raises:
+            FileNotFoundError: If the pack does not exist.
+            ValueError: If the file is not a dataset pack or was written by an incompatible version.
+        """
+        import gc
+
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            f.seek(-16, os.SEEK_END)
+            offset, magic = int.from_bytes(f.read(8), "little"), f.read(8)
+            if magic != self.magic:
+                raise ValueError(f"{self.path} is not a dataset pack")
+            f.seek(offset)
+            gc.disable()  # reduce pickle load time
+            meta = np.load(f, allow_pickle=True).item()
+            gc.enable()
+        if meta.pop("version", None) != self.version:
+            raise ValueError(f"{self.path} was written by an incompatible version, rebuild it with 'yolo data pack'")
+        self.index, self.im_files, self.labels = meta.pop("index"), meta.pop("im_files"), meta.pop("labels")
+        self.dtype = np.dtype(meta.pop("dtype"))
+        self.meta = meta
+        self.files = {f: i for i, f in enumerate(self.im_files)}
+        self._mmap = None
+
+    @staticmethod
+    def path_for(img_path: str | Path | list[str]) -> Path:
+        """Return the pack path next to a dataset image directory or list file, i.e. 'images/train.pack'."""
+        if isinstance(img_path, (list, tuple)):  # multiple sources share one pack named by their hash
+            return Path(img_path[0]).parent / f"{get_hash([str(p) for p in img_path])[:16]}.pack"
+        p = Path(img_path)
+        return p.with_name(f"{p.name}.pack")
+
+    @classmethod
+    def load(cls, img_path: str | Path | list[str], channels: int = 3, prefix: str = "") -> DatasetPack | None:
+        """Load the pack for a dataset image path, returning None with a warning if it is missing or incompatible.
+
+        Args:
+            img_path (str | Path | list[str]): Dataset image directory, list file or list of them.
+            channels (int): Number of image channels the dataset expects.
+            prefix (str): Prefix to print in log messages.
+
+        Returns:
+            (DatasetPack | None): The loaded pack, or None if images should be read from the source files instead.
+        """
+        f = cls.path_for(img_path)
+        try:
+            pack = cls(f)
+            assert pack.meta["channels"] == channels, f"pack has {pack.meta['channels']} channels, expected {channels}"
+        except (OSError, ValueError, AssertionError, KeyError) as e:
+            LOGGER.warning(
+                f"{prefix}Dataset pack {f} not loaded ({e}), reading images from files instead. "
+                "Build packs with 'yolo data pack data=path/to/data.yaml'."
+            )
+            return None
+        LOGGER.info(f"{prefix}Loaded dataset pack {f} ({len(pack)} images, {pack.nbytes / (1 << 30):.1f}GB)")
+        return pack
+
+    @classmethod
+    def create(
+        cls,
+        path: str | Path,
+        im_files: list[str],
+        labels: list[dict],
+        imgsz: int = 640,
+        flags: int = cv2.IMREAD_COLOR,
+        short_side: bool = False,
+        prefix: str = "",
+        **meta,
+    ) -> DatasetPack:
+        """Build a dataset pack from image files and their labels.
+
+        Images larger than `imgsz` are downscaled while keeping their aspect ratio, using the same resize as
+        `BaseDataset.load_image` so packed images are identical to resized source images when trained at `imgsz`.
+
+        Args:
+            path (str | Path): Output pack path.
+            im_files (list[str]): Image file paths.
+            labels (list[dict]): Label dictionary of each image.
+            imgsz (int): Maximum stored image size, 0 to store images at their original size.
+            flags (int): OpenCV flag for reading images.
+            short_side (bool): Limit the short image side to `imgsz` instead of the long side, i.e. for classification.
+            prefix (str): Prefix to print in log messages.
+            **meta (Any): Additional settings stored in the pack footer, i.e. task and channels.
+
+        Returns:
+            (DatasetPack): The opened pack.
+        """
+        from ultralytics.utils.patches import imread
+
+        def read(f: str) -> tuple[np.ndarray, tuple[int, int]]:
+            """Read image `f` and downscale it to at most `imgsz`."""
+            im = imread(f, flags=flags)
+            if im is None:
+                raise FileNotFoundError(f"Image Not Found {f}")
+            h0, w0 = im.shape[:2]
+            r = imgsz / (min(h0, w0) if short_side else max(h0, w0)) if imgsz else 1
+            if r < 1:
+                w, h = math.ceil(w0 * r), math.ceil(h0 * r)
+                if not short_side:
+                    w, h = min(w, imgsz), min(h, imgsz)
+                im = cv2.resize(im, (w, h), interpolation=cv2.INTER_LINEAR)
+            return im, (h0, w0)
+
+        path = Path(path)
+        tmp, index, dtype, nbytes = path.with_suffix(".tmp"), np.zeros((len(im_files), 6), dtype=np.int64), None, 0
+        with open(tmp, "wb") as file, ThreadPool(NUM_THREADS) as pool:
+            pbar = TQDM(enumerate(pool.imap(read, im_files)), total=len(im_files))
+            for i, (im, hw0) in pbar:
+                if dtype is None:
+                    dtype = im.dtype
+                elif im.dtype != dtype:
+                    raise TypeError(f"DatasetPack expects {dtype} images, but {im_files[i]} is {im.dtype}")
+                pad = -nbytes % 64  # align images to 64 bytes
+                file.write(b"\0" * pad)
+                index[i] = (nbytes + pad, *im.shape[:2], im.shape[2] if im.ndim == 3 else 1, *hw0)
+                file.write(np.ascontiguousarray(im).data)
+                nbytes += pad + im.nbytes
+                pbar.desc = f"{prefix}Packing images ({nbytes / (1 << 30):.1f}GB)"
+            pbar.close()
+            footer = {
+                "index": index,
+                "im_files": list(im_files),
+                "labels": labels,
+                "dtype": np.dtype(np.uint8 if dtype is None else dtype).str,
+                "imgsz": imgsz,
+                "version": cls.version,
+                **meta,
+            }
+            file.write(b"\0" * (-nbytes % 64))
+            offset = nbytes + (-nbytes % 64)
+            np.save(file, footer)
+            file.write(offset.to_bytes(8, "little") + cls.magic)
+        os.replace(tmp, path)  # atomic publish
+        LOGGER.info(f"{prefix}New dataset pack created: {path}")
+        return cls(path)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the pack file in bytes."""
+        return self.path.stat().st_size
+
+    def __len__(self) -> int:
+        """Return the number of images in the pack."""
+        return len(self.index)
+
+    def __getitem__(self, i: int | str) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
+        """Return a read-only view of image `i`, given by index or file path, with its original and stored (h, w)."""
+        if self._mmap is None:
+            self._mmap = np.memmap(self.path, dtype=np.uint8, mode="r")
+        o, h, w, c, h0, w0 = self.index[self.files[i] if isinstance(i, str) else i].tolist()
+        return np.ndarray((h, w, c), dtype=self.dtype, buffer=self._mmap, offset=o), (h0, w0), (h, w)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return state for pickling without the mapping, so DataLoader workers remap the pack."""
+        return {**self.__dict__, "_mmap": None}
+
+
+def pack_dataset(data: str, task: str = "detect", imgsz: int = 640) -> list[Path]:
+    """Build a dataset pack for every split of a dataset, read by datasets created with cache='pack'.
+
+    Labels are verified once through the regular dataset scan and stored in the pack together with the decoded images,
+    so later training runs need neither the per-image files nor the labels.cache file.
+
+    Args:
+        data (str): Dataset YAML for detect, segment, pose and OBB tasks, or dataset directory for classification.
+        task (str): Dataset task, one of 'detect', 'segment', 'pose', 'obb' or 'classify'.
+        imgsz (int): Maximum stored image size, should match the training image size.
+
+    Returns:
+        (list[Path]): Paths to the created packs.
+
+    Examples:
+        >>> from ultralytics.data.utils import pack_dataset
+        >>> pack_dataset("coco8.yaml", imgsz=640)
+    """
+    from ultralytics.cfg import get_cfg
+    from ultralytics.data.dataset import ClassificationDataset, YOLODataset
+    from ultralytics.utils import DEFAULT_CFG
+
+    data_dict = check_cls_dataset(data) if task == "classify" else check_det_dataset(data)
+    packs = []
+    for split in ("train", "val", "test"):
+        img_path = data_dict.get(split)
+        if not img_path or DatasetPack.path_for(img_path) in packs:  # missing or shared with a packed split
+            continue
+        if task == "classify":  # ClassificationDataset applies colorstr(f"{prefix}: ") to its prefix itself
+            dataset = ClassificationDataset(str(img_path), get_cfg(DEFAULT_CFG, {"imgsz": imgsz}), prefix=split)
+            im_files = [f for f, *_ in dataset.samples]
+            labels = [{"im_file": f, "cls": j} for f, j, *_ in dataset.samples]
+            flags, channels = cv2.IMREAD_COLOR, 3
+        else:
+            prefix = colorstr(f"{split}: ")
+            dataset = YOLODataset(img_path, imgsz=imgsz, augment=False, prefix=prefix, data=data_dict, task=task)
+            im_files, labels, flags, channels = dataset.im_files, dataset.labels, dataset.cv2_flag, dataset.channels
+        f, prefix = DatasetPack.path_for(img_path), dataset.prefix  # colorstr(f"{split}: ") for both tasks
+        DatasetPack.create(f, im_files, labels, imgsz, flags, task == "classify", prefix, task=task, channels=channels)
+        packs.append(f)
+    return packs
+
+
 def compress_one_image(f: str, f_new: str | None = None, max_dim: int = 1920, quality: int = 50):
     """Compress a single image file to reduced size while preserving its aspect ratio and quality using either the
     Python Imaging Library (PIL) or OpenCV library. If the input image is smaller than the maximum dimension, it
@@ -796,3 +1173,106 @@ def save_dataset_cache_file(prefix: str, path: Path, x: dict, version: str):
         LOGGER.info(f"{prefix}New cache created: {path}")
     else:
         LOGGER.warning(f"{prefix}Cache directory {path.parent} is not writable, cache not saved.")
+
+
+class LabelCache:
+    """An append-only label cache holding one verification result per image, keyed by file size and modification time.
+
+    The cache file starts with a header record holding the cache version and the verification settings, followed by
+    chunks of per-image entries appended by each scan. Later entries supersede earlier ones, so adding or changing files
+    only verifies and appends those files instead of rewriting the whole cache. Entries of files missing from the
+    current dataset are kept, so image lists sharing a labels directory (i.e. train.txt and val.txt) share one cache.
+    The file is compacted once it has too many chunks or superseded records dominate, dropping deleted images.
+
+    Attributes:
+        path (Path): Path to the cache file.
+        key (tuple): Verification settings the entries are valid for.
+        entries (dict[str, tuple]): Mapping from image file to its (signature, result) entry.
+        chunks (int): Number of records in the cache file, used to decide when to compact it.
+        records (int): Number of entries stored across all chunks, including superseded ones.
+
+    Methods:
+        load: Load all entries from the cache file.
+        append: Append new entries to the cache file.
+        signature: Return the size and modification time signature of an image-label pair.
+
+    Examples:
+        >>> cache = LabelCache(Path("labels.cache"), key=(False, 80, 0, 0, False))
+        >>> entries = cache.load()
+        >>> cache.append({"image.jpg": (LabelCache.signature(("image.jpg", "image.txt")), result)})
+    """
+
+    version = "2.0.0"
+    max_chunks = 32  # compact the file into a single chunk once this many records were appended
+
+    def __init__(self, path: Path, key: tuple):
+        """Initialize the cache at `path` for entries verified with settings `key`."""
+        self.path = Path(path)
+        self.key = key
+        self.entries = {}
+        self.chunks = 0
+        self.records = 0
+
+    def load(self) -> dict[str, tuple]:
+        """Load all entries from the cache file, returning an empty dict if it is missing, stale or corrupt."""
+        import gc
+        import pickle
+
+        self.entries, self.chunks, self.records = {}, 0, 0
+        gc.disable()  # reduce pickle load time
+        try:
+            with open(self.path, "rb") as f:
+                header = pickle.load(f)
+                if header != {"version": self.version, "key": self.key}:
+                    return self.entries
+                while True:
+                    try:
+                        chunk = pickle.load(f)
+                    except EOFError:
+                        break
+                    self.entries.update(chunk)
+                    self.chunks += 1
+                    self.records += len(chunk)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError, ModuleNotFoundError):
+            self.entries, self.chunks, self.records = {}, 0, 0  # unreadable or truncated, start over
+        finally:
+            gc.enable()
+        return self.entries
+
+    def append(self, entries: dict[str, tuple], prefix: str = ""):
+        """Append `entries` to the cache file, compacting it into one chunk when new, too long or mostly superseded.
+
+        Compaction drops entries of images that no longer exist.
+        """
+        import pickle
+
+        self.entries.update(entries)
+        self.records += len(entries)
+        if not is_dir_writeable(self.path.parent):
+            LOGGER.warning(f"{prefix}Cache directory {self.path.parent} is not writable, cache not saved.")
+            return
+        if self.chunks and self.chunks < self.max_chunks and self.records - len(self.entries) <= len(self.entries):
+            with open(self.path, "ab") as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self.chunks += 1
+            return
+        self.entries = {f: e for f, e in self.entries.items() if f in entries or os.path.isfile(f)}  # prune deleted
+        tmp = self.path.with_suffix(".cache.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": self.version, "key": self.key}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path)  # atomic replace
+        self.chunks, self.records = 1, len(self.entries)
+        LOGGER.info(f"{prefix}New cache created: {self.path}")
+
+    @staticmethod
+    def signature(files: tuple[str, ...]) -> tuple:
+        """Return the (size, modification time) signature of each file in `files`, None for missing files."""
+        sig = []
+        for f in files:
+            try:
+                s = os.stat(f)
+                sig.append((s.st_size, s.st_mtime_ns))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
@@ -629,10 +629,14 @@ class Model(torch.nn.Module):
                 - half (bool): Whether to use half-precision (FP16) mode.
                 - int8 (bool): Whether to use int8 precision mode.
                 - device (str): Device to run the benchmark on (e.g., 'cpu', 'cuda').
+                - blocks (str | list[str]): Profile individual model blocks by class name (or 'all') instead of
+                  export formats, see `ProfileBlocks`.
+                - blocks_baseline (str): Previous block benchmark JSON to check for latency regressions against.
+                - blocks_tolerance (float): Allowed fractional block latency increase over `blocks_baseline`.
 
         Returns:
-            (dict): A dictionary containing the results of the benchmarking process, including metrics for different
-                export formats.
+            (dict | list[dict]): A dictionary containing the results of the benchmarking process, including metrics for
+                different export formats, or a list of per-block results if `blocks` is set.
 
         Raises:
             AssertionError: If the model is not a PyTorch model.
@@ -641,14 +645,24 @@ class Model(torch.nn.Module):
             >>> model = YOLO("yolo11n.pt")
             >>> results = model.benchmark(data="coco8.yaml", imgsz=640, half=True)
             >>> print(results)
+            >>> blocks = YOLO("yolo11-pconv.yaml").benchmark(blocks="C3_PConv,SPPF", blocks_baseline="blocks.json")
         """
         self._check_is_pytorch_model()
-        from ultralytics.utils.benchmarks import benchmark
+        from ultralytics.utils.benchmarks import ProfileBlocks, benchmark
 
         from .exporter import export_formats
 
         custom = {"verbose": False}  # method defaults
         args = {**DEFAULT_CFG_DICT, **self.model.args, **custom, **kwargs, "mode": "benchmark"}
+        if args["blocks"]:  # microbenchmark individual model blocks instead of export formats
+            return ProfileBlocks(
+                self.model,
+                blocks=args["blocks"],
+                imgsz=args["imgsz"],
+                device=args["device"],
+                baseline=args["blocks_baseline"],
+                tolerance=args["blocks_tolerance"],
+            ).run()
         fmts = export_formats()
         export_args = set(dict(zip(fmts["Argument"], fmts["Arguments"])).get(format, [])) - {"batch"}
         export_kwargs = {k: v for k, v in args.items() if k in export_args}
@@ -36,6 +36,7 @@ Usage - formats:
 from __future__ import annotations
 
 import platform
+import queue
 import re
 import threading
 from pathlib import Path
@@ -52,7 +53,7 @@ from ultralytics.nn.autobackend import AutoBackend
 from ultralytics.utils import DEFAULT_CFG, LOGGER, MACOS, WINDOWS, callbacks, colorstr, ops
 from ultralytics.utils.checks import check_imgsz, check_imshow
 from ultralytics.utils.files import increment_path
-from ultralytics.utils.torch_utils import attempt_compile, select_device, smart_inference_mode
+from ultralytics.utils.torch_utils import LayerProfiler, attempt_compile, select_device, smart_inference_mode
 
 STREAM_WARNING = """
 Inference results will accumulate in RAM unless `stream=True` is passed, which can cause out-of-memory errors for large
@@ -87,19 +88,25 @@ class BasePredictor:
         seen (int): Number of images processed.
         windows (list[str]): List of window names for visualization.
         batch (tuple): Current batch data.
+        source_state (dict[str, Any] | None): Source mode, count and fps captured when the current batch was read.
         results (list[Any]): Current batch results.
         transforms (callable): Image transforms for classification.
         callbacks (dict[str, list[callable]]): Callback functions for different events.
         txt_path (Path): Path to save text results.
+        layer_profiler (LayerProfiler | None): Per-layer latency collector used when `profile_layers=True`.
+        input_buffers (dict[tuple, torch.Tensor | np.ndarray]): Reusable letterbox and input batch buffers by shape.
         _lock (threading.Lock): Lock for thread-safe inference.
+        _local (threading.local): Per-thread state, i.e. Detect input features captured for tracker ReID.
 
     Methods:
         preprocess: Prepare input image before inference.
+        pre_transform_into: Letterbox images into a reusable uint8 input tensor.
         inference: Run inference on a given image.
         postprocess: Process raw predictions into structured results.
         predict_cli: Run prediction for command line interface.
         setup_source: Set up input source and inference mode.
         stream_inference: Stream inference on input source.
+        pipeline_stages: Run preprocess and inference on worker threads for pipelined prediction.
         setup_model: Initialize and configure the model.
         write_results: Write inference results to files.
         save_predicted_images: Save prediction visualizations.
@@ -141,13 +148,35 @@ class BasePredictor:
         self.seen = 0
         self.windows = []
         self.batch = None
+        self.source_state = None
         self.results = None
         self.transforms = None
         self.callbacks = _callbacks or callbacks.get_default_callbacks()
         self.txt_path = None
+        self.layer_profiler = None
+        self.input_buffers = {}
         self._lock = threading.Lock()  # for automatic thread-safe inference
+        self._local = threading.local()  # pipeline=True runs inference on a worker thread
         callbacks.add_integration_callbacks(self)
 
+    @property
+    def _feats(self) -> list[torch.Tensor] | None:
+        """Detect layer input features captured by the tracker ReID hook for the batch of the current thread."""
+        return getattr(self._local, "feats", None)
+
+    @_feats.setter
+    def _feats(self, feats: list[torch.Tensor] | None):
+        """Store Detect layer input features for the current thread."""
+        self._local.feats = feats
+
+    def get_source_state(self) -> dict[str, Any]:
+        """Return the dataset mode, count and fps right after a batch is read, so results are written with its state."""
+        return {
+            "mode": self.dataset.mode,
+            "count": getattr(self.dataset, "count", 0),
+            "fps": getattr(self.dataset, "fps", 30),
+        }
+
     def preprocess(self, im: torch.Tensor | list[np.ndarray]) -> torch.Tensor:
         """Prepare input image before inference.
 
@@ -159,12 +188,7 @@ class BasePredictor:
         """
         not_tensor = not isinstance(im, torch.Tensor)
         if not_tensor:
-            im = np.stack(self.pre_transform(im))
-            if im.shape[-1] == 3:
-                im = im[..., ::-1]  # BGR to RGB
-            im = im.transpose((0, 3, 1, 2))  # BHWC to BCHW, (n, 3, h, w)
-            im = np.ascontiguousarray(im)  # contiguous
-            im = torch.from_numpy(im)
+            im = self.pre_transform_into(im)  # reused uint8 buffer, copied by the dtype conversion below
 
         im = im.to(self.device)
         im = im.half() if self.model.fp16 else im.float()  # uint8 to fp16/32
@@ -190,15 +214,86 @@ class BasePredictor:
         Returns:
             (list[np.ndarray]): List of transformed images.
         """
+        letterbox = self.get_letterbox(im)
+        return [letterbox(image=x) for x in im]
+
+    def get_letterbox(self, im: list[np.ndarray]) -> LetterBox:
+        """Return the LetterBox transform `pre_transform` applies to a batch of images."""
         same_shapes = len({x.shape for x in im}) == 1
-        letterbox = LetterBox(
+        return LetterBox(
             self.imgsz,
             auto=same_shapes
             and self.args.rect
             and (self.model.pt or (getattr(self.model, "dynamic", False) and not self.model.imx)),
             stride=self.model.stride,
         )
-        return [letterbox(image=x) for x in im]
+
+    def pre_transform_into(self, im: list[np.ndarray]) -> torch.Tensor:
+        """Letterbox images into a reusable uint8 (N, C, H, W) tensor, pinned when running on CUDA.
+
+        With the default `pre_transform`, each image is resized straight into a padded scratch buffer. Otherwise the
+        `pre_transform` outputs are used. A single `cv2.split` per image then converts BGR to RGB and HWC to CHW while
+        writing into the batch buffer, so no per-batch arrays are allocated once buffers exist for a shape. The returned
+        tensor is overwritten by the next batch of the same shape and must be copied before it is kept.
+
+        Args:
+            im (list[np.ndarray]): List of BGR images with shape [(H, W, C) x N].
+
+        Returns:
+            (torch.Tensor): RGB uint8 tensor of shape (N, C, H, W).
+        """
+        if type(self).pre_transform is BasePredictor.pre_transform:
+            letterbox = self.get_letterbox(im)
+            params = [letterbox.get_params(x.shape[:2]) for x in im]
+            (nw, nh), _, (top, bottom, left, right) = params[0]
+            h, w, c = nh + top + bottom, nw + left + right, im[0].shape[2] if im[0].ndim == 3 else 1
+        else:
+            params, im = None, self.pre_transform(im)
+            h, w, c = im[0].shape if im[0].ndim == 3 else (*im[0].shape, 1)
+        batch = self.get_input_buffer((len(im), c, h, w))
+        out = batch.numpy()
+        for i, x in enumerate(im):
+            x = x if x.ndim == 3 else x[..., None]
+            if params is not None:  # resize into the padded scratch buffer
+                (nw, nh), _, (top, bottom, left, right) = params[i]
+                pad = self.get_input_buffer((nh + top + bottom, nw + left + right, x.shape[2]), scratch=True)
+                for region in pad[:top], pad[pad.shape[0] - bottom :], pad[:, :left], pad[:, pad.shape[1] - right :]:
+                    region[:] = letterbox.padding_value
+                roi = pad[top : top + nh, left : left + nw]
+                if x.shape[:2] != (nh, nw):
+                    cv2.resize(x, (nw, nh), dst=roi if c > 1 else roi[..., 0], interpolation=letterbox.interpolation)
+                else:
+                    roi[:] = x
+                x = pad
+            if x.shape != (h, w, c):
+                raise ValueError(
+                    f"All images in a batch must pre-transform to one shape, got {x.shape} != {(h, w, c)}."
+                )
+            planes = list(out[i])
+            cv2.split(x, planes[::-1] if c == 3 else planes)  # BGR to RGB and HWC to CHW in one pass
+        return batch
+
+    def get_input_buffer(self, shape: tuple[int, ...], scratch: bool = False) -> torch.Tensor | np.ndarray:
+        """Return the reusable uint8 buffer of a given shape, creating it on first use.
+
+        Args:
+            shape (tuple[int, ...]): Buffer shape.
+            scratch (bool): Whether to return a NumPy scratch array instead of an input batch tensor, which is allocated
+                in pinned memory on CUDA for faster host to device copies.
+
+        Returns:
+            (torch.Tensor | np.ndarray): Buffer of the requested shape with undefined contents.
+        """
+        key = (shape, scratch)
+        if key not in self.input_buffers:
+            if len(self.input_buffers) >= 8:  # bound memory when shapes keep changing, e.g. rect inference
+                self.input_buffers.pop(next(iter(self.input_buffers)))
+            if scratch:
+                self.input_buffers[key] = np.empty(shape, dtype=np.uint8)
+            else:
+                cuda = getattr(self.device, "type", None) == "cuda"
+                self.input_buffers[key] = torch.empty(shape, dtype=torch.uint8, pin_memory=cuda)
+        return self.input_buffers[key]
 
     def postprocess(self, preds, img, orig_imgs):
         """Post-process predictions for an image and return them."""
@@ -259,6 +354,10 @@ class BasePredictor:
             vid_stride=self.args.vid_stride,
             buffer=self.args.stream_buffer,
             channels=getattr(self.model, "ch", 3),
+            stream_batch=self.args.stream_batch,
+            stream_wait=self.args.stream_wait,
+            vid_backend=self.args.vid_backend,
+            vid_scale=self.args.vid_scale,
         )
         self.source_type = self.dataset.source_type
         if (
@@ -308,6 +407,10 @@ class BasePredictor:
                     imgsz=(1 if self.model.pt or self.model.triton else self.dataset.bs, self.model.ch, *self.imgsz)
                 )
                 self.done_warmup = True
+            self.setup_layer_profiler()
+            if self.args.pipeline and (self.args.embed or self.args.visualize):
+                LOGGER.warning("'pipeline=True' is not supported with 'embed' or 'visualize', running sequentially.")
+                self.args.pipeline = False
 
             self.seen, self.windows, self.batch = 0, [], None
             profilers = (
@@ -315,22 +418,32 @@ class BasePredictor:
                 ops.Profile(device=self.device),
                 ops.Profile(device=self.device),
             )
+            waits = (ops.Profile(), ops.Profile(), ops.Profile())  # queue wait per stage with pipeline=True
             self.run_callbacks("on_predict_start")
-            for batch in self.dataset:
-                self.batch = batch
-                self.run_callbacks("on_predict_batch_start")
-                paths, im0s, s = self.batch
-
-                # Preprocess
-                with profilers[0]:
-                    im = self.preprocess(im0s)
-
-                # Inference
-                with profilers[1]:
-                    preds = self.inference(im, *args, **kwargs)
-                    if self.args.embed:
-                        yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
-                        continue
+            stages = self.pipeline_stages(profilers, waits, *args, **kwargs) if self.args.pipeline else None
+            for batch in self.dataset if stages is None else stages:
+                if stages is not None:  # preprocess and inference already ran on the pipeline threads
+                    batch, self.source_state, im, preds, dt, layers, self._feats = batch
+                    self.batch = batch
+                    self.run_callbacks("on_predict_batch_start")
+                    paths, im0s, s = self.batch
+                else:
+                    self.batch, self.source_state = batch, self.get_source_state()
+                    self.run_callbacks("on_predict_batch_start")
+                    paths, im0s, s = self.batch
+
+                    # Preprocess
+                    with profilers[0]:
+                        im = self.preprocess(im0s)
+
+                    # Inference
+                    with profilers[1]:
+                        preds = self.inference(im, *args, **kwargs)
+                        if self.args.embed:
+                            yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
+                            continue
+                    dt = (profilers[0].dt, profilers[1].dt)
+                    layers = self.layer_profiler.last if self.layer_profiler is not None else None
 
                 # Postprocess
                 with profilers[2]:
@@ -343,10 +456,12 @@ class BasePredictor:
                     for i in range(n):
                         self.seen += 1
                         self.results[i].speed = {
-                            "preprocess": profilers[0].dt * 1e3 / n,
-                            "inference": profilers[1].dt * 1e3 / n,
+                            "preprocess": dt[0] * 1e3 / n,
+                            "inference": dt[1] * 1e3 / n,
                             "postprocess": profilers[2].dt * 1e3 / n,
                         }
+                        if layers is not None:
+                            self.results[i].speed["layers"] = {k: v / n for k, v in layers.items()}
                         if self.args.verbose or self.args.save or self.args.save_txt or self.args.show:
                             s[i] += self.write_results(i, Path(paths[i]), im, s)
                 except StopIteration:
@@ -358,6 +473,8 @@ class BasePredictor:
 
                 self.run_callbacks("on_predict_batch_end")
                 yield from self.results
+            if stages is not None:
+                stages.close()  # stop and join the pipeline threads if the loop exited early
 
         # Release assets
         for v in self.vid_writer.values():
@@ -374,12 +491,121 @@ class BasePredictor:
                 f"Speed: %.1fms preprocess, %.1fms inference, %.1fms postprocess per image at shape "
                 f"{(min(self.args.batch, self.seen), getattr(self.model, 'ch', 3), *im.shape[2:])}" % t
             )
+            if self.args.pipeline:
+                t = tuple(x.t / self.seen * 1e3 for x in waits)
+                LOGGER.info("Queue wait: %.1fms preprocess, %.1fms inference, %.1fms postprocess per image" % t)
+        if self.layer_profiler is not None and self.seen:
+            self.save_layer_profile()
         if self.args.save or self.args.save_txt or self.args.save_crop:
             nl = len(list(self.save_dir.glob("labels/*.txt")))  # number of labels
             s = f"\n{nl} label{'s' * (nl > 1)} saved to {self.save_dir / 'labels'}" if self.args.save_txt else ""
             LOGGER.info(f"Results saved to {colorstr('bold', self.save_dir)}{s}")
         self.run_callbacks("on_predict_end")
 
+    def pipeline_stages(self, profilers: tuple, waits: tuple, *args, **kwargs):
+        """Run preprocess and inference on worker threads connected by bounded queues for `pipeline=True`.
+
+        The source is read and preprocessed on one thread and the model runs on a second one, so batch N+1 is prepared
+        and inferred while the caller post-processes batch N. Every stage is a single thread consuming FIFO queues,
+        which keeps batches in source order. Time each stage spends blocked on its input or output queue is accumulated
+        in `waits`. The dataset state of each batch is captured by the reading thread, as the live dataset is already
+        a few batches ahead. Batches reach the caller, and `on_predict_batch_start` runs, after their preprocess and
+        inference.
+
+        Args:
+            profilers (tuple[ops.Profile]): Preprocess, inference and postprocess profilers, the first two are updated
+                by the worker threads.
+            waits (tuple[ops.Profile]): Queue wait profilers of the preprocess, inference and postprocess stages.
+            *args (Any): Additional arguments for the inference method.
+            **kwargs (Any): Additional keyword arguments for the inference method.
+
+        Yields:
+            batch (tuple): Source batch of (paths, im0s, s).
+            source_state (dict[str, Any]): Dataset mode, count and fps when this batch was read.
+            im (torch.Tensor): Preprocessed image tensor.
+            preds (Any): Raw model predictions.
+            dt (tuple[float, float]): Preprocess and inference time of this batch in seconds.
+            layers (dict | None): Per-layer latency of this batch in milliseconds when `profile_layers=True`.
+            feats (list[torch.Tensor] | None): Detect layer input features of this batch when hooked for tracker ReID.
+        """
+        stop, errors = threading.Event(), []
+        queues = (queue.Queue(maxsize=2), queue.Queue(maxsize=2))
+
+        def put(q, item, wait):
+            """Put `item` on `q` unless the pipeline is stopped, returning whether it was queued."""
+            with wait:
+                while not stop.is_set():
+                    try:
+                        q.put(item, timeout=0.1)
+                        return True
+                    except queue.Full:
+                        pass
+            return False
+
+        def get(q, wait):
+            """Get the next item from `q`, returning None at the end of the stream or when the pipeline is stopped."""
+            with wait:
+                while not stop.is_set():
+                    try:
+                        return q.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+            return None
+
+        def preprocess():
+            """Read and preprocess source batches."""
+            try:
+                for batch in self.dataset:
+                    state = self.get_source_state()
+                    with profilers[0]:
+                        im = self.preprocess(batch[1])
+                    if not put(queues[0], (batch, state, im, profilers[0].dt), waits[0]):
+                        return
+            except Exception as e:
+                errors.append(e)
+            put(queues[0], None, waits[0])
+
+        def inference():
+            """Run the model on preprocessed batches."""
+            try:
+                while (item := get(queues[0], waits[1])) is not None:
+                    batch, state, im, dt = item
+                    with profilers[1]:
+                        preds = self.inference(im, *args, **kwargs)
+                    layers = dict(self.layer_profiler.last) if self.layer_profiler is not None else None
+                    item = (
+                        batch,
+                        state,
+                        im,
+                        preds,
+                        (dt, profilers[1].dt),
+                        layers,
+                        self._feats,
+                    )  # this thread's features
+                    if not put(queues[1], item, waits[1]):
+                        return
+            except Exception as e:
+                errors.append(e)
+            put(queues[1], None, waits[1])
+
+        threads = [threading.Thread(target=self._run_stage, args=(f,), daemon=True) for f in (preprocess, inference)]
+        for t in threads:
+            t.start()
+        try:
+            while (item := get(queues[1], waits[2])) is not None:
+                yield item
+            if errors:
+                raise errors[0]
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
+
+    @smart_inference_mode()
+    def _run_stage(self, stage):
+        """Run a `pipeline=True` worker stage with the same inference mode as the calling thread."""
+        stage()
+
     def setup_model(self, model, verbose: bool = True):
         """Initialize YOLO model with given parameters and set it to evaluation mode.
 
@@ -395,6 +621,7 @@ class BasePredictor:
             fp16=self.args.half,
             fuse=True,
             verbose=verbose,
+            channels_last=self.args.channels_last,
         )
 
         self.device = self.model.device  # update device
@@ -404,6 +631,40 @@ class BasePredictor:
         self.model.eval()
         self.model = attempt_compile(self.model, device=self.device, mode=self.args.compile)
 
+    def setup_layer_profiler(self):
+        """Attach or detach the per-layer latency collector according to `profile_layers`.
+
+        Only PyTorch models built by `parse_model` expose their layers, other backends log a warning and are skipped.
+        Statistics accumulate across predict calls for as long as `profile_layers` stays enabled.
+        """
+        if not self.args.profile_layers:
+            if self.layer_profiler is not None:
+                self.layer_profiler.detach()
+                self.layer_profiler = None
+        elif self.layer_profiler is None:
+            model = getattr(self.model, "model", None)
+            if not (self.model.pt and isinstance(getattr(model, "model", None), torch.nn.Sequential)):
+                LOGGER.warning("'profile_layers=True' requires a PyTorch model with parse_model layers, ignoring.")
+                self.args.profile_layers = False
+                return
+            self.layer_profiler = LayerProfiler(model).attach()
+
+    def save_layer_profile(self):
+        """Log per-layer latency percentiles and export the Chrome trace to `save_dir/layers_trace.json` if saving."""
+        stats = self.layer_profiler.summary()
+        file = self.layer_profiler.export_chrome_trace(self.save_dir / "layers_trace.json") if self.args.save else None
+        if self.args.verbose:
+            LOGGER.info(
+                f"{'layer':>20s}{'calls':>8s}{'mean (ms)':>11s}{'p50':>8s}{'p90':>8s}{'p99':>8s}{'out (MB)':>10s}"
+            )
+            for k, v in stats.items():
+                LOGGER.info(
+                    f"{k:>20s}{v['calls']:>8d}{v['mean']:>11.2f}{v['p50']:>8.2f}{v['p90']:>8.2f}{v['p99']:>8.2f}"
+                    f"{v['output_MB']:>10.2f}"
+                )
+            if file:
+                LOGGER.info(f"Layer trace saved to {colorstr('bold', file)}")
+
     def write_results(self, i: int, p: Path, im: torch.Tensor, s: list[str]) -> str:
         """Write inference results to a file or directory.
 
@@ -421,12 +682,14 @@ class BasePredictor:
             im = im[None]  # expand for batch dim
         if self.source_type.stream or self.source_type.from_img or self.source_type.tensor:  # batch_size >= 1
             string += f"{i}: "
-            frame = self.dataset.count
+            frame = self.source_state["count"]
         else:
             match = re.search(r"frame (\d+)/", s[i])
             frame = int(match[1]) if match else None  # 0 if frame undetermined
 
-        self.txt_path = self.save_dir / "labels" / (p.stem + ("" if self.dataset.mode == "image" else f"_{frame}"))
+        self.txt_path = (
+            self.save_dir / "labels" / (p.stem + ("" if self.source_state["mode"] == "image" else f"_{frame}"))
+        )
         string += "{:g}x{:g} ".format(*im.shape[2:])
         result = self.results[i]
         result.save_dir = self.save_dir.__str__()  # used in other locations
@@ -464,8 +727,9 @@ class BasePredictor:
         im = self.plotted_img
 
         # Save videos and streams
-        if self.dataset.mode in {"stream", "video"}:
-            fps = self.dataset.fps if self.dataset.mode == "video" else 30
+        mode = self.source_state["mode"]
+        if mode in {"stream", "video"}:
+            fps = self.source_state["fps"] if mode == "video" else 30
             frames_path = self.save_dir / f"{save_path.stem}_frames"  # save frames to a separate directory
             if save_path not in self.vid_writer:  # new video
                 if self.args.save_frames:
@@ -495,7 +759,9 @@ class BasePredictor:
             cv2.namedWindow(p, cv2.WINDOW_NORMAL | cv2.WINDOW_KEEPRATIO)  # allow window resize (Linux)
             cv2.resizeWindow(p, im.shape[1], im.shape[0])  # (width, height)
         cv2.imshow(p, im)
-        if cv2.waitKey(300 if self.dataset.mode == "image" else 1) & 0xFF == ord("q"):  # 300ms if image; else 1ms
+        if cv2.waitKey(300 if self.source_state["mode"] == "image" else 1) & 0xFF == ord(
+            "q"
+        ):  # 300ms if image; else 1ms
             raise StopIteration
 
     def run_callbacks(self, event: str):
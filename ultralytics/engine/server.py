@@ -0,0 +1,384 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+"""
+Serve one or more models from a local socket and batch concurrent requests.
+
+Usage - Python:
+    from ultralytics.engine.server import InferenceClient, InferenceServer
+
+    with InferenceServer({"base": "yolo11n.pt", "pconv": "yolo11-pconv.pt"}, address="/tmp/yolo.sock"):
+        with InferenceClient("/tmp/yolo.sock") as client:
+            response = client.predict("bus.jpg", model="pconv", conf=0.3)
+            metrics = client.metrics()
+
+Protocol:
+    Every message is an 8-byte big-endian header (JSON length, payload length), a UTF-8 JSON object and an optional
+    binary payload. Requests carry an 'op' of 'predict', 'metrics' or 'models'. Predict payloads are encoded image
+    bytes (JPEG, PNG, ...) or a raw uint8 array described by the 'shape' key. Responses are JSON without payload and
+    contain an 'error' key on failure.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import cv2
+import numpy as np
+
+from ultralytics.utils import DEFAULT_CFG_DICT, LOGGER, colorstr
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+HEADER = struct.Struct("!II")  # JSON length, payload length
+PREDICT_ARGS = {  # per-request predict arguments and their defaults, requests with equal arguments are batched together
+    "conf": 0.25,
+    "iou": DEFAULT_CFG_DICT["iou"],
+    "imgsz": DEFAULT_CFG_DICT["imgsz"],
+    "max_det": DEFAULT_CFG_DICT["max_det"],
+    "classes": DEFAULT_CFG_DICT["classes"],
+    "agnostic_nms": DEFAULT_CFG_DICT["agnostic_nms"],
+}
+REQUEST_ERRORS = (ValueError, TypeError, KeyError, IndexError, RuntimeError, OSError, cv2.error)  # sent to the client
+
+
+def encode_message(header: dict[str, Any], payload: bytes = b"") -> bytes:
+    """Encode a JSON header and binary payload into a length-prefixed message."""
+    data = json.dumps(header).encode()
+    return HEADER.pack(len(data), len(payload)) + data + payload
+
+
+class InferenceServer:
+    """Local inference server holding several models and coalescing concurrent requests into batches.
+
+    Each model has its own request queue, a batching task that waits up to `max_wait` seconds for up to `max_batch`
+    requests with identical predict arguments, and a single worker thread running `Model.predict` on the batch, so
+    different models run concurrently while each model stays single-caller. The server listens on a Unix domain
+    socket when `address` is a path and on TCP when it is a (host, port) tuple.
+
+    Attributes:
+        models (dict[str, Model]): Served models by name.
+        address (str | tuple[str, int]): Socket path or bound (host, port), with the actual port after start.
+        max_batch (int): Maximum number of images per batch. Use 1 for exported models with a static batch size.
+        max_wait (float): Seconds to wait for more requests after the first one of a batch.
+        stats (dict[str, dict]): Per-model request, batch and latency counters.
+
+    Methods:
+        serve: Run the server until `stop` is called.
+        start: Run the server on a background thread and return once it accepts connections.
+        stop: Stop a server started with `start`.
+        metrics: Return queue depth, batch size and latency metrics per model.
+
+    Examples:
+        >>> server = InferenceServer({"n": "yolo11n.pt"}, address=("127.0.0.1", 0)).start()
+        >>> with InferenceClient(server.address) as client:
+        ...     response = client.predict(np.zeros((640, 640, 3), dtype=np.uint8))
+        >>> server.stop()
+    """
+
+    def __init__(
+        self,
+        models: dict[str, Any],
+        address: str | Path | tuple[str, int] = ("127.0.0.1", 8765),
+        max_batch: int = 8,
+        max_wait: float = 0.005,
+        verbose: bool = True,
+    ):
+        """Initialize the server and load its models.
+
+        Args:
+            models (dict[str, Any]): Model names mapped to model files, YAML configs or loaded `Model` instances.
+            address (str | Path | tuple[str, int]): Unix domain socket path or TCP (host, port), port 0
+                picks a free one.
+            max_batch (int): Maximum number of images per batch.
+            max_wait (float): Seconds to wait for more requests after the first one of a batch.
+            verbose (bool): Whether to log server events.
+        """
+        from ultralytics import YOLO
+        from ultralytics.engine.model import Model
+
+        if not models:
+            raise ValueError("InferenceServer requires at least one model.")
+        self.models = {k: m if isinstance(m, Model) else YOLO(m) for k, m in models.items()}
+        self.address = str(address) if isinstance(address, (str, Path)) else tuple(address)
+        self.max_batch = max(int(max_batch), 1)
+        self.max_wait = max_wait
+        self.verbose = verbose
+        self.stats = {k: {"requests": 0, "batches": 0, "errors": 0, "latency": deque(maxlen=1000)} for k in self.models}
+        self.queues, self.executors, self.thread, self.loop, self.stopped = {}, {}, None, None, None
+
+    async def serve(self, ready: threading.Event | None = None):
+        """Run the server until `stop` is called.
+
+        Args:
+            ready (threading.Event, optional): Event set once the server accepts connections.
+        """
+        self.loop, self.stopped = asyncio.get_running_loop(), asyncio.Event()
+        self.queues = {k: asyncio.Queue() for k in self.models}
+        self.executors = {k: ThreadPoolExecutor(1, thread_name_prefix=f"serve-{k}") for k in self.models}
+        batchers = [asyncio.ensure_future(self.batch_requests(k)) for k in self.models]
+        if isinstance(self.address, str):
+            if os.path.exists(self.address):
+                os.remove(self.address)  # stale socket from a previous run
+            server = await asyncio.start_unix_server(self.handle, path=self.address)
+        else:
+            server = await asyncio.start_server(self.handle, *self.address)
+            self.address = server.sockets[0].getsockname()[:2]
+        if self.verbose:
+            LOGGER.info(f"{colorstr('InferenceServer:')} serving {list(self.models)} at {self.address}")
+        if ready is not None:
+            ready.set()
+        try:
+            await self.stopped.wait()
+        finally:
+            server.close()  # open client connections are cancelled with the event loop
+            for task in batchers:
+                task.cancel()
+            for executor in self.executors.values():
+                executor.shutdown(wait=True)
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.remove(self.address)
+
+    def start(self) -> InferenceServer:
+        """Run the server on a background thread and return once it accepts connections."""
+        ready, errors = threading.Event(), []
+
+        def run():
+            """Run the event loop and record startup errors."""
+            try:
+                asyncio.run(self.serve(ready))
+            except OSError as e:  # i.e. address already in use
+                errors.append(e)
+            finally:
+                ready.set()
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        if self.loop is None or self.loop.is_closed():  # serve() exited before accepting connections
+            raise RuntimeError("InferenceServer failed to start, see the traceback above.")
+        return self
+
+    def stop(self):
+        """Stop a server started with `start`, letting batches already running on the model threads finish."""
+        if self.loop is not None and self.thread is not None:
+            self.loop.call_soon_threadsafe(self.stopped.set)
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self) -> Self:
+        """Start the server when entering a context."""
+        return self.start()
+
+    def __exit__(self, *args):
+        """Stop the server when leaving a context."""
+        self.stop()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer the requests of one client connection in order until it disconnects."""
+        try:
+            while True:
+                try:
+                    n, m = HEADER.unpack(await reader.readexactly(HEADER.size))
+                    header, payload = await reader.readexactly(n), await reader.readexactly(m)
+                except asyncio.IncompleteReadError:
+                    break  # client closed the connection
+                try:
+                    response = await self.dispatch(json.loads(header), payload)
+                except REQUEST_ERRORS as e:
+                    response = {"error": f"{type(e).__name__}: {e}"}
+                writer.write(encode_message(response))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def dispatch(self, header: dict[str, Any], payload: bytes) -> dict[str, Any]:
+        """Run a single request and return its JSON response."""
+        if not isinstance(header, dict):
+            raise TypeError(f"Request header must be a JSON object, not {type(header).__name__}.")
+        op = header.get("op", "predict")
+        if op == "models":
+            return {"models": list(self.models)}
+        if op == "metrics":
+            return self.metrics()
+        if op != "predict":
+            raise ValueError(f"Unknown op '{op}', valid ops are 'predict', 'metrics' and 'models'.")
+        name = header.get("model") or (next(iter(self.models)) if len(self.models) == 1 else None)
+        if name not in self.models:
+            raise KeyError(f"Unknown model '{name}', served models are {list(self.models)}.")
+        args = header.get("args", {})
+        if set(args) - set(PREDICT_ARGS):
+            raise KeyError(f"Unsupported predict arguments {sorted(set(args) - set(PREDICT_ARGS))}.")
+        key = json.dumps({**PREDICT_ARGS, **args}, sort_keys=True)  # requests with equal args share a batch
+        if "shape" in header:
+            im = np.frombuffer(payload, dtype=np.uint8).reshape(header["shape"])
+        else:
+            im = cv2.imdecode(np.frombuffer(payload, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if im is None:
+                raise ValueError("Could not decode the image payload.")
+        future = self.loop.create_future()
+        await self.queues[name].put((im, key, future, time.perf_counter()))
+        return await future
+
+    async def batch_requests(self, name: str):
+        """Form batches from the request queue of a model and run them on its worker thread."""
+        queue = self.queues[name]
+        while True:
+            items = [await queue.get()]
+            deadline = self.loop.time() + self.max_wait
+            while len(items) < self.max_batch:
+                if queue.empty():
+                    timeout = deadline - self.loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        items.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    items.append(queue.get_nowait())
+
+            groups = {}
+            for item in items:
+                groups.setdefault(item[1], []).append(item)
+            for key, group in groups.items():
+                job = self.loop.run_in_executor(
+                    self.executors[name], self.predict, name, [x[0] for x in group], json.loads(key)
+                )
+                await asyncio.wait([job])
+                if job.exception() is not None:  # forward any failure to the requests of this batch
+                    self.stats[name]["errors"] += len(group)
+                    for x in group:
+                        if not x[2].done():
+                            x[2].set_exception(job.exception())
+                    continue
+                responses, t = job.result(), time.perf_counter()
+                self.stats[name]["requests"] += len(group)
+                self.stats[name]["batches"] += 1
+                for x, response in zip(group, responses):
+                    self.stats[name]["latency"].append((t - x[3]) * 1e3)
+                    if not x[2].done():
+                        x[2].set_result(response)
+
+    def predict(self, name: str, images: list[np.ndarray], args: dict[str, Any]) -> list[dict[str, Any]]:
+        """Run one batch through a model and convert each result to a JSON-serializable response."""
+        results = self.models[name].predict(images, verbose=False, **args)
+        return [
+            {"model": name, "shape": list(r.orig_shape), "speed": r.speed, "results": r.summary(), "batch": len(images)}
+            for r in results
+        ]
+
+    def metrics(self) -> dict[str, Any]:
+        """Return queue depth, request and batch counts, mean batch size and latency percentiles per model."""
+        metrics = {}
+        for k, s in self.stats.items():
+            latency = np.array(s["latency"]) if s["latency"] else np.zeros(1)
+            metrics[k] = {
+                "queue_depth": self.queues[k].qsize() if k in self.queues else 0,
+                "requests": s["requests"],
+                "batches": s["batches"],
+                "errors": s["errors"],
+                "mean_batch": s["requests"] / max(s["batches"], 1),
+                **{f"latency_p{p}": float(np.percentile(latency, p)) for p in (50, 90, 99)},
+            }
+        return {"models": metrics}
+
+
+class InferenceClient:
+    """Blocking client for `InferenceServer`, one request at a time per connection.
+
+    Attributes:
+        sock (socket.socket): Connected socket.
+
+    Methods:
+        predict: Send an image and return the predictions.
+        metrics: Return the server metrics.
+        close: Close the connection.
+
+    Examples:
+        >>> with InferenceClient("/tmp/yolo.sock") as client:
+        ...     boxes = client.predict("bus.jpg", conf=0.3)["results"]
+    """
+
+    def __init__(self, address: str | Path | tuple[str, int], timeout: float | None = 60.0):
+        """Connect to a server.
+
+        Args:
+            address (str | Path | tuple[str, int]): Unix domain socket path or TCP (host, port).
+            timeout (float, optional): Socket timeout in seconds.
+        """
+        if isinstance(address, (str, Path)):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            address = str(address)
+        else:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            address = tuple(address)
+        self.sock.settimeout(timeout)
+        self.sock.connect(address)
+
+    def request(self, header: dict[str, Any], payload: bytes = b"") -> dict[str, Any]:
+        """Send a request and return the decoded response, raising `RuntimeError` on server errors."""
+        self.sock.sendall(encode_message(header, payload))
+        n, m = HEADER.unpack(self.recv(HEADER.size))
+        response = json.loads(self.recv(n))
+        self.recv(m)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response
+
+    def recv(self, n: int) -> bytes:
+        """Read exactly `n` bytes from the socket."""
+        buf = bytearray()
+        while len(buf) < n:
+            chunk = self.sock.recv(n - len(buf))
+            if not chunk:
+                raise ConnectionError("InferenceServer closed the connection.")
+            buf += chunk
+        return bytes(buf)
+
+    def predict(self, image: np.ndarray | bytes | str | Path, model: str | None = None, **kwargs) -> dict[str, Any]:
+        """Send an image and return its predictions.
+
+        Args:
+            image (np.ndarray | bytes | str | Path): BGR uint8 array, encoded image bytes or image file path.
+            model (str, optional): Served model name, optional if the server holds a single model.
+            **kwargs (Any): Predict arguments, i.e. conf, iou, imgsz, max_det, classes and agnostic_nms.
+
+        Returns:
+            (dict[str, Any]): Response with 'results' from `Results.summary()`, 'speed', 'shape' and the 'batch' size
+                the request was run in.
+        """
+        header = {"op": "predict", "model": model, "args": kwargs}
+        if isinstance(image, np.ndarray):
+            header["shape"] = list(image.shape)
+            payload = np.ascontiguousarray(image, dtype=np.uint8).tobytes()
+        else:
+            payload = image if isinstance(image, bytes) else Path(image).read_bytes()
+        return self.request(header, payload)
+
+    def metrics(self) -> dict[str, Any]:
+        """Return queue depth, batch size and latency metrics per model."""
+        return self.request({"op": "metrics"})["models"]
+
+    def close(self):
+        """Close the connection."""
+        self.sock.close()
+
+    def __enter__(self) -> Self:
+        """Return the connected client."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the connection when leaving a context."""
+        self.close()
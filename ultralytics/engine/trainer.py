@@ -14,6 +14,7 @@ import os
 import subprocess
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy, deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -179,6 +180,8 @@ class BaseTrainer:
             self.csv.unlink()
         self.plot_idx = [0, 1, 2]
         self.nan_recovery_attempts = 0
+        self.val_executor = None  # background validation thread (async_val)
+        self.val_job = None  # pending background validation, results are applied one epoch late
 
         # Callbacks
         self.callbacks = _callbacks or callbacks.get_default_callbacks()
@@ -370,6 +373,10 @@ class BaseTrainer:
         self.epoch_time_start = time.time()
         self.train_time_start = time.time()
         self.run_callbacks("on_train_start")
+        if self.args.async_val and self.world_size > 1:
+            LOGGER.warning("async_val is not supported for DDP training, validating synchronously.")
+        elif self.args.async_val and RANK in {-1, 0}:
+            self.val_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="async_val")
         LOGGER.info(
             f"Image sizes {self.args.imgsz} train, {self.args.imgsz} val\n"
             f"Using {self.train_loader.num_workers * (self.world_size or 1)} dataloader workers\n"
@@ -473,17 +480,33 @@ class BaseTrainer:
 
             # Validation
             final_epoch = epoch + 1 >= self.epochs
-            if self.args.val or final_epoch or self.stopper.possible_stop or self.stop:
+            if self.val_executor:
+                self.collect_validation()  # apply the previous snapshot's results, may set self.stop
+            self.fitness = None  # only set for epochs validated synchronously
+            val_due = self.args.val and (epoch + 1) % max(self.args.val_period, 1) == 0
+            if val_due or final_epoch or self.stopper.possible_stop or self.stop:
                 self._clear_memory(threshold=0.5)  # prevent VRAM spike
-                self.metrics, self.fitness = self.validate()
+                if self.val_executor and not (final_epoch or self.stop):
+                    self.validate_async()
+                else:
+                    self.metrics, self.fitness = self.validate()
 
             # NaN recovery
             if self._handle_nan_recovery(epoch):
+                if self.val_job:  # discard the background validation of the corrupted epoch once it has finished
+                    self.val_job["future"].result()
+                    self.val_job = None
                 continue
 
             self.nan_recovery_attempts = 0
             if RANK in {-1, 0}:
-                self.save_metrics(metrics={**self.label_loss_items(self.tloss), **self.metrics, **self.lr})
+                # Leave val metrics blank for epochs not validated here, async_val fills them in collect_validation()
+                val_metrics = self.metrics if self.fitness is not None else dict.fromkeys(self.metrics)
+                metrics = {**self.label_loss_items(self.tloss), **val_metrics, **self.lr}
+                if self.val_job and self.val_job["epoch"] == epoch:
+                    self.val_job["metrics"] = metrics  # saved once the background validation finishes
+                else:
+                    self.save_metrics(metrics=metrics)
                 self.stop |= self.stopper(epoch + 1, self.fitness) or final_epoch
                 if self.args.time:
                     self.stop |= (time.time() - self.train_time_start) > (self.args.time * 3600)
@@ -515,6 +538,10 @@ class BaseTrainer:
                 break  # must break all DDP ranks
             epoch += 1
 
+        if self.val_executor:
+            self.collect_validation()
+            self.val_executor.shutdown()
+            self.val_executor = None
         seconds = time.time() - self.train_time_start
         LOGGER.info(f"\n{epoch - self.start_epoch + 1} epochs completed in {seconds / 3600:.3f} hours.")
         # Do final val with best.pt
@@ -617,7 +644,9 @@ class BaseTrainer:
         # Save checkpoints
         self.wdir.mkdir(parents=True, exist_ok=True)  # ensure weights directory exists
         self.last.write_bytes(serialized_ckpt)  # save last.pt
-        if self.best_fitness == self.fitness:
+        if self.val_job and self.val_job["epoch"] == self.epoch:
+            self.val_job["ckpt"] = serialized_ckpt  # saved as best.pt if its background validation improves fitness
+        elif self.best_fitness == self.fitness:
             self.best.write_bytes(serialized_ckpt)  # save best.pt
         if (self.save_period > 0) and (self.epoch % self.save_period == 0):
             (self.wdir / f"epoch{self.epoch}.pt").write_bytes(serialized_ckpt)  # save epoch, i.e. 'epoch3.pt'
@@ -709,6 +738,38 @@ class BaseTrainer:
             self.best_fitness = fitness
         return metrics, fitness
 
+    def validate_async(self):
+        """Validate a snapshot of the EMA model in a background thread while training continues.
+
+        The validator runs on a shallow copy of the trainer holding a deep copy of the EMA model, so the next epoch can
+        update the live weights. Results are applied by `collect_validation()` at the end of the next epoch.
+        """
+        device = self.device if self.args.async_val is True else torch.device(self.args.async_val)
+        trainer = copy(self)
+        trainer.device, trainer.stopper = device, copy(self.stopper)
+        trainer.ema = copy(self.ema)
+        trainer.ema.ema = deepcopy(unwrap_model(self.ema.ema)).to(device)
+        trainer.ema.ema.criterion = None  # rebuilt on the validation device
+        self.val_job = {"epoch": self.epoch, "future": self.val_executor.submit(trainer.validate)}
+
+    def collect_validation(self):
+        """Wait for the pending background validation and apply its results to the trainer.
+
+        Saves the metrics row of the validated epoch, updates `best_fitness` and best.pt with the checkpoint saved at
+        that epoch, and updates EarlyStopping.
+        """
+        job, self.val_job = self.val_job, None
+        if job is None:
+            return
+        self.metrics, fitness = job["future"].result()
+        if not self.best_fitness or self.best_fitness < fitness:
+            self.best_fitness = fitness
+            if "ckpt" in job:
+                self.best.write_bytes(job["ckpt"])  # save best.pt
+        if "metrics" in job:
+            self.save_metrics(metrics={**job["metrics"], **self.metrics}, epoch=job["epoch"])
+        self.stop |= self.stopper(job["epoch"] + 1, fitness)
+
     def get_model(self, cfg=None, weights=None, verbose=True):
         """Get model and raise NotImplementedError for loading cfg files."""
         raise NotImplementedError("This task trainer doesn't support loading cfg files")
@@ -754,15 +815,16 @@ class BaseTrainer:
         """Plot training labels for YOLO model."""
         pass
 
-    def save_metrics(self, metrics):
-        """Save training metrics to a CSV file."""
+    def save_metrics(self, metrics, epoch=None):
+        """Save training metrics to a CSV file for the current epoch unless `epoch` is given, leaving None blank."""
         keys, vals = list(metrics.keys()), list(metrics.values())
         n = len(metrics) + 2  # number of cols
         t = time.time() - self.train_time_start
         self.csv.parent.mkdir(parents=True, exist_ok=True)  # ensure parent directory exists
         s = "" if self.csv.exists() else ("%s," * n % ("epoch", "time", *keys)).rstrip(",") + "\n"
+        vals = ["" if v is None else "%.6g" % v for v in ((self.epoch if epoch is None else epoch) + 1, t, *vals)]
         with open(self.csv, "a", encoding="utf-8") as f:
-            f.write(s + ("%.6g," * n % (self.epoch + 1, t, *vals)).rstrip(",") + "\n")
+            f.write(s + ",".join(vals) + "\n")
 
     def plot_metrics(self):
         """Plot metrics from a CSV file."""
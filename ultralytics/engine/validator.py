@@ -23,6 +23,9 @@ Usage - formats:
                           yolo11n_rknn_model         # Rockchip RKNN
 """
 
+from __future__ import annotations
+
+import hashlib
 import json
 import time
 from pathlib import Path
@@ -32,11 +35,12 @@ import torch
 import torch.distributed as dist
 
 from ultralytics.cfg import get_cfg, get_save_dir
-from ultralytics.data.utils import check_cls_dataset, check_det_dataset
+from ultralytics.data.utils import check_cls_dataset, check_det_dataset, get_hash
 from ultralytics.nn.autobackend import AutoBackend
-from ultralytics.utils import LOGGER, RANK, TQDM, callbacks, colorstr, emojis
+from ultralytics.utils import LOGGER, RANK, SETTINGS, TQDM, callbacks, colorstr, emojis
 from ultralytics.utils.checks import check_imgsz
 from ultralytics.utils.ops import Profile
+from ultralytics.utils.patches import torch_load
 from ultralytics.utils.torch_utils import attempt_compile, select_device, smart_inference_mode, unwrap_model
 
 
@@ -71,6 +75,9 @@ class BaseValidator:
 
     Methods:
         __call__: Execute validation process, running inference on dataloader and computing performance metrics.
+        pred_cache_path: Get the prediction cache file for a model, dataset and postprocessing settings.
+        to_cache: Return a CPU copy of postprocessed predictions for the prediction cache.
+        from_cache: Load cached predictions to the device, filtered by the current confidence threshold.
         match_predictions: Match predictions to ground truth objects using IoU.
         add_callback: Append the given callback to the specified event.
         run_callbacks: Run all callbacks associated with a specified event.
@@ -140,6 +147,7 @@ class BaseValidator:
         """
         self.training = trainer is not None
         augment = self.args.augment and (not self.training)
+        cache_path, cached = None, None
         if self.training:
             self.device = trainer.device
             self.data = trainer.data
@@ -162,6 +170,7 @@ class BaseValidator:
                 dnn=self.args.dnn,
                 data=self.args.data,
                 fp16=self.args.half,
+                channels_last=self.args.channels_last,
             )
             self.device = model.device  # update device
             self.args.half = model.fp16  # update half
@@ -185,10 +194,19 @@ class BaseValidator:
             self.stride = model.stride  # used in get_dataloader() for padding
             self.dataloader = self.dataloader or self.get_dataloader(self.data.get(self.args.split), self.args.batch)
 
+            # Reuse post-NMS predictions of an earlier run with the same weights, data and NMS settings
+            cache_path = self.pred_cache_path(model.model if pt else self.args.model)
+            if cache_path and cache_path.exists():
+                ckpt = torch_load(cache_path, map_location="cpu")
+                if self.args.conf >= ckpt["conf"] and len(ckpt["preds"]) == len(self.dataloader):
+                    cached = ckpt["preds"]
+                    LOGGER.info(f"Reusing cached predictions from {cache_path}")
+
             model.eval()
-            if self.args.compile:
+            if self.args.compile and cached is None:
                 model = attempt_compile(model, device=self.device)
-            model.warmup(imgsz=(1 if pt else self.args.batch, self.data["channels"], imgsz, imgsz))  # warmup
+            if cached is None:
+                model.warmup(imgsz=(1 if pt else self.args.batch, self.data["channels"], imgsz, imgsz))  # warmup
 
         self.run_callbacks("on_val_start")
         dt = (
@@ -200,6 +218,7 @@ class BaseValidator:
         bar = TQDM(self.dataloader, desc=self.get_desc(), total=len(self.dataloader))
         self.init_metrics(unwrap_model(model))
         self.jdict = []  # empty before each val
+        cache = []
         for batch_i, batch in enumerate(bar):
             self.run_callbacks("on_val_batch_start")
             self.batch_i = batch_i
@@ -207,18 +226,23 @@ class BaseValidator:
             with dt[0]:
                 batch = self.preprocess(batch)
 
-            # Inference
-            with dt[1]:
-                preds = model(batch["img"], augment=augment)
+            if cached is not None:
+                preds = self.from_cache(cached[batch_i])
+            else:
+                # Inference
+                with dt[1]:
+                    preds = model(batch["img"], augment=augment)
 
-            # Loss
-            with dt[2]:
-                if self.training:
-                    self.loss += model.loss(batch, preds)[1]
+                # Loss
+                with dt[2]:
+                    if self.training:
+                        self.loss += model.loss(batch, preds)[1]
 
-            # Postprocess
-            with dt[3]:
-                preds = self.postprocess(preds)
+                # Postprocess
+                with dt[3]:
+                    preds = self.postprocess(preds)
+                if cache_path:
+                    cache.append(self.to_cache(preds))
 
             self.update_metrics(preds, batch)
             if self.args.plots and batch_i < 3 and RANK in {-1, 0}:
@@ -227,6 +251,11 @@ class BaseValidator:
 
             self.run_callbacks("on_val_batch_end")
 
+        if cache_path and cached is None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            torch.save({"conf": self.args.conf, "preds": cache}, cache_path)
+            LOGGER.info(f"Cached predictions to {cache_path}")
+
         stats = {}
         self.gather_stats()
         if RANK in {-1, 0}:
@@ -263,20 +292,106 @@ class BaseValidator:
                 LOGGER.info(f"Results saved to {colorstr('bold', self.save_dir)}")
             return stats
 
+    def pred_cache_path(self, weights) -> Path | None:
+        """Get the prediction cache file for a model, dataset and postprocessing settings, or None if disabled.
+
+        The cache key hashes the model weights, the dataset image and label files, and all arguments that change the
+        post-NMS predictions except `conf`: predictions cached at a lower `conf` are filtered on reuse, which gives
+        the same result as running NMS at the higher threshold.
+
+        Args:
+            weights (torch.nn.Module | str | Path): PyTorch model, or path to a weights file or exported
+                model directory.
+
+        Returns:
+            (Path | None): Cache file path under `val_cache`, or the runs directory if `val_cache=True`.
+        """
+        if not self.args.val_cache or self.training or RANK != -1:
+            return None
+        if self.args.task == "segment":
+            LOGGER.warning("val_cache is not supported for segment models, as masks are too large to cache.")
+            return None
+        h = hashlib.sha256()
+        if isinstance(weights, torch.nn.Module):
+            for v in weights.state_dict().values():
+                h.update(v.detach().float().cpu().numpy().tobytes())
+        else:
+            path = Path(weights)
+            for f in sorted(path.rglob("*")) if path.is_dir() else [path]:
+                if f.is_file():
+                    with open(f, "rb") as file:
+                        while chunk := file.read(1 << 20):
+                            h.update(chunk)
+        dataset = self.dataloader.dataset
+        files = getattr(dataset, "im_files", None) or [str(s[0]) for s in getattr(dataset, "samples", [])]
+        h.update(get_hash([*files, *getattr(dataset, "label_files", [])]).encode())
+        keys = "task", "split", "imgsz", "batch", "rect", "half", "iou", "max_det", "agnostic_nms", "single_cls"
+        h.update(json.dumps({k: getattr(self.args, k) for k in (*keys, "nms_mode", "augment")}, default=str).encode())
+        root = Path(SETTINGS["runs_dir"]) / "val_cache" if self.args.val_cache is True else Path(self.args.val_cache)
+        return root / f"{h.hexdigest()[:16]}.pt"
+
+    def to_cache(self, preds):
+        """Return a CPU copy of postprocessed batch predictions for the prediction cache."""
+        if isinstance(preds, torch.Tensor):
+            return preds.cpu()
+        return [{k: v.cpu() for k, v in p.items()} for p in preds]
+
+    def from_cache(self, preds):
+        """Move cached batch predictions to the device, dropping those below the current `conf` threshold."""
+        if isinstance(preds, torch.Tensor):
+            return preds.to(self.device)
+        return [{k: v[p["conf"] >= self.args.conf].to(self.device) for k, v in p.items()} for p in preds]
+
     def match_predictions(
         self, pred_classes: torch.Tensor, true_classes: torch.Tensor, iou: torch.Tensor, use_scipy: bool = False
     ) -> torch.Tensor:
         """Match predictions to ground truth objects using IoU.
 
+        Greedy matching assigns each prediction to its highest-IoU label of the same class, and each label to its first
+        (highest confidence) prediction, for all IoU thresholds at once with tensor ops on the input device. Leading
+        batch dimensions are supported, i.e. padded predictions and labels of a whole batch, where padding classes must
+        not match. Results equal those of the previous per-threshold NumPy loop, except that a prediction whose best IoU
+        ties across several labels takes the lowest label index, where the loop's unstable sort picked any of them.
+
+        Args:
+            pred_classes (torch.Tensor): Predicted class indices of shape (..., N).
+            true_classes (torch.Tensor): Target class indices of shape (..., M).
+            iou (torch.Tensor): Tensor of shape (..., M, N) with the pairwise IoU values for ground truth
+                and predictions.
+            use_scipy (bool, optional): Whether to use scipy for matching (more precise), unbatched inputs only.
+
+        Returns:
+            (torch.Tensor): Correct tensor of shape (..., N, 10) for 10 IoU thresholds.
+        """
+        if use_scipy:
+            return self._match_predictions_scipy(pred_classes, true_classes, iou)
+        iouv = self.iouv.to(iou.device)
+        if not iou.shape[-2] or not iou.shape[-1]:
+            return torch.zeros((*pred_classes.shape, iouv.shape[0]), dtype=torch.bool, device=iou.device)
+        iou = iou * (true_classes[..., :, None] == pred_classes[..., None, :])  # zero out the wrong classes
+        best_iou, best_label = iou.max(-2)  # highest IoU label of each prediction, (..., N)
+        # A prediction loses its label at thresholds met by an earlier prediction of the same label
+        prev = torch.zeros_like(iou).scatter_(-2, best_label.unsqueeze(-2), best_iou.unsqueeze(-2))
+        prev = torch.nn.functional.pad(prev[..., :-1], (1, 0)).cummax(-1).values  # exclusive running max, (..., M, N)
+        prev = prev.gather(-2, best_label.unsqueeze(-2)).squeeze(-2)
+        return (best_iou[..., None] >= iouv) & (prev[..., None] < iouv)
+
+    def _match_predictions_scipy(
+        self, pred_classes: torch.Tensor, true_classes: torch.Tensor, iou: torch.Tensor
+    ) -> torch.Tensor:
+        """Match predictions to ground truth objects with scipy linear sum assignment per IoU threshold.
+
         Args:
             pred_classes (torch.Tensor): Predicted class indices of shape (N,).
             true_classes (torch.Tensor): Target class indices of shape (M,).
-            iou (torch.Tensor): An NxM tensor containing the pairwise IoU values for predictions and ground truth.
-            use_scipy (bool, optional): Whether to use scipy for matching (more precise).
+            iou (torch.Tensor): An MxN tensor containing the pairwise IoU values for ground truth and predictions.
 
         Returns:
             (torch.Tensor): Correct tensor of shape (N, 10) for 10 IoU thresholds.
         """
+        # WARNING: known issue that reduces mAP in https://github.com/ultralytics/ultralytics/pull/4708
+        import scipy  # scope import to avoid importing for all commands
+
         # Dx10 matrix, where D - detections, 10 - IoU thresholds
         correct = np.zeros((pred_classes.shape[0], self.iouv.shape[0])).astype(bool)
         # LxD matrix where L - labels (rows), D - detections (columns)
@@ -284,25 +399,12 @@ class BaseValidator:
         iou = iou * correct_class  # zero out the wrong classes
         iou = iou.cpu().numpy()
         for i, threshold in enumerate(self.iouv.cpu().tolist()):
-            if use_scipy:
-                # WARNING: known issue that reduces mAP in https://github.com/ultralytics/ultralytics/pull/4708
-                import scipy  # scope import to avoid importing for all commands
-
-                cost_matrix = iou * (iou >= threshold)
-                if cost_matrix.any():
-                    labels_idx, detections_idx = scipy.optimize.linear_sum_assignment(cost_matrix)
-                    valid = cost_matrix[labels_idx, detections_idx] > 0
-                    if valid.any():
-                        correct[detections_idx[valid], i] = True
-            else:
-                matches = np.nonzero(iou >= threshold)  # IoU > threshold and classes match
-                matches = np.array(matches).T
-                if matches.shape[0]:
-                    if matches.shape[0] > 1:
-                        matches = matches[iou[matches[:, 0], matches[:, 1]].argsort()[::-1]]
-                        matches = matches[np.unique(matches[:, 1], return_index=True)[1]]
-                        matches = matches[np.unique(matches[:, 0], return_index=True)[1]]
-                    correct[matches[:, 1].astype(int), i] = True
+            cost_matrix = iou * (iou >= threshold)
+            if cost_matrix.any():
+                labels_idx, detections_idx = scipy.optimize.linear_sum_assignment(cost_matrix)
+                valid = cost_matrix[labels_idx, detections_idx] > 0
+                if valid.any():
+                    correct[detections_idx[valid], i] = True
         return torch.tensor(correct, dtype=torch.bool, device=pred_classes.device)
 
     def add_callback(self, event: str, callback):
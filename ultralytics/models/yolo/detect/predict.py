@@ -62,6 +62,7 @@ class DetectionPredictor(BasePredictor):
             end2end=getattr(self.model, "end2end", False),
             rotated=self.args.task == "obb",
             return_idxs=save_feats,
+            nms_mode=self.args.nms_mode,
         )
 
         if not isinstance(orig_imgs, list):  # input images are a torch.Tensor, not a list
@@ -12,6 +12,7 @@ import torch
 import torch.nn as nn
 
 from ultralytics.data import build_dataloader, build_yolo_dataset
+from ultralytics.data.augment import BatchAugment
 from ultralytics.engine.trainer import BaseTrainer
 from ultralytics.models import yolo
 from ultralytics.nn.tasks import DetectionModel
@@ -29,13 +30,14 @@ class DetectionTrainer(BaseTrainer):
 
     Attributes:
         model (DetectionModel): The YOLO detection model being trained.
+        batch_augment (BatchAugment | None): Batched affine, HSV and flip augmentation used with augment_device='batch'.
         data (dict): Dictionary containing dataset information including class names and number of classes.
         loss_names (tuple): Names of the loss components used in training (box_loss, cls_loss, dfl_loss).
 
     Methods:
         build_dataset: Build YOLO dataset for training or validation.
         get_dataloader: Construct and return dataloader for the specified mode.
-        preprocess_batch: Preprocess a batch of images by scaling and converting to float.
+        preprocess_batch: Preprocess a batch of images by scaling, converting to float and batch augmenting.
         set_model_attributes: Set model attributes based on dataset information.
         get_model: Return a YOLO detection model.
         get_validator: Return a validator for model evaluation.
@@ -61,6 +63,25 @@ class DetectionTrainer(BaseTrainer):
             _callbacks (list, optional): List of callback functions to be executed during training.
         """
         super().__init__(cfg, overrides, _callbacks)
+        if self.args.augment_device not in {"cpu", "batch"}:
+            raise ValueError(f"Invalid 'augment_device={self.args.augment_device}'. Valid values are 'cpu' or 'batch'.")
+        self.batch_augment = None
+        if self.args.augment_device == "batch" and self.args.task != "detect":
+            LOGGER.warning(f"augment_device='batch' is not supported for task={self.args.task}, using 'cpu'.")
+            self.args.augment_device = "cpu"
+        elif self.args.augment_device == "batch":  # workers only mosaic and letterbox, see v8_transforms
+            self.batch_augment = BatchAugment(
+                degrees=self.args.degrees,
+                translate=self.args.translate,
+                scale=self.args.scale,
+                shear=self.args.shear,
+                perspective=self.args.perspective,
+                hgain=self.args.hsv_h,
+                sgain=self.args.hsv_s,
+                vgain=self.args.hsv_v,
+                flipud=self.args.flipud,
+                fliplr=self.args.fliplr,
+            )
 
     def build_dataset(self, img_path: str, mode: str = "train", batch: int | None = None):
         """Build YOLO Dataset for training or validation.
@@ -105,7 +126,7 @@ class DetectionTrainer(BaseTrainer):
         )
 
     def preprocess_batch(self, batch: dict) -> dict:
-        """Preprocess a batch of images by scaling and converting to float.
+        """Preprocess a batch of images by scaling and converting to float, applying BatchAugment if enabled.
 
         Args:
             batch (dict): Dictionary containing batch data with 'img' tensor.
@@ -117,6 +138,8 @@ class DetectionTrainer(BaseTrainer):
             if isinstance(v, torch.Tensor):
                 batch[k] = v.to(self.device, non_blocking=self.device.type == "cuda")
         batch["img"] = batch["img"].float() / 255
+        if self.batch_augment is not None:  # affine, HSV and flip augmentations on the training device
+            batch = self.batch_augment(batch, self.args.imgsz)
         if self.args.multi_scale:
             imgs = batch["img"]
             sz = (
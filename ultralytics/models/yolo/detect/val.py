@@ -96,6 +96,7 @@ class DetectionValidator(BaseValidator):
         self.seen = 0
         self.jdict = []
         self.metrics.names = model.names
+        self.metrics.bins = self.args.metric_bins
         self.confusion_matrix = ConfusionMatrix(names=model.names, save_matches=self.args.plots and self.args.visualize)
 
     def get_desc(self) -> str:
@@ -122,6 +123,7 @@ class DetectionValidator(BaseValidator):
             max_det=self.args.max_det,
             end2end=self.end2end,
             rotated=self.args.task == "obb",
+            nms_mode=self.args.nms_mode,
         )
         return [{"bboxes": x[:, :4], "conf": x[:, 4], "cls": x[:, 5], "extra": x[:, 6:]} for x in outputs]
 
@@ -172,16 +174,16 @@ class DetectionValidator(BaseValidator):
             preds (list[dict[str, torch.Tensor]]): List of predictions from the model.
             batch (dict[str, Any]): Batch data containing ground truth.
         """
-        for si, pred in enumerate(preds):
+        pbatches = [self._prepare_batch(si, batch) for si in range(len(preds))]
+        predns = [self._prepare_pred(pred) for pred in preds]
+        tps = self._process_batches(predns, pbatches)
+        for si, (predn, pbatch) in enumerate(zip(predns, pbatches)):
             self.seen += 1
-            pbatch = self._prepare_batch(si, batch)
-            predn = self._prepare_pred(pred)
-
             cls = pbatch["cls"].cpu().numpy()
             no_pred = predn["cls"].shape[0] == 0
             self.metrics.update_stats(
                 {
-                    **self._process_batch(predn, pbatch),
+                    **tps[si],
                     "target_cls": cls,
                     "target_img": np.unique(cls),
                     "conf": np.zeros(0) if no_pred else predn["conf"].cpu().numpy(),
@@ -221,22 +223,29 @@ class DetectionValidator(BaseValidator):
 
     def gather_stats(self) -> None:
         """Gather stats from all GPUs."""
+        if RANK != -1 and self.metrics.bins:  # fixed-size histograms are summed on rank 0 instead of pickled
+            for k, v in self.metrics.hist.items():
+                t = torch.from_numpy(v).to(self.device)
+                dist.reduce(t, dst=0)
+                self.metrics.hist[k] = t.cpu().numpy()
         if RANK == 0:
-            gathered_stats = [None] * dist.get_world_size()
-            dist.gather_object(self.metrics.stats, gathered_stats, dst=0)
-            merged_stats = {key: [] for key in self.metrics.stats.keys()}
-            for stats_dict in gathered_stats:
-                for key in merged_stats:
-                    merged_stats[key].extend(stats_dict[key])
+            if not self.metrics.bins:
+                gathered_stats = [None] * dist.get_world_size()
+                dist.gather_object(self.metrics.stats, gathered_stats, dst=0)
+                merged_stats = {key: [] for key in self.metrics.stats.keys()}
+                for stats_dict in gathered_stats:
+                    for key in merged_stats:
+                        merged_stats[key].extend(stats_dict[key])
+                self.metrics.stats = merged_stats
             gathered_jdict = [None] * dist.get_world_size()
             dist.gather_object(self.jdict, gathered_jdict, dst=0)
             self.jdict = []
             for jdict in gathered_jdict:
                 self.jdict.extend(jdict)
-            self.metrics.stats = merged_stats
             self.seen = len(self.dataloader.dataset)  # total image count from dataset
         elif RANK > 0:
-            dist.gather_object(self.metrics.stats, None, dst=0)
+            if not self.metrics.bins:
+                dist.gather_object(self.metrics.stats, None, dst=0)
             dist.gather_object(self.jdict, None, dst=0)
             self.jdict = []
             self.metrics.clear_stats()
@@ -287,6 +296,33 @@ class DetectionValidator(BaseValidator):
         iou = box_iou(batch["bboxes"], preds["bboxes"])
         return {"tp": self.match_predictions(preds["cls"], batch["cls"], iou).cpu().numpy()}
 
+    def _process_batches(
+        self, preds: list[dict[str, torch.Tensor]], batches: list[dict[str, Any]]
+    ) -> list[dict[str, np.ndarray]]:
+        """Return correct prediction matrices for all images of a batch.
+
+        Predictions and labels are padded so all box IoU matrices are computed and matched in one call on the inference
+        device. Subclasses that override `_process_batch()` are processed per image.
+
+        Args:
+            preds (list[dict[str, torch.Tensor]]): Prepared predictions of each image with 'bboxes' and 'cls' keys.
+            batches (list[dict[str, Any]]): Prepared ground truth of each image with 'bboxes' and 'cls' keys.
+
+        Returns:
+            (list[dict[str, np.ndarray]]): Dictionary per image containing 'tp' key with correct prediction matrix of
+                shape (N, 10) for 10 IoU levels.
+        """
+        if type(self)._process_batch is not DetectionValidator._process_batch:
+            return [self._process_batch(p, b) for p, b in zip(preds, batches)]
+        pad = torch.nn.utils.rnn.pad_sequence
+        pred_cls = pad([p["cls"] for p in preds], batch_first=True, padding_value=-1)  # (B, N)
+        gt_cls = pad([b["cls"] for b in batches], batch_first=True, padding_value=-2)  # (B, M), never matches
+        iou = box_iou(
+            pad([b["bboxes"] for b in batches], batch_first=True), pad([p["bboxes"] for p in preds], batch_first=True)
+        )
+        tp = self.match_predictions(pred_cls, gt_cls, iou).cpu().numpy()
+        return [{"tp": tp[i, : p["cls"].shape[0]]} for i, p in enumerate(preds)]
+
     def build_dataset(self, img_path: str, mode: str = "val", batch: int | None = None) -> torch.utils.data.Dataset:
         """Build YOLO Dataset.
 
@@ -105,6 +105,7 @@ class AutoBackend(nn.Module):
         stride (int): The model stride, typically 32 for YOLO models.
         fp16 (bool): Whether the model uses half-precision (FP16) inference.
         nhwc (bool): Whether the model expects NHWC input format instead of NCHW.
+        channels_last (bool): Whether PyTorch model weights and inputs use the channels-last (NHWC) memory format.
         pt (bool): Whether the model is a PyTorch model.
         jit (bool): Whether the model is a TorchScript model.
         onnx (bool): Whether the model is an ONNX model.
@@ -146,6 +147,7 @@ class AutoBackend(nn.Module):
         fp16: bool = False,
         fuse: bool = True,
         verbose: bool = True,
+        channels_last: bool = False,
     ):
         """Initialize the AutoBackend for inference.
 
@@ -157,6 +159,9 @@ class AutoBackend(nn.Module):
             fp16 (bool): Enable half-precision inference. Supported only on specific backends.
             fuse (bool): Fuse Conv2D + BatchNorm layers for optimization.
             verbose (bool): Enable verbose logging.
+            channels_last (bool): Convert PyTorch models and their inputs to the channels-last memory format. Like
+                fusing and FP16, the conversion is applied in place to a `torch.nn.Module` passed as `model`, so the
+                caller's module keeps channels-last weights afterwards.
         """
         super().__init__()
         nn_module = isinstance(model, torch.nn.Module)
@@ -220,6 +225,8 @@ class AutoBackend(nn.Module):
             ch = model.yaml.get("channels", 3)
             for p in model.parameters():
                 p.requires_grad = False
+            if channels_last:
+                model = model.to(memory_format=torch.channels_last)  # NHWC strides in place, shapes unchanged
             self.model = model  # explicitly assign for to(), cpu(), cuda(), half()
 
         # TorchScript
@@ -692,6 +699,8 @@ class AutoBackend(nn.Module):
 
         # PyTorch
         if self.pt or self.nn_module:
+            if self.channels_last:
+                im = im.contiguous(memory_format=torch.channels_last)  # no-op if already NHWC strided
             y = self.model(im, augment=augment, visualize=visualize, embed=embed, **kwargs)
 
         # TorchScript
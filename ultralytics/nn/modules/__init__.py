@@ -28,6 +28,7 @@ from .block import (
     DFL,
     ELAN1,
     PSA,
+    PConv,
     SPP,
     SPPELAN,
     SPPF,
@@ -118,6 +119,7 @@ __all__ = (
     "MLP",
     "OBB",
     "PSA",
+    "PConv",
     "SPP",
     "SPPELAN",
     "SPPF",
@@ -1982,6 +1982,23 @@ class PConv(nn.Module):
         x1 = self.partial_conv3(x1)
         return torch.cat((x1, x2), 1)
 
+    def forward_fuse(self, x: torch.Tensor) -> torch.Tensor:
+        """Deploy-time forward pass that convolves the partial channels in place instead of splitting and concatenating.
+
+        The untouched channels are never copied, so no new feature map is allocated per call. The input tensor is
+        overwritten, which is safe inside `Bottleneck_PConv` where it is the freshly computed `cv1` output. Falls back
+        to `forward_split_cat` while autograd is recording, as the in-place write would invalidate saved tensors.
+
+        Args:
+            x (torch.Tensor): Input tensor of shape (B, dim, H, W).
+
+        Returns:
+            (torch.Tensor): The input tensor with its first `dim_conv3` channels replaced by the convolution output.
+        """
+        if x.requires_grad and torch.is_grad_enabled():
+            return self.forward_split_cat(x)
+        return self.forward_slicing(x)
+
 
 class C3_PConv(C3k2):
     """
@@ -22,6 +22,7 @@ from ultralytics.nn.modules import (
     ELAN1,
     OBB,
     PSA,
+    PConv,
     SPP,
     SPPELAN,
     SPPF,
@@ -243,6 +244,8 @@ class BaseModel(torch.nn.Module):
                 if isinstance(m, RepVGGDW):
                     m.fuse()
                     m.forward = m.forward_fuse
+                if isinstance(m, PConv):
+                    m.forward = m.forward_fuse  # in-place partial conv, no split/cat copy
                 if isinstance(m, v10Detect):
                     m.fuse()  # remove one2many head
             self.info(verbose=verbose)
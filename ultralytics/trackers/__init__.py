@@ -2,6 +2,6 @@
 
 from .bot_sort import BOTSORT
 from .byte_tracker import BYTETracker
-from .track import register_tracker
+from .track import TrackerManager, register_tracker
 
-__all__ = "BOTSORT", "BYTETracker", "register_tracker"  # allow simpler import
+__all__ = "BOTSORT", "BYTETracker", "TrackerManager", "register_tracker"  # allow simpler import
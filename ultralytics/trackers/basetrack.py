@@ -113,3 +113,75 @@ class BaseTrack:
     def reset_id() -> None:
         """Reset the global track ID counter to its initial value."""
         BaseTrack._count = 0
+
+
+class TrackStore:
+    """Struct-of-arrays storage for the Kalman filter states of all tracks owned by a tracker.
+
+    Every activated track is assigned a slot (row) in contiguous `mean` and `covariance` arrays so that prediction,
+    correction and camera motion compensation can run as single batched NumPy operations over all tracks, instead of
+    gathering per-track arrays every frame. Tracks read and write their state through views into these arrays.
+
+    Attributes:
+        mean (np.ndarray): State means of shape (capacity, ndim).
+        covariance (np.ndarray): State covariances of shape (capacity, ndim, ndim).
+        tracks (dict[int, Any]): Mapping from occupied slot to the track owning it.
+        free (list[int]): Unoccupied slots, reused before the arrays grow.
+        count (int): Last track ID issued by this store, so that IDs are unique per tracker.
+
+    Methods:
+        next_id: Increment and return the next track ID of this store.
+        allocate: Assign a free slot to a track, growing the arrays when full.
+        release: Return a slot to the free list.
+        collect: Release the slots of all tracks that are no longer alive.
+
+    Examples:
+        >>> store = TrackStore(capacity=4)
+        >>> slot = store.allocate(track)
+        >>> store.mean[slot]  # view of the track's state mean
+        >>> store.release(slot)
+    """
+
+    def __init__(self, ndim: int = 8, capacity: int = 64):
+        """Initialize empty state arrays.
+
+        Args:
+            ndim (int): Dimension of the Kalman filter state space.
+            capacity (int): Initial number of slots, doubled whenever the store runs full.
+        """
+        self.mean = np.zeros((capacity, ndim))
+        self.covariance = np.zeros((capacity, ndim, ndim))
+        self.tracks = {}
+        self.free = list(range(capacity - 1, -1, -1))
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Return the number of occupied slots."""
+        return len(self.tracks)
+
+    def next_id(self) -> int:
+        """Increment and return the next track ID of this store."""
+        self.count += 1
+        return self.count
+
+    def allocate(self, track: Any) -> int:
+        """Assign a free slot to `track` and return its index, doubling the capacity if no slot is free."""
+        if not self.free:
+            n = len(self.mean)
+            self.mean = np.concatenate([self.mean, np.zeros_like(self.mean)])
+            self.covariance = np.concatenate([self.covariance, np.zeros_like(self.covariance)])
+            self.free = list(range(2 * n - 1, n - 1, -1))
+        slot = self.free.pop()
+        self.tracks[slot] = track
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Return `slot` to the free list."""
+        if self.tracks.pop(slot, None) is not None:
+            self.free.append(slot)
+
+    def collect(self, alive: list) -> None:
+        """Detach all tracks not in `alive` from the store so their slots can be reused."""
+        keep = {id(t) for t in alive}
+        for track in [t for t in self.tracks.values() if id(t) not in keep]:
+            track.detach()
@@ -5,11 +5,12 @@ from __future__ import annotations
 from collections import deque
 from typing import Any
 
+import cv2
 import numpy as np
 import torch
 
-from ultralytics.utils.ops import xywh2xyxy
-from ultralytics.utils.plotting import save_one_box
+from ultralytics.utils.metrics import bbox_ioa
+from ultralytics.utils.ops import clip_boxes, xywh2xyxy
 
 from .basetrack import TrackState
 from .byte_tracker import BYTETracker, STrack
@@ -30,15 +31,15 @@ class BOTrack(STrack):
         curr_feat (np.ndarray): Current feature vector.
         features (deque): A deque to store feature vectors with a maximum length defined by `feat_history`.
         alpha (float): Smoothing factor for the exponential moving average of features.
+        feat_frame (int): Frame ID in which the current feature was computed by the ReID encoder.
         mean (np.ndarray): The mean state of the Kalman filter.
         covariance (np.ndarray): The covariance matrix of the Kalman filter.
 
     Methods:
         update_features: Update features vector and smooth it using exponential moving average.
         predict: Predict the mean and covariance using Kalman filter.
-        re_activate: Reactivate a track with updated features and optionally new ID.
-        update: Update the track with new detection and frame ID.
-        tlwh: Property that gets the current position in tlwh format `(top left x, top left y, width, height)`.
+        absorb: Adopt the attributes and features of a matched detection.
+        mean_to_tlwh: Convert xywh state means to tlwh format `(top left x, top left y, width, height)`.
         multi_predict: Predict the mean and covariance of multiple object tracks using shared Kalman filter.
         convert_coords: Convert tlwh bounding box coordinates to xywh format.
         tlwh_to_xywh: Convert bounding box to xywh format `(center x, center y, width, height)`.
@@ -70,6 +71,7 @@ class BOTrack(STrack):
 
         self.smooth_feat = None
         self.curr_feat = None
+        self.feat_frame = 0
         if feat is not None:
             self.update_features(feat)
         self.features = deque([], maxlen=feat_history)
@@ -95,42 +97,28 @@ class BOTrack(STrack):
 
         self.mean, self.covariance = self.kalman_filter.predict(mean_state, self.covariance)
 
-    def re_activate(self, new_track: BOTrack, frame_id: int, new_id: bool = False) -> None:
-        """Reactivate a track with updated features and optionally assign a new ID."""
+    def absorb(self, new_track: BOTrack, frame_id: int) -> None:
+        """Adopt the attributes of a matched detection and update the appearance features with its embedding."""
         if new_track.curr_feat is not None:
             self.update_features(new_track.curr_feat)
-        super().re_activate(new_track, frame_id, new_id)
+            self.feat_frame = new_track.feat_frame
+        super().absorb(new_track, frame_id)
 
-    def update(self, new_track: BOTrack, frame_id: int) -> None:
-        """Update the track with new detection information and the current frame ID."""
-        if new_track.curr_feat is not None:
-            self.update_features(new_track.curr_feat)
-        super().update(new_track, frame_id)
-
-    @property
-    def tlwh(self) -> np.ndarray:
-        """Return the current bounding box position in `(top left x, top left y, width, height)` format."""
-        if self.mean is None:
-            return self._tlwh.copy()
-        ret = self.mean[:4].copy()
-        ret[:2] -= ret[2:] / 2
-        return ret
+    @staticmethod
+    def mean_to_tlwh(mean: np.ndarray) -> np.ndarray:
+        """Convert state means in `(x, y, w, h)` format to `(top left x, top left y, width, height)` boxes in place."""
+        mean[..., :2] -= mean[..., 2:] / 2
+        return mean
 
     @staticmethod
     def multi_predict(stracks: list[BOTrack]) -> None:
         """Predict the mean and covariance for multiple object tracks using a shared Kalman filter."""
         if len(stracks) <= 0:
             return
-        multi_mean = np.asarray([st.mean.copy() for st in stracks])
-        multi_covariance = np.asarray([st.covariance for st in stracks])
-        for i, st in enumerate(stracks):
-            if st.state != TrackState.Tracked:
-                multi_mean[i][6] = 0
-                multi_mean[i][7] = 0
+        multi_mean, multi_covariance = STrack.gather(stracks)
+        multi_mean[np.ix_([st.state != TrackState.Tracked for st in stracks], [6, 7])] = 0
         multi_mean, multi_covariance = BOTrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
-        for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-            stracks[i].mean = mean
-            stracks[i].covariance = cov
+        STrack.scatter(stracks, multi_mean, multi_covariance)
 
     def convert_coords(self, tlwh: np.ndarray) -> np.ndarray:
         """Convert tlwh bounding box coordinates to xywh format."""
@@ -151,6 +139,8 @@ class BOTSORT(BYTETracker):
         proximity_thresh (float): Threshold for spatial proximity (IoU) between tracks and detections.
         appearance_thresh (float): Threshold for appearance similarity (ReID embeddings) between tracks and detections.
         encoder (Any): Object to handle ReID embeddings, set to None if ReID is not enabled.
+        reid_refresh (int): Maximum age in frames of a cached track embedding reused for a detection, 0 to disable.
+        reid_iou (float): Minimum IoU between a detection and its track's last box to reuse the track's embedding.
         gmc (GMC): An instance of the GMC algorithm for data association.
         args (Any): Parsed command-line arguments containing tracking parameters.
 
@@ -158,8 +148,10 @@ class BOTSORT(BYTETracker):
         get_kalmanfilter: Return an instance of KalmanFilterXYWH for object tracking.
         init_track: Initialize track with detections, scores, and classes.
         get_dists: Get distances between tracks and detections using IoU and (optionally) ReID.
+        get_features: Get ReID embeddings for detections, reusing cached track embeddings where unambiguous.
         multi_predict: Predict and track multiple objects with a YOLO model.
         reset: Reset the BOTSORT tracker to its initial state.
+        stats: Per-frame tracker costs such as the global motion compensation time.
 
     Examples:
         Initialize BOTSORT and process detections
@@ -171,26 +163,35 @@ class BOTSORT(BYTETracker):
         The class is designed to work with a YOLO object detection model and supports ReID only if enabled via args.
     """
 
-    def __init__(self, args: Any, frame_rate: int = 30):
+    def __init__(self, args: Any, frame_rate: int = 30, encoder: Any = None):
         """Initialize BOTSORT object with ReID module and GMC algorithm.
 
         Args:
             args (Any): Parsed command-line arguments containing tracking parameters.
             frame_rate (int): Frame rate of the video being processed.
+            encoder (Any, optional): ReID encoder shared with other trackers, built from `args` if None.
         """
         super().__init__(args, frame_rate)
-        self.gmc = GMC(method=args.gmc_method)
+        self.gmc = GMC(
+            method=args.gmc_method,
+            interval=getattr(args, "gmc_interval", 1),
+            static_thresh=getattr(args, "gmc_static_thresh", 0.0),
+        )
 
         # ReID module
         self.proximity_thresh = args.proximity_thresh
         self.appearance_thresh = args.appearance_thresh
-        self.encoder = (
-            (lambda feats, s: [f.cpu().numpy() for f in feats])  # native features do not require any model
-            if args.with_reid and self.args.model == "auto"
-            else ReID(args.model)
-            if args.with_reid
-            else None
-        )
+        self.reid_refresh = getattr(args, "reid_refresh", 0)
+        self.reid_iou = getattr(args, "reid_iou", 0.9)
+        if not args.with_reid:
+            encoder = None
+        elif encoder is None:
+            encoder = (
+                (lambda feats, s: [f.cpu().numpy() for f in feats])  # native features do not require any model
+                if self.args.model == "auto"
+                else ReID(args.model, batch=getattr(args, "reid_batch", 32))
+            )
+        self.encoder = encoder
 
     def get_kalmanfilter(self) -> KalmanFilterXYWH:
         """Return an instance of KalmanFilterXYWH for predicting and updating object states in the tracking process."""
@@ -203,25 +204,66 @@ class BOTSORT(BYTETracker):
         bboxes = results.xywhr if hasattr(results, "xywhr") else results.xywh
         bboxes = np.concatenate([bboxes, np.arange(len(bboxes)).reshape(-1, 1)], axis=-1)
         if self.args.with_reid and self.encoder is not None:
-            features_keep = self.encoder(img, bboxes)
-            return [BOTrack(xywh, s, c, f) for (xywh, s, c, f) in zip(bboxes, results.conf, results.cls, features_keep)]
+            features_keep, feat_frames = self.get_features(img, bboxes)
+            tracks = [
+                BOTrack(xywh, s, c, f) for (xywh, s, c, f) in zip(bboxes, results.conf, results.cls, features_keep)
+            ]
+            for track, feat_frame in zip(tracks, feat_frames):
+                track.feat_frame = feat_frame
+            return tracks
         else:
             return [BOTrack(xywh, s, c) for (xywh, s, c) in zip(bboxes, results.conf, results.cls)]
 
-    def get_dists(self, tracks: list[BOTrack], detections: list[BOTrack]) -> np.ndarray:
-        """Calculate distances between tracks and detections using IoU and optionally ReID embeddings."""
-        dists = matching.iou_distance(tracks, detections)
-        dists_mask = dists > (1 - self.proximity_thresh)
+    def get_features(self, img: np.ndarray, bboxes: np.ndarray) -> tuple[list[np.ndarray], list[int]]:
+        """Get ReID embeddings for detections, reusing cached track embeddings for unambiguous, stationary detections.
 
-        if self.args.fuse_score:
-            dists = matching.fuse_score(dists, detections)
+        A detection reuses the embedding of a tracked track if that track is the only one overlapping it by at least
+        `proximity_thresh` IoU and vice versa, so appearance cannot change the association, its box moved less than
+        `reid_iou` IoU since the last frame, and the cached embedding is less than `reid_refresh` frames old. All other
+        detections are embedded by the encoder in one batched call. Native detector features are never cached as they
+        come for free with the detections.
 
-        if self.args.with_reid and self.encoder is not None:
-            emb_dists = matching.embedding_distance(tracks, detections) / 2.0
-            emb_dists[emb_dists > (1 - self.appearance_thresh)] = 1.0
-            emb_dists[dists_mask] = 1.0
-            dists = np.minimum(dists, emb_dists)
-        return dists
+        Args:
+            img (np.ndarray): Current frame, or native detector features when `model='auto'`.
+            bboxes (np.ndarray): Detection boxes in `(x, y, w, h, [angle,] idx)` format.
+
+        Returns:
+            feats (list[np.ndarray]): Embedding of each detection.
+            feat_frames (list[int]): Frame ID in which each embedding was computed.
+        """
+        feats, feat_frames = [None] * len(bboxes), [self.frame_id] * len(bboxes)
+        tracks = [t for t in self.joint_stracks(self.tracked_stracks, self.lost_stracks) if t.curr_feat is not None]
+        if self.reid_refresh > 0 and self.args.model != "auto" and tracks:
+            boxes = tracks[0].multi_tlwh(tracks)
+            boxes[:, 2:] += boxes[:, :2]  # xyxy
+            iou = bbox_ioa(boxes, xywh2xyxy(bboxes[:, :4]), iou=True)
+            near = iou >= self.proximity_thresh
+            nearest = iou.argmax(0)
+            for i in np.flatnonzero((near.sum(0) == 1) & (near.sum(1)[nearest] == 1)):
+                track = tracks[nearest[i]]
+                if (
+                    track.state == TrackState.Tracked
+                    and iou[nearest[i], i] >= self.reid_iou
+                    and self.frame_id - track.feat_frame < self.reid_refresh
+                ):
+                    feats[i], feat_frames[i] = track.curr_feat.copy(), track.feat_frame
+        todo = [i for i, f in enumerate(feats) if f is None]
+        if todo:
+            for i, f in zip(todo, self.encoder(img, bboxes[todo])):
+                feats[i] = f
+        return feats, feat_frames
+
+    def get_dists(self, tracks: list[BOTrack], detections: list[BOTrack]) -> np.ndarray:
+        """Calculate distances between tracks and detections using IoU and optionally ReID embeddings."""
+        scores = np.array([det.score for det in detections]) if self.args.fuse_score else None
+        reid = self.args.with_reid and self.encoder is not None
+        return matching.fuse_costs(
+            matching.iou_distance(tracks, detections),
+            scores,
+            matching.embedding_distance(tracks, detections) if reid else None,
+            self.proximity_thresh,
+            self.appearance_thresh,
+        )
 
     def multi_predict(self, tracks: list[BOTrack]) -> None:
         """Predict the mean and covariance of multiple object tracks using a shared Kalman filter."""
@@ -232,26 +274,96 @@ class BOTSORT(BYTETracker):
         super().reset()
         self.gmc.reset_params()
 
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return per-frame tracker costs, currently the global motion compensation cost and estimate counts."""
+        return {"gmc": self.gmc.stats}
+
 
 class ReID:
-    """YOLO model as encoder for re-identification."""
+    """YOLO model as encoder for re-identification.
+
+    Detection crops are cut from the frame and resized to the model input size in one batched pass, then embedded in
+    fixed-size batches so that static-shape backends and cuDNN autotuning always see the same input shape.
+
+    Attributes:
+        model (YOLO): YOLO model used to embed the crops.
+        batch (int): Number of crops per forward pass, the last batch is zero-padded to this size.
 
-    def __init__(self, model: str):
+    Methods:
+        crop: Crop and resize detections from a frame into a normalized BCHW tensor.
+
+    Examples:
+        >>> reid = ReID("yolo11n-cls.pt", batch=32)
+        >>> feats = reid(frame, dets)  # dets in (x, y, w, h, ...) format
+    """
+
+    def __init__(self, model: str, batch: int = 32):
         """Initialize encoder for re-identification.
 
         Args:
             model (str): Path to the YOLO model for re-identification.
+            batch (int): Number of crops embedded per forward pass.
         """
         from ultralytics import YOLO
 
         self.model = YOLO(model)
         self.model(embed=[len(self.model.model.model) - 2 if ".pt" in model else -1], verbose=False, save=False)  # init
+        self.batch = batch
 
     def __call__(self, img: np.ndarray, dets: np.ndarray) -> list[np.ndarray]:
         """Extract embeddings for detected objects."""
-        feats = self.model.predictor(
-            [save_one_box(det, img, save=False) for det in xywh2xyxy(torch.from_numpy(dets[:, :4]))]
-        )
-        if len(feats) != dets.shape[0] and feats[0].shape[0] == dets.shape[0]:
-            feats = feats[0]  # batched prediction with non-PyTorch backend
-        return [f.cpu().numpy() for f in feats]
+        if len(dets) == 0:
+            return []
+        crops, feats = self.crop(img, dets), []
+        for i in range(0, len(crops), self.batch):
+            x = crops[i : i + self.batch]
+            n = len(x)
+            if n < self.batch:
+                x = torch.cat([x, x.new_zeros((self.batch - n, *x.shape[1:]))])
+            y = self.model.predictor(x)
+            if len(y) != self.batch and y[0].shape[0] == self.batch:
+                y = y[0]  # batched prediction with non-PyTorch backend
+            feats.extend(f.cpu().numpy() for f in y[:n])
+        return feats
+
+    def crop(self, img: np.ndarray, dets: np.ndarray) -> torch.Tensor:
+        """Crop detections from a BGR frame and resize them to the model input size as a normalized RGB BCHW tensor.
+
+        Boxes are squared and enlarged like `save_one_box(..., gain=1.02, pad=10)`. Classification models use the
+        largest square inside the box, matching their center-crop preprocessing, while other models use the smallest
+        square containing the box. On accelerators the frame region covering all boxes is uploaded once and cropped
+        with a single `roi_align` call. On CPU, where converting the frame to float costs more than the crops
+        themselves, each crop is resized with OpenCV straight into one preallocated uint8 batch.
+
+        Args:
+            img (np.ndarray): Frame in HWC BGR format.
+            dets (np.ndarray): Detection boxes in `(x, y, w, h, ...)` format.
+
+        Returns:
+            (torch.Tensor): Crops with shape (N, C, H, W) and values in 0.0-1.0 on the model device.
+        """
+        predictor = self.model.predictor
+        h, w = predictor.imgsz
+        b = torch.from_numpy(np.ascontiguousarray(dets[:, :4], dtype=np.float32))
+        side = b[:, 2:].amin(1) if predictor.args.task == "classify" else b[:, 2:].amax(1)
+        b[:, 2:] = side[:, None] * 1.02 + 10
+        boxes = clip_boxes(xywh2xyxy(b), img.shape)
+
+        if predictor.device.type == "cpu":
+            crops = np.empty((len(boxes), h, w, img.shape[2]), dtype=np.uint8)
+            for crop, (x0, y0, x1, y1) in zip(crops, boxes.long().tolist()):
+                cv2.resize(
+                    img[y0 : max(y1, y0 + 1), x0 : max(x1, x0 + 1)], (w, h), dst=crop, interpolation=cv2.INTER_AREA
+                )
+            crops = torch.from_numpy(crops).permute(0, 3, 1, 2).float()
+        else:
+            from torchvision.ops import roi_align
+
+            x0, y0 = boxes[:, :2].min(0).values.floor().int().tolist()
+            x1, y1 = boxes[:, 2:].max(0).values.ceil().int().tolist()
+            im = torch.from_numpy(np.ascontiguousarray(img[y0:y1, x0:x1])).to(predictor.device)
+            boxes = (boxes - torch.tensor([x0, y0, x0, y0])).to(predictor.device)
+            im = im.permute(2, 0, 1)[None].float()
+            crops = roi_align(im, [boxes], output_size=(h, w), sampling_ratio=-1, aligned=True)
+        return (crops.flip(1) if crops.shape[1] == 3 else crops) / 255  # BGR to RGB
@@ -8,7 +8,7 @@ import numpy as np
 
 from ..utils import LOGGER
 from ..utils.ops import xywh2ltwh
-from .basetrack import BaseTrack, TrackState
+from .basetrack import BaseTrack, TrackState, TrackStore
 from .utils import matching
 from .utils.kalman_filter import KalmanFilterXYAH
 
@@ -17,7 +17,8 @@ class STrack(BaseTrack):
     """Single object tracking representation that uses Kalman filtering for state estimation.
 
     This class is responsible for storing all the information regarding individual tracklets and performs state updates
-    and predictions based on Kalman filter.
+    and predictions based on Kalman filter. Activated tracks keep their Kalman state in a shared `TrackStore`, so
+    `mean` and `covariance` are views into contiguous arrays that the `multi_*` methods update for all tracks at once.
 
     Attributes:
         shared_kalman (KalmanFilterXYAH): Shared Kalman filter used across all STrack instances for prediction.
@@ -25,6 +26,8 @@ class STrack(BaseTrack):
         kalman_filter (KalmanFilterXYAH): Instance of Kalman filter used for this particular object track.
         mean (np.ndarray): Mean state estimate vector.
         covariance (np.ndarray): Covariance of state estimate.
+        store (TrackStore | None): Store holding the Kalman state of this track, None if the state is held privately.
+        slot (int | None): Index of this track's state in `store`.
         is_activated (bool): Boolean flag indicating if the track has been activated.
         score (float): Confidence score of the track.
         tracklet_len (int): Length of the tracklet.
@@ -38,10 +41,15 @@ class STrack(BaseTrack):
         predict: Predict the next state of the object using Kalman filter.
         multi_predict: Predict the next states for multiple tracks.
         multi_gmc: Update multiple track states using a homography matrix.
+        multi_update: Correct multiple matched tracks with their detections.
         activate: Activate a new tracklet.
+        detach: Move the Kalman state out of the track store.
         re_activate: Reactivate a previously lost tracklet.
         update: Update the state of a matched track.
+        absorb: Adopt the attributes of a matched detection.
         convert_coords: Convert bounding box to x-y-aspect-height format.
+        mean_to_tlwh: Convert state means to top-left-width-height boxes.
+        multi_tlwh: Get the boxes of multiple tracks in top-left-width-height format.
         tlwh_to_xyah: Convert tlwh bounding box to xyah format.
 
     Examples:
@@ -66,6 +74,7 @@ class STrack(BaseTrack):
         assert len(xywh) in {5, 6}, f"expected 5 or 6 values but got {len(xywh)}"
         self._tlwh = np.asarray(xywh2ltwh(xywh[:4]), dtype=np.float32)
         self.kalman_filter = None
+        self.store, self.slot = None, None
         self.mean, self.covariance = None, None
         self.is_activated = False
 
@@ -82,44 +91,114 @@ class STrack(BaseTrack):
             mean_state[7] = 0
         self.mean, self.covariance = self.kalman_filter.predict(mean_state, self.covariance)
 
+    @property
+    def mean(self) -> np.ndarray | None:
+        """Get the state mean, a view into the track store for activated tracks."""
+        return self._mean if self.slot is None else self.store.mean[self.slot]
+
+    @mean.setter
+    def mean(self, value: np.ndarray | None):
+        """Set the state mean, writing through to the track store for activated tracks."""
+        if self.slot is None:
+            self._mean = value
+        else:
+            self.store.mean[self.slot] = value
+
+    @property
+    def covariance(self) -> np.ndarray | None:
+        """Get the state covariance, a view into the track store for activated tracks."""
+        return self._covariance if self.slot is None else self.store.covariance[self.slot]
+
+    @covariance.setter
+    def covariance(self, value: np.ndarray | None):
+        """Set the state covariance, writing through to the track store for activated tracks."""
+        if self.slot is None:
+            self._covariance = value
+        else:
+            self.store.covariance[self.slot] = value
+
+    @staticmethod
+    def slots(stracks: list[STrack]) -> list[int] | None:
+        """Return the store slots of `stracks` if they all share one track store, otherwise None."""
+        store = stracks[0].store
+        if store is not None and all(st.store is store for st in stracks):
+            return [st.slot for st in stracks]
+        return None
+
+    @staticmethod
+    def gather(stracks: list[STrack]) -> tuple[np.ndarray, np.ndarray]:
+        """Return copies of the stacked means and covariances of `stracks`, indexing the track store when shared."""
+        slots = STrack.slots(stracks)
+        if slots is not None:
+            return stracks[0].store.mean[slots], stracks[0].store.covariance[slots]
+        return np.asarray([st.mean for st in stracks]), np.asarray([st.covariance for st in stracks])
+
+    @staticmethod
+    def scatter(stracks: list[STrack], multi_mean: np.ndarray, multi_covariance: np.ndarray):
+        """Write stacked means and covariances back to `stracks`, in a single assignment when they share a store."""
+        slots = STrack.slots(stracks)
+        if slots is not None:
+            store = stracks[0].store
+            store.mean[slots], store.covariance[slots] = multi_mean, multi_covariance
+        else:
+            for st, mean, cov in zip(stracks, multi_mean, multi_covariance):
+                st.mean, st.covariance = mean, cov
+
     @staticmethod
     def multi_predict(stracks: list[STrack]):
         """Perform multi-object predictive tracking using Kalman filter for the provided list of STrack instances."""
         if len(stracks) <= 0:
             return
-        multi_mean = np.asarray([st.mean.copy() for st in stracks])
-        multi_covariance = np.asarray([st.covariance for st in stracks])
-        for i, st in enumerate(stracks):
-            if st.state != TrackState.Tracked:
-                multi_mean[i][7] = 0
+        multi_mean, multi_covariance = STrack.gather(stracks)
+        multi_mean[[st.state != TrackState.Tracked for st in stracks], 7] = 0
         multi_mean, multi_covariance = STrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
-        for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-            stracks[i].mean = mean
-            stracks[i].covariance = cov
+        STrack.scatter(stracks, multi_mean, multi_covariance)
 
     @staticmethod
     def multi_gmc(stracks: list[STrack], H: np.ndarray = np.eye(2, 3)):
         """Update state tracks positions and covariances using a homography matrix for multiple tracks."""
         if stracks:
-            multi_mean = np.asarray([st.mean.copy() for st in stracks])
-            multi_covariance = np.asarray([st.covariance for st in stracks])
+            multi_mean, multi_covariance = STrack.gather(stracks)
 
             R = H[:2, :2]
             R8x8 = np.kron(np.eye(4, dtype=float), R)
             t = H[:2, 2]
 
-            for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-                mean = R8x8.dot(mean)
-                mean[:2] += t
-                cov = R8x8.dot(cov).dot(R8x8.transpose())
+            multi_mean = multi_mean @ R8x8.T
+            multi_mean[:, :2] += t
+            multi_covariance = R8x8 @ multi_covariance @ R8x8.T
+            STrack.scatter(stracks, multi_mean, multi_covariance)
 
-                stracks[i].mean = mean
-                stracks[i].covariance = cov
+    @staticmethod
+    def multi_update(stracks: list[STrack], detections: list[STrack], frame_id: int):
+        """Correct matched tracks with their detections in one batched Kalman step.
+
+        Tracked tracks are updated and lost tracks are re-activated (keeping their ID), equivalent to calling `update`
+        or `re_activate` on each pair.
 
-    def activate(self, kalman_filter: KalmanFilterXYAH, frame_id: int):
+        Args:
+            stracks (list[STrack]): Matched tracks, all using the same Kalman filter.
+            detections (list[STrack]): Detection matched to each track.
+            frame_id (int): The ID of the current frame.
+        """
+        if len(stracks) <= 0:
+            return
+        multi_mean, multi_covariance = STrack.gather(stracks)
+        measurement = np.asarray([st.convert_coords(det.tlwh) for st, det in zip(stracks, detections)])
+        multi_mean, multi_covariance = stracks[0].kalman_filter.multi_update(multi_mean, multi_covariance, measurement)
+        STrack.scatter(stracks, multi_mean, multi_covariance)
+        for st, det in zip(stracks, detections):
+            st.tracklet_len = st.tracklet_len + 1 if st.state == TrackState.Tracked else 0
+            st.absorb(det, frame_id)
+
+    def activate(self, kalman_filter: KalmanFilterXYAH, frame_id: int, store: TrackStore | None = None):
         """Activate a new tracklet using the provided Kalman filter and initialize its state and covariance."""
         self.kalman_filter = kalman_filter
-        self.track_id = self.next_id()
+        if store is not None:
+            self.track_id = store.next_id()
+            self.store, self.slot = store, store.allocate(self)
+        else:
+            self.track_id = self.next_id()
         self.mean, self.covariance = self.kalman_filter.initiate(self.convert_coords(self._tlwh))
 
         self.tracklet_len = 0
@@ -129,21 +208,22 @@ class STrack(BaseTrack):
         self.frame_id = frame_id
         self.start_frame = frame_id
 
+    def detach(self):
+        """Copy the Kalman state out of the track store and release the track's slot."""
+        if self.slot is not None:
+            self._mean, self._covariance = self.mean.copy(), self.covariance.copy()
+            self.store.release(self.slot)
+            self.store, self.slot = None, None
+
     def re_activate(self, new_track: STrack, frame_id: int, new_id: bool = False):
         """Reactivate a previously lost track using new detection data and update its state and attributes."""
         self.mean, self.covariance = self.kalman_filter.update(
             self.mean, self.covariance, self.convert_coords(new_track.tlwh)
         )
         self.tracklet_len = 0
-        self.state = TrackState.Tracked
-        self.is_activated = True
-        self.frame_id = frame_id
         if new_id:
-            self.track_id = self.next_id()
-        self.score = new_track.score
-        self.cls = new_track.cls
-        self.angle = new_track.angle
-        self.idx = new_track.idx
+            self.track_id = self.store.next_id() if self.store is not None else self.next_id()
+        self.absorb(new_track, frame_id)
 
     def update(self, new_track: STrack, frame_id: int):
         """Update the state of a matched track.
@@ -158,16 +238,19 @@ class STrack(BaseTrack):
             >>> new_track = STrack([105, 205, 55, 85, 0.95, 1])
             >>> track.update(new_track, 2)
         """
-        self.frame_id = frame_id
         self.tracklet_len += 1
 
         new_tlwh = new_track.tlwh
         self.mean, self.covariance = self.kalman_filter.update(
             self.mean, self.covariance, self.convert_coords(new_tlwh)
         )
+        self.absorb(new_track, frame_id)
+
+    def absorb(self, new_track: STrack, frame_id: int):
+        """Mark the track as tracked in `frame_id` and adopt the score, class, angle and index of a detection."""
+        self.frame_id = frame_id
         self.state = TrackState.Tracked
         self.is_activated = True
-
         self.score = new_track.score
         self.cls = new_track.cls
         self.angle = new_track.angle
@@ -182,10 +265,22 @@ class STrack(BaseTrack):
         """Get the bounding box in top-left-width-height format from the current state estimate."""
         if self.mean is None:
             return self._tlwh.copy()
-        ret = self.mean[:4].copy()
-        ret[2] *= ret[3]
-        ret[:2] -= ret[2:] / 2
-        return ret
+        return self.mean_to_tlwh(self.mean[:4].copy())
+
+    @staticmethod
+    def mean_to_tlwh(mean: np.ndarray) -> np.ndarray:
+        """Convert state means in `(x, y, a, h)` format to `(top left x, top left y, width, height)` boxes in place."""
+        mean[..., 2] *= mean[..., 3]
+        mean[..., :2] -= mean[..., 2:] / 2
+        return mean
+
+    @staticmethod
+    def multi_tlwh(stracks: list[STrack]) -> np.ndarray:
+        """Get the boxes of multiple tracks as an (N, 4) tlwh array, converting store states in one vectorized pass."""
+        slots = STrack.slots(stracks)
+        if slots is not None:
+            return stracks[0].mean_to_tlwh(stracks[0].store.mean[slots, :4])
+        return np.asarray([st.tlwh for st in stracks])
 
     @property
     def xyxy(self) -> np.ndarray:
@@ -243,6 +338,7 @@ class BYTETracker:
         args (Namespace): Command-line arguments.
         max_time_lost (int): The maximum frames for a track to be considered as 'lost'.
         kalman_filter (KalmanFilterXYAH): Kalman Filter object.
+        store (TrackStore): Struct-of-arrays storage for the Kalman states of all live tracks.
 
     Methods:
         update: Update object tracker with new detections.
@@ -250,6 +346,7 @@ class BYTETracker:
         init_track: Initialize object tracking with detections.
         get_dists: Calculate the distance between tracks and detections.
         multi_predict: Predict the location of tracks.
+        update_matches: Apply a batched Kalman correction to matched tracks.
         reset_id: Reset the ID counter of STrack.
         reset: Reset the tracker by clearing all tracks.
         joint_stracks: Combine two lists of stracks.
@@ -278,6 +375,7 @@ class BYTETracker:
         self.args = args
         self.max_time_lost = int(frame_rate / 30.0 * args.track_buffer)
         self.kalman_filter = self.get_kalmanfilter()
+        self.store = TrackStore()
         self.reset_id()
 
     def update(self, results, img: np.ndarray | None = None, feats: np.ndarray | None = None) -> np.ndarray:
@@ -325,31 +423,14 @@ class BYTETracker:
 
         dists = self.get_dists(strack_pool, detections)
         matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
-
-        for itracked, idet in matches:
-            track = strack_pool[itracked]
-            det = detections[idet]
-            if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
-                activated_stracks.append(track)
-            else:
-                track.re_activate(det, self.frame_id, new_id=False)
-                refind_stracks.append(track)
+        self.update_matches(strack_pool, detections, matches, activated_stracks, refind_stracks)
         # Step 3: Second association, with low score detection boxes association the untrack to the low score detections
         detections_second = self.init_track(results_second, feats_second)
         r_tracked_stracks = [strack_pool[i] for i in u_track if strack_pool[i].state == TrackState.Tracked]
         # TODO: consider fusing scores or appearance features for second association.
         dists = matching.iou_distance(r_tracked_stracks, detections_second)
         matches, u_track, _u_detection_second = matching.linear_assignment(dists, thresh=0.5)
-        for itracked, idet in matches:
-            track = r_tracked_stracks[itracked]
-            det = detections_second[idet]
-            if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
-                activated_stracks.append(track)
-            else:
-                track.re_activate(det, self.frame_id, new_id=False)
-                refind_stracks.append(track)
+        self.update_matches(r_tracked_stracks, detections_second, matches, activated_stracks, refind_stracks)
 
         for it in u_track:
             track = r_tracked_stracks[it]
@@ -360,9 +441,7 @@ class BYTETracker:
         detections = [detections[i] for i in u_detection]
         dists = self.get_dists(unconfirmed, detections)
         matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
-        for itracked, idet in matches:
-            unconfirmed[itracked].update(detections[idet], self.frame_id)
-            activated_stracks.append(unconfirmed[itracked])
+        self.update_matches(unconfirmed, detections, matches, activated_stracks, refind_stracks)
         for it in u_unconfirmed:
             track = unconfirmed[it]
             track.mark_removed()
@@ -372,7 +451,7 @@ class BYTETracker:
             track = detections[inew]
             if track.score < self.args.new_track_thresh:
                 continue
-            track.activate(self.kalman_filter, self.frame_id)
+            track.activate(self.kalman_filter, self.frame_id, self.store)
             activated_stracks.append(track)
         # Step 5: Update state
         for track in self.lost_stracks:
@@ -390,6 +469,7 @@ class BYTETracker:
         self.removed_stracks.extend(removed_stracks)
         if len(self.removed_stracks) > 1000:
             self.removed_stracks = self.removed_stracks[-1000:]  # clip removed stracks to 1000 maximum
+        self.store.collect(self.tracked_stracks + self.lost_stracks)  # free slots of removed and duplicate tracks
 
         return np.asarray([x.result for x in self.tracked_stracks if x.is_activated], dtype=np.float32)
 
@@ -407,15 +487,27 @@ class BYTETracker:
 
     def get_dists(self, tracks: list[STrack], detections: list[STrack]) -> np.ndarray:
         """Calculate the distance between tracks and detections using IoU and optionally fuse scores."""
-        dists = matching.iou_distance(tracks, detections)
-        if self.args.fuse_score:
-            dists = matching.fuse_score(dists, detections)
-        return dists
+        scores = np.array([det.score for det in detections]) if self.args.fuse_score else None
+        return matching.fuse_costs(matching.iou_distance(tracks, detections), scores)
 
     def multi_predict(self, tracks: list[STrack]):
         """Predict the next states for multiple tracks using Kalman filter."""
         STrack.multi_predict(tracks)
 
+    def update_matches(
+        self,
+        tracks: list[STrack],
+        detections: list[STrack],
+        matches: list[list[int]] | np.ndarray,
+        activated_stracks: list[STrack],
+        refind_stracks: list[STrack],
+    ):
+        """Correct all matched tracks in one batched Kalman step and record them as activated or re-found."""
+        tracks = [tracks[itracked] for itracked, _ in matches]
+        for track in tracks:
+            (activated_stracks if track.state == TrackState.Tracked else refind_stracks).append(track)
+        STrack.multi_update(tracks, [detections[idet] for _, idet in matches], self.frame_id)
+
     @staticmethod
     def reset_id():
         """Reset the ID counter for STrack instances to ensure unique track IDs across tracking sessions."""
@@ -428,6 +520,7 @@ class BYTETracker:
         self.removed_stracks = []  # type: list[STrack]
         self.frame_id = 0
         self.kalman_filter = self.get_kalmanfilter()
+        self.store = TrackStore()
         self.reset_id()
 
     @staticmethod
@@ -1,11 +1,18 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from __future__ import annotations
+
+import copy
+from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import torch
 
-from ultralytics.utils import YAML, IterableSimpleNamespace
+from ultralytics.utils import NUM_THREADS, YAML, IterableSimpleNamespace
 from ultralytics.utils.checks import check_yaml
 
 from .bot_sort import BOTSORT
@@ -15,6 +22,158 @@ from .byte_tracker import BYTETracker
 TRACKER_MAP = {"bytetrack": BYTETracker, "botsort": BOTSORT}
 
 
+class TrackerManager:
+    """Per-stream tracker state for many video streams served by one process.
+
+    Trackers are created on first use for each logical stream ID. A frame batch may mix frames of several streams:
+    frames of one stream are tracked in order on a single worker, while different streams run in parallel on a thread
+    pool, since the bulk of tracking runs in NumPy, OpenCV and LAP kernels that release the GIL. BoT-SORT trackers
+    share one ReID encoder, whose forward passes are serialized by its predictor lock. Tracker state can be snapshotted
+    and restored, e.g. to hand a stream over to another process. Track IDs are unique per stream.
+
+    Attributes:
+        cfg (IterableSimpleNamespace): Tracker configuration shared by all streams.
+        frame_rate (int): Frame rate of the streams.
+        workers (int): Maximum number of streams updated in parallel.
+        trackers (dict[Hashable, BYTETracker]): Tracker of each stream ID.
+        encoder (Any): ReID encoder shared by the BoT-SORT trackers of all streams, None until the first is created.
+
+    Methods:
+        get: Return the tracker of a stream, creating it on first use.
+        update: Update the trackers of a frame batch and return the tracks of each frame.
+        reset: Reset the tracker of one stream or of all streams.
+        remove: Drop the tracker of a stream.
+        snapshot: Return a copy of the tracking state of a stream.
+        restore: Load a tracking state into a stream.
+
+    Examples:
+        >>> cfg = IterableSimpleNamespace(**YAML.load(check_yaml("bytetrack.yaml")))
+        >>> manager = TrackerManager(cfg)
+        >>> tracks = manager.update(["cam0", "cam1"], [boxes0, boxes1], [frame0, frame1])
+        >>> state = manager.snapshot("cam0")  # hand cam0 over to another process
+        >>> other.restore("cam0", state)
+    """
+
+    def __init__(self, cfg: IterableSimpleNamespace, frame_rate: int = 30, workers: int = NUM_THREADS):
+        """Initialize an empty manager.
+
+        Args:
+            cfg (IterableSimpleNamespace): Tracker configuration, as loaded from a tracker YAML.
+            frame_rate (int): Frame rate of the streams.
+            workers (int): Maximum number of streams updated in parallel, 1 to update sequentially.
+        """
+        if cfg.tracker_type not in TRACKER_MAP:
+            raise AssertionError(f"Only 'bytetrack' and 'botsort' are supported for now, but got '{cfg.tracker_type}'")
+        self.cfg = cfg
+        self.frame_rate = frame_rate
+        self.workers = max(1, workers)
+        self.trackers = {}
+        self.encoder = None
+        self.pool = None
+
+    def __len__(self) -> int:
+        """Return the number of streams with a tracker."""
+        return len(self.trackers)
+
+    def __contains__(self, stream: Hashable) -> bool:
+        """Return whether `stream` has a tracker."""
+        return stream in self.trackers
+
+    def get(self, stream: Hashable) -> BYTETracker:
+        """Return the tracker of `stream`, creating it on first use."""
+        if stream not in self.trackers:
+            kwargs = {"encoder": self.encoder} if self.cfg.tracker_type == "botsort" else {}
+            tracker = TRACKER_MAP[self.cfg.tracker_type](args=self.cfg, frame_rate=self.frame_rate, **kwargs)
+            self.encoder = getattr(tracker, "encoder", None)  # loaded once, reused by later streams
+            self.trackers[stream] = tracker
+        return self.trackers[stream]
+
+    def update(
+        self,
+        streams: list[Hashable],
+        results: list[Any],
+        imgs: list[np.ndarray | None],
+        feats: list[Any] | None = None,
+        reset: list[bool] | None = None,
+    ) -> list[np.ndarray]:
+        """Update the trackers of a frame batch, running different streams in parallel.
+
+        Args:
+            streams (list[Hashable]): Stream ID of each frame, frames of the same stream must be in temporal order.
+            results (list[Any]): Detections of each frame, in the format accepted by the tracker's `update`.
+            imgs (list[np.ndarray | None]): Each frame image, used for motion compensation and ReID.
+            feats (list[Any], optional): Detector features of each frame for ReID.
+            reset (list[bool], optional): Whether to reset the stream's tracker before each frame.
+
+        Returns:
+            (list[np.ndarray]): Tracks of each frame, as returned by the tracker's `update`.
+        """
+        n = len(streams)
+        feats, reset = feats or [None] * n, reset or [False] * n
+        groups = {}
+        for i, stream in enumerate(streams):
+            groups.setdefault(stream, []).append(i)
+        trackers = {stream: self.get(stream) for stream in groups}  # create in the caller thread
+        tracks = [None] * n
+
+        def run(stream: Hashable) -> None:
+            """Update one stream's tracker with its frames in order."""
+            tracker = trackers[stream]
+            for i in groups[stream]:
+                if reset[i]:
+                    tracker.reset()
+                tracks[i] = tracker.update(results[i], imgs[i], feats[i])
+
+        if len(groups) == 1 or self.workers == 1:
+            for stream in groups:
+                run(stream)
+        else:
+            if self.pool is None:
+                self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix="track")
+            list(self.pool.map(run, groups))  # re-raises the first tracker error
+        return tracks
+
+    def reset(self, stream: Hashable | None = None) -> None:
+        """Reset the tracker of `stream`, or of all streams if None."""
+        for tracker in self.trackers.values() if stream is None else [self.trackers[stream]]:
+            tracker.reset()
+
+    def remove(self, stream: Hashable) -> None:
+        """Drop the tracker of `stream`, e.g. when the stream ends."""
+        self.trackers.pop(stream, None)
+
+    def snapshot(self, stream: Hashable) -> dict[str, Any]:
+        """Return a picklable deep copy of the tracking state of `stream`.
+
+        The state holds the tracks, their Kalman filter states and IDs, and the frame counter. Models and the global
+        motion compensation reference frame are not included; motion compensation restarts from the next frame.
+
+        Args:
+            stream (Hashable): Stream ID.
+
+        Returns:
+            (dict[str, Any]): Tracking state to pass to `restore`.
+        """
+        tracker = self.trackers[stream]
+        keys = ("frame_id", "tracked_stracks", "lost_stracks", "removed_stracks", "store")
+        return copy.deepcopy({k: getattr(tracker, k) for k in keys})
+
+    def restore(self, stream: Hashable, state: dict[str, Any]) -> None:
+        """Load a tracking state returned by `snapshot` into `stream`, creating its tracker if needed.
+
+        Args:
+            stream (Hashable): Stream ID.
+            state (dict[str, Any]): Tracking state from `snapshot`, possibly of another manager or process.
+        """
+        tracker = self.get(stream)
+        for k, v in copy.deepcopy(state).items():
+            setattr(tracker, k, v)
+        for track in tracker.tracked_stracks + tracker.lost_stracks + tracker.removed_stracks:
+            track.kalman_filter = tracker.kalman_filter
+        if hasattr(tracker, "gmc"):
+            tracker.gmc.reset_params()
+
+
 def on_predict_start(predictor: object, persist: bool = False) -> None:
     """Initialize trackers for object tracking during prediction.
 
@@ -36,9 +195,6 @@ def on_predict_start(predictor: object, persist: bool = False) -> None:
     tracker = check_yaml(predictor.args.tracker)
     cfg = IterableSimpleNamespace(**YAML.load(tracker))
 
-    if cfg.tracker_type not in {"bytetrack", "botsort"}:
-        raise AssertionError(f"Only 'bytetrack' and 'botsort' are supported for now, but got '{cfg.tracker_type}'")
-
     predictor._feats = None  # reset in case used earlier
     if hasattr(predictor, "_hook"):
         predictor._hook.remove()
@@ -58,14 +214,8 @@ def on_predict_start(predictor: object, persist: bool = False) -> None:
 
             predictor._hook = predictor.model.model.model[-1].register_forward_pre_hook(pre_hook)
 
-    trackers = []
-    for _ in range(predictor.dataset.bs):
-        tracker = TRACKER_MAP[cfg.tracker_type](args=cfg, frame_rate=30)
-        trackers.append(tracker)
-        if predictor.dataset.mode != "stream":  # only need one tracker for other modes
-            break
-    predictor.trackers = trackers
-    predictor.vid_path = [None] * predictor.dataset.bs  # for determining when to reset tracker on new video
+    predictor.trackers = TrackerManager(cfg, frame_rate=30)  # one tracker per stream source, a single one otherwise
+    predictor.vid_path = {}  # for determining when to reset tracker on new video
 
 
 def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None:
@@ -82,15 +232,19 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
     """
     is_obb = predictor.args.task == "obb"
     is_stream = predictor.dataset.mode == "stream"
-    for i, result in enumerate(predictor.results):
-        tracker = predictor.trackers[i if is_stream else 0]
+    streams, reset = [], []
+    for result in predictor.results:
+        stream = result.path if is_stream else 0  # stream micro-batches may hold any subset of sources
         vid_path = predictor.save_dir / Path(result.path).name
-        if not persist and predictor.vid_path[i if is_stream else 0] != vid_path:
-            tracker.reset()
-            predictor.vid_path[i if is_stream else 0] = vid_path
+        streams.append(stream)
+        reset.append(not persist and predictor.vid_path.get(stream) != vid_path)
+        predictor.vid_path[stream] = vid_path
 
-        det = (result.obb if is_obb else result.boxes).cpu().numpy()
-        tracks = tracker.update(det, result.orig_img, getattr(result, "feats", None))
+    dets = [(r.obb if is_obb else r.boxes).cpu().numpy() for r in predictor.results]
+    imgs = [r.orig_img for r in predictor.results]
+    feats = [getattr(r, "feats", None) for r in predictor.results]
+    batch_tracks = predictor.trackers.update(streams, dets, imgs, feats, reset)
+    for i, (result, tracks) in enumerate(zip(predictor.results, batch_tracks)):
         if len(tracks) == 0:
             continue
         idx = tracks[:, -1].astype(int)
@@ -8,28 +8,42 @@ import cv2
 import numpy as np
 
 from ultralytics.utils import LOGGER
+from ultralytics.utils.ops import Profile
 
 
 class GMC:
     """Generalized Motion Compensation (GMC) class for tracking and object detection in video frames.
 
     This class provides methods for tracking and detecting objects based on several tracking algorithms including ORB,
-    SIFT, ECC, and Sparse Optical Flow. It also supports downscaling of frames for computational efficiency.
+    SIFT, ECC, and Sparse Optical Flow. It also supports downscaling of frames for computational efficiency, estimating
+    motion only every `interval` frames and extrapolating the last estimate in between, and snapping near-identity
+    motion to the identity warp on static cameras.
 
     Attributes:
         method (str): The tracking method to use. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
         downscale (int): Factor by which to downscale the frames for processing.
+        interval (int): Number of frames between motion estimates.
+        static_thresh (float): Max corner displacement in pixels below which an estimate is treated as static.
         prevFrame (np.ndarray): Previous frame for tracking.
         prevKeyPoints (list): Keypoints from the previous frame.
         prevDescriptors (np.ndarray): Descriptors from the previous frame.
         initializedFirstFrame (bool): Flag indicating if the first frame has been processed.
+        step (np.ndarray): Per-frame 3×3 warp extrapolated from the last estimate and returned between estimates.
+        static (bool): Whether the last estimate was snapped to the identity warp.
+        frames (int): Number of frames processed since the last reset.
+        estimates (int): Number of frames on which motion was actually estimated.
+        profile (Profile): Per-frame cost of `apply`, with `dt` for the last frame and `t` accumulated.
 
     Methods:
         apply: Apply the chosen method to a raw frame and optionally use provided detections.
+        background_mask: Build a keypoint mask that excludes the image border and detections.
+        update_motion: Turn a motion estimate into the warp for the current frame and the step for the next frames.
+        fractional_warp: Compute the per-frame warp that composes to a given warp over n frames.
         apply_ecc: Apply the ECC algorithm to a raw frame.
         apply_features: Apply feature-based methods like ORB or SIFT to a raw frame.
         apply_sparseoptflow: Apply the Sparse Optical Flow method to a raw frame.
         reset_params: Reset the internal parameters of the GMC object.
+        stats: Per-frame cost and estimate counts.
 
     Examples:
         Create a GMC object and apply it to a frame
@@ -38,19 +52,30 @@ class GMC:
         >>> warp = gmc.apply(frame)
         >>> print(warp.shape)
         (2, 3)
+
+        Estimate with ECC every 5th frame and skip motion on static cameras
+        >>> gmc = GMC(method="ecc", interval=5, static_thresh=0.5)
     """
 
-    def __init__(self, method: str = "sparseOptFlow", downscale: int = 2) -> None:
+    def __init__(
+        self, method: str = "sparseOptFlow", downscale: int = 2, interval: int = 1, static_thresh: float = 0.0
+    ) -> None:
         """Initialize a Generalized Motion Compensation (GMC) object with tracking method and downscale factor.
 
         Args:
             method (str): The tracking method to use. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
             downscale (int): Downscale factor for processing frames.
+            interval (int): Estimate motion every `interval` frames and extrapolate the last estimate in between.
+            static_thresh (float): Snap estimates that move every image corner by less than this many pixels to the
+                identity warp, 0 to disable.
         """
         super().__init__()
 
         self.method = method
         self.downscale = max(1, downscale)
+        self.interval = max(1, int(interval))
+        self.static_thresh = static_thresh
+        self.profile = Profile()
 
         if self.method == "orb":
             self.detector = cv2.FastFeatureDetector_create(20)
@@ -78,14 +103,14 @@ class GMC:
         else:
             raise ValueError(f"Unknown GMC method: {method}")
 
-        self.prevFrame = None
-        self.prevKeyPoints = None
-        self.prevDescriptors = None
-        self.initializedFirstFrame = False
+        self.reset_params()
 
     def apply(self, raw_frame: np.ndarray, detections: list | None = None) -> np.ndarray:
         """Estimate a 2×3 motion compensation warp for a frame.
 
+        Motion is estimated on every `interval`-th frame only; the frames in between reuse the per-frame step of the
+        last estimate without touching the image, and the next estimate corrects for what was extrapolated.
+
         Args:
             raw_frame (np.ndarray): The raw frame to be processed, with shape (H, W, C).
             detections (list, optional): List of detections to be used in the processing.
@@ -100,14 +125,91 @@ class GMC:
             >>> print(transformation_matrix.shape)
             (2, 3)
         """
-        if self.method in {"orb", "sift"}:
-            return self.apply_features(raw_frame, detections)
-        elif self.method == "ecc":
-            return self.apply_ecc(raw_frame)
-        elif self.method == "sparseOptFlow":
-            return self.apply_sparseoptflow(raw_frame)
-        else:
-            return np.eye(2, 3)
+        with self.profile:
+            self.frames += 1
+            if self.method is None:
+                return np.eye(2, 3)
+            if self.initializedFirstFrame and (self.frames - 1) % self.interval:
+                return self.step[:2].copy()  # between estimates, identity when static
+            self.estimates += 1
+            if self.method in {"orb", "sift"}:
+                H = self.apply_features(raw_frame, detections)
+            elif self.method == "ecc":
+                H = self.apply_ecc(raw_frame)
+            else:
+                H = self.apply_sparseoptflow(raw_frame, detections)
+            return self.update_motion(H, raw_frame.shape[:2])
+
+    def background_mask(self, shape: tuple[int, int], detections: list | None = None) -> np.ndarray:
+        """Build a keypoint mask for a downscaled frame that excludes the image border and detected objects.
+
+        Args:
+            shape (tuple[int, int]): Height and width of the downscaled frame.
+            detections (list, optional): Detections in original-resolution xyxy format.
+
+        Returns:
+            (np.ndarray): Uint8 mask with shape (H, W), 255 where keypoints may be placed.
+        """
+        height, width = shape
+        mask = np.zeros((height, width), dtype=np.uint8)
+        mask[int(0.02 * height) : int(0.98 * height), int(0.02 * width) : int(0.98 * width)] = 255
+        if detections is not None:
+            for x1, y1, x2, y2 in (np.clip(np.asarray(detections)[:, :4], 0, None) / self.downscale).astype(np.int_):
+                mask[y1:y2, x1:x2] = 0
+        return mask
+
+    def update_motion(self, H: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+        """Convert a motion estimate spanning `interval` frames into the warp to apply on the current frame.
+
+        The steps already applied since the previous estimate are undone, and the estimate's per-frame root becomes the
+        step extrapolated until the next estimate. Estimates moving every image corner by less than `static_thresh`
+        pixels are snapped to the identity warp.
+
+        Args:
+            H (np.ndarray): Estimated 2×3 warp from the previous estimated frame to the current frame.
+            shape (tuple[int, int]): Height and width of the original frame.
+
+        Returns:
+            (np.ndarray): Transformation matrix with shape (2, 3).
+        """
+        M = np.vstack([H, (0, 0, 1)]).astype(np.float64)
+        height, width = shape
+        corners = np.array([[0, 0], [width, 0], [0, height], [width, height]], dtype=np.float64)
+        moved = np.linalg.norm(corners @ M[:2, :2].T + M[:2, 2] - corners, axis=1).max()
+        self.static = bool(moved < self.static_thresh)
+        if self.static:
+            M = np.eye(3)
+        if self.interval > 1:
+            applied = np.linalg.matrix_power(self.step, self.interval - 1)
+            self.step = self.fractional_warp(M, self.interval)
+            M = M @ np.linalg.inv(applied)
+        return M[:2]
+
+    @staticmethod
+    def fractional_warp(M: np.ndarray, n: int) -> np.ndarray:
+        """Compute the per-frame similarity warp that, applied `n` times, gives the warp `M`.
+
+        Args:
+            M (np.ndarray): Similarity warp (rotation, uniform scale and translation) with shape (3, 3).
+            n (int): Number of frames the warp spans.
+
+        Returns:
+            (np.ndarray): Per-frame warp with shape (3, 3).
+
+        Examples:
+            >>> M = np.array([[1.0, 0.0, 10.0], [0.0, 1.0, -4.0], [0.0, 0.0, 1.0]])
+            >>> GMC.fractional_warp(M, 2)[:2, 2].tolist()
+            [5.0, -2.0]
+        """
+        if n == 1:
+            return M.copy()
+        a, b = (M[0, 0] + M[1, 1]) / 2, (M[1, 0] - M[0, 1]) / 2
+        scale, angle = np.hypot(a, b) ** (1 / n), np.arctan2(b, a) / n
+        step = np.eye(3)
+        step[:2, :2] = scale * np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        series = sum(np.linalg.matrix_power(step[:2, :2], i) for i in range(n))  # translation accumulates over steps
+        step[:2, 2] = np.linalg.solve(series, M[:2, 2])
+        return step
 
     def apply_ecc(self, raw_frame: np.ndarray) -> np.ndarray:
         """Apply the ECC (Enhanced Correlation Coefficient) algorithm to a raw frame for motion compensation.
@@ -143,8 +245,17 @@ class GMC:
         # Run the ECC algorithm to find transformation matrix
         try:
             (_, H) = cv2.findTransformECC(self.prevFrame, frame, H, self.warp_mode, self.criteria, None, 1)
+
+            # Scale translation components back to original resolution
+            if self.downscale > 1.0:
+                H[0, 2] *= self.downscale
+                H[1, 2] *= self.downscale
         except Exception as e:
             LOGGER.warning(f"findTransformECC failed; using identity warp. {e}")
+            H = np.eye(2, 3, dtype=np.float32)
+
+        # Store current frame as the reference for the next estimate
+        self.prevFrame = frame.copy()
 
         return H
 
@@ -175,15 +286,8 @@ class GMC:
             width = width // self.downscale
             height = height // self.downscale
 
-        # Create mask for keypoint detection, excluding border regions
-        mask = np.zeros_like(frame)
-        mask[int(0.02 * height) : int(0.98 * height), int(0.02 * width) : int(0.98 * width)] = 255
-
-        # Exclude detection regions from mask to avoid tracking detected objects
-        if detections is not None:
-            for det in detections:
-                tlbr = (det[:4] / self.downscale).astype(np.int_)
-                mask[tlbr[1] : tlbr[3], tlbr[0] : tlbr[2]] = 0
+        # Create mask for keypoint detection, excluding border regions and detections to avoid tracking objects
+        mask = self.background_mask(frame.shape, detections)
 
         # Find keypoints and compute descriptors
         keypoints = self.detector.detect(frame, mask)
@@ -265,11 +369,12 @@ class GMC:
 
         return H
 
-    def apply_sparseoptflow(self, raw_frame: np.ndarray) -> np.ndarray:
+    def apply_sparseoptflow(self, raw_frame: np.ndarray, detections: list | None = None) -> np.ndarray:
         """Apply Sparse Optical Flow method to a raw frame.
 
         Args:
             raw_frame (np.ndarray): The raw frame to be processed, with shape (H, W, C).
+            detections (list, optional): List of detections excluded from keypoint detection.
 
         Returns:
             (np.ndarray): Transformation matrix with shape (2, 3).
@@ -289,8 +394,10 @@ class GMC:
         if self.downscale > 1.0:
             frame = cv2.resize(frame, (width // self.downscale, height // self.downscale))
 
-        # Find good features to track
-        keypoints = cv2.goodFeaturesToTrack(frame, mask=None, **self.feature_params)
+        # Find good features to track on the background
+        keypoints = cv2.goodFeaturesToTrack(
+            frame, mask=self.background_mask(frame.shape, detections), **self.feature_params
+        )
 
         # Handle first frame initialization
         if not self.initializedFirstFrame or self.prevKeyPoints is None:
@@ -332,8 +439,24 @@ class GMC:
         return H
 
     def reset_params(self) -> None:
-        """Reset the internal parameters including previous frame, keypoints, and descriptors."""
+        """Reset the internal parameters including previous frame, keypoints, descriptors, and motion statistics."""
         self.prevFrame = None
         self.prevKeyPoints = None
         self.prevDescriptors = None
         self.initializedFirstFrame = False
+        self.step = np.eye(3)
+        self.static = False
+        self.frames = 0
+        self.estimates = 0
+        self.profile.t = 0.0
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Return the cost of the last frame and the mean per-frame cost in milliseconds, and the estimate counts."""
+        return {
+            "frames": self.frames,
+            "estimates": self.estimates,
+            "static": self.static,
+            "time": getattr(self.profile, "dt", 0.0) * 1e3 if self.frames else 0.0,
+            "mean_time": self.profile.t * 1e3 / max(self.frames, 1),
+        }
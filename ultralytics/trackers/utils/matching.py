@@ -1,7 +1,11 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from __future__ import annotations
+
 import numpy as np
 import scipy
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial.distance import cdist
 
 from ultralytics.utils.metrics import batch_probiou, bbox_ioa
@@ -17,17 +21,23 @@ except (ImportError, AssertionError, AttributeError):
     import lap
 
 
-def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = True):
+def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = True, gated: bool | None = None):
     """Perform linear assignment using either the scipy or lap.lapjv method.
 
+    In gated mode, pairs with a cost above `thresh` are never assigned, so the bipartite graph of admissible pairs is
+    split into connected components and each component is solved independently. Isolated track-detection pairs are
+    matched directly without calling a solver. For lap.lapjv with `cost_limit=thresh` this yields the same optimal
+    assignment as solving the full matrix, at a fraction of the cost for large, sparsely overlapping scenes.
+
     Args:
         cost_matrix (np.ndarray): The matrix containing cost values for assignments, with shape (N, M).
         thresh (float): Threshold for considering an assignment valid.
         use_lap (bool): Use lap.lapjv for the assignment. If False, scipy.optimize.linear_sum_assignment is used.
+        gated (bool, optional): Solve connected components of admissible pairs independently. If None, gating is used
+            for matrices with at least 4096 elements.
 
     Returns:
-        matched_indices (list[list[int]] | np.ndarray): Matched indices of shape (K, 2), where K is the number of
-            matches.
+        matched_indices (np.ndarray): Matched indices of shape (K, 2), where K is the number of matches.
         unmatched_a (np.ndarray): Unmatched indices from the first set, with shape (L,).
         unmatched_b (np.ndarray): Unmatched indices from the second set, with shape (M,).
 
@@ -39,26 +49,74 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
     if cost_matrix.size == 0:
         return np.empty((0, 2), dtype=int), tuple(range(cost_matrix.shape[0])), tuple(range(cost_matrix.shape[1]))
 
-    if use_lap:
+    if gated or (gated is None and cost_matrix.size >= 4096):
+        matches = gated_assignment(cost_matrix, thresh, use_lap)
+    elif use_lap:
         # Use lap.lapjv
         # https://github.com/gatagat/lap
-        _, x, y = lap.lapjv(cost_matrix, extend_cost=True, cost_limit=thresh)
-        matches = [[ix, mx] for ix, mx in enumerate(x) if mx >= 0]
-        unmatched_a = np.where(x < 0)[0]
-        unmatched_b = np.where(y < 0)[0]
+        _, x, _ = lap.lapjv(cost_matrix, extend_cost=True, cost_limit=thresh)
+        rows = np.flatnonzero(x >= 0)
+        matches = np.stack([rows, x[rows]], axis=1)
     else:
         # Use scipy.optimize.linear_sum_assignment
         # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.linear_sum_assignment.html
         x, y = scipy.optimize.linear_sum_assignment(cost_matrix)  # row x, col y
-        matches = np.asarray([[x[i], y[i]] for i in range(len(x)) if cost_matrix[x[i], y[i]] <= thresh])
-        if len(matches) == 0:
-            unmatched_a = list(np.arange(cost_matrix.shape[0]))
-            unmatched_b = list(np.arange(cost_matrix.shape[1]))
-        else:
-            unmatched_a = list(frozenset(np.arange(cost_matrix.shape[0])) - frozenset(matches[:, 0]))
-            unmatched_b = list(frozenset(np.arange(cost_matrix.shape[1])) - frozenset(matches[:, 1]))
+        valid = cost_matrix[x, y] <= thresh
+        matches = np.stack([x[valid], y[valid]], axis=1)
+
+    matched_a = np.zeros(cost_matrix.shape[0], dtype=bool)
+    matched_b = np.zeros(cost_matrix.shape[1], dtype=bool)
+    matched_a[matches[:, 0]] = matched_b[matches[:, 1]] = True
+    return matches, np.flatnonzero(~matched_a), np.flatnonzero(~matched_b)
+
 
-    return matches, unmatched_a, unmatched_b
+def gated_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = True) -> np.ndarray:
+    """Solve a linear assignment independently on each connected component of pairs with cost within `thresh`.
+
+    Args:
+        cost_matrix (np.ndarray): The matrix containing cost values for assignments, with shape (N, M).
+        thresh (float): Threshold for considering an assignment valid.
+        use_lap (bool): Use lap.lapjv for components with more than one track or detection.
+
+    Returns:
+        (np.ndarray): Matched indices of shape (K, 2), sorted by row.
+
+    Examples:
+        >>> cost_matrix = np.array([[0.1, 1.0, 1.0], [1.0, 0.2, 0.3], [1.0, 0.3, 0.2]])
+        >>> gated_assignment(cost_matrix, thresh=0.5)
+        array([[0, 0],
+               [1, 1],
+               [2, 2]])
+    """
+    n, m = cost_matrix.shape
+    rows, cols = np.nonzero(cost_matrix <= thresh)
+    graph = coo_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols + n)), shape=(n + m, n + m))
+    _, labels = connected_components(graph, directed=False)
+    row_labels, col_labels = labels[:n], labels[n:]
+    row_count = np.bincount(row_labels, minlength=len(labels))
+    col_count = np.bincount(col_labels, minlength=len(labels))
+    row_order, col_order = np.argsort(row_labels, kind="stable"), np.argsort(col_labels, kind="stable")
+    row_start, col_start = np.cumsum(row_count) - row_count, np.cumsum(col_count) - col_count
+
+    # Components of a single admissible pair are matched directly
+    single = np.flatnonzero((row_count == 1) & (col_count == 1))
+    rows, cols = [row_order[row_start[single]]], [col_order[col_start[single]]]
+
+    # Remaining components with at least one admissible pair are solved independently
+    for label in np.flatnonzero((row_count > 0) & (col_count > 0) & ((row_count > 1) | (col_count > 1))):
+        r = row_order[row_start[label] : row_start[label] + row_count[label]]
+        c = col_order[col_start[label] : col_start[label] + col_count[label]]
+        if use_lap:
+            _, x, _ = lap.lapjv(cost_matrix[np.ix_(r, c)], extend_cost=True, cost_limit=thresh)
+            rows.append(r[x >= 0])
+            cols.append(c[x[x >= 0]])
+        else:
+            sub, _, _ = linear_assignment(cost_matrix[np.ix_(r, c)], thresh, use_lap=False, gated=False)
+            rows.append(r[sub[:, 0]])
+            cols.append(c[sub[:, 1]])
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    order = np.argsort(rows)
+    return np.stack([rows[order], cols[order]], axis=1)
 
 
 def iou_distance(atracks: list, btracks: list) -> np.ndarray:
@@ -81,8 +139,8 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
         atlbrs = atracks
         btlbrs = btracks
     else:
-        atlbrs = [track.xywha if track.angle is not None else track.xyxy for track in atracks]
-        btlbrs = [track.xywha if track.angle is not None else track.xyxy for track in btracks]
+        atlbrs = track_boxes(atracks)
+        btlbrs = track_boxes(btracks)
 
     ious = np.zeros((len(atlbrs), len(btlbrs)), dtype=np.float32)
     if len(atlbrs) and len(btlbrs):
@@ -100,6 +158,28 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
     return 1 - ious  # cost matrix
 
 
+def track_boxes(tracks: list) -> np.ndarray:
+    """Stack the boxes of tracks into an (N, 4) xyxy array, or an (N, 5) xywha array for oriented tracks.
+
+    Args:
+        tracks (list[STrack]): Tracks or detections, converted together through `STrack.multi_tlwh`.
+
+    Returns:
+        (np.ndarray): Boxes of all tracks, in xywha format if the tracks carry an angle and xyxy format otherwise.
+
+    Examples:
+        >>> boxes = track_boxes([STrack(...), STrack(...)])
+    """
+    if not tracks:
+        return np.zeros((0, 4), dtype=np.float32)
+    boxes = tracks[0].multi_tlwh(tracks)
+    if tracks[0].angle is None:
+        boxes[:, 2:] += boxes[:, :2]
+        return boxes
+    boxes[:, :2] += boxes[:, 2:] / 2
+    return np.concatenate([boxes, np.asarray([track.angle for track in tracks]).reshape(-1, 1)], axis=1)
+
+
 def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -> np.ndarray:
     """Compute distance between tracks and detections based on embeddings.
 
@@ -145,10 +225,41 @@ def fuse_score(cost_matrix: np.ndarray, detections: list) -> np.ndarray:
         >>> detections = [BaseTrack(score=np.random.rand()) for _ in range(10)]
         >>> fused_matrix = fuse_score(cost_matrix, detections)
     """
-    if cost_matrix.size == 0:
-        return cost_matrix
-    iou_sim = 1 - cost_matrix
-    det_scores = np.array([det.score for det in detections])
-    det_scores = det_scores[None].repeat(cost_matrix.shape[0], axis=0)
-    fuse_sim = iou_sim * det_scores
-    return 1 - fuse_sim  # fuse_cost
+    return fuse_costs(cost_matrix, np.array([det.score for det in detections]))
+
+
+def fuse_costs(
+    iou_cost: np.ndarray,
+    scores: np.ndarray | None = None,
+    emb_cost: np.ndarray | None = None,
+    proximity_thresh: float = 0.5,
+    appearance_thresh: float = 0.8,
+) -> np.ndarray:
+    """Fuse IoU, detection score and appearance costs into a single cost matrix in one vectorized pass.
+
+    The IoU similarity is weighted by the detection scores. Appearance costs are halved and only kept where they are
+    within `appearance_thresh` and the pair overlaps by more than `proximity_thresh` IoU, in which case the lower of
+    both costs is used.
+
+    Args:
+        iou_cost (np.ndarray): IoU cost matrix with shape (N, M).
+        scores (np.ndarray, optional): Detection scores with shape (M,). IoU costs are not score-weighted if None.
+        emb_cost (np.ndarray, optional): Embedding cost matrix with shape (N, M). Appearance is ignored if None.
+        proximity_thresh (float): Minimum IoU for a pair to be associated by appearance.
+        appearance_thresh (float): Minimum appearance similarity for a pair to be associated by appearance.
+
+    Returns:
+        (np.ndarray): Fused cost matrix with shape (N, M).
+
+    Examples:
+        >>> iou_cost = np.random.rand(5, 10)
+        >>> fused = fuse_costs(iou_cost, scores=np.random.rand(10), emb_cost=np.random.rand(5, 10))
+    """
+    if iou_cost.size == 0:
+        return iou_cost
+    cost = iou_cost if scores is None else 1 - (1 - iou_cost) * scores[None]
+    if emb_cost is not None:
+        emb_cost = emb_cost / 2.0
+        emb_cost[(emb_cost > (1 - appearance_thresh)) | (iou_cost > (1 - proximity_thresh))] = 1.0
+        cost = np.minimum(cost, emb_cost)
+    return cost
@@ -3,9 +3,12 @@
 Benchmark YOLO model formats for speed and accuracy.
 
 Usage:
-    from ultralytics.utils.benchmarks import ProfileModels, benchmark
+    from ultralytics.utils.benchmarks import ProfileBlocks, ProfileModels, benchmark, benchmark_matching, benchmark_nms
     ProfileModels(['yolo11n.yaml', 'yolov8s.yaml']).run()
+    ProfileBlocks(['yolo11-pconv.yaml'], blocks='C3_PConv,SPPF', baseline='blocks.json').run()
     benchmark(model='yolo11n.pt', imgsz=160)
+    benchmark_nms(batch_sizes=(1, 8, 32, 64))
+    benchmark_matching(track_counts=(10, 100, 1000, 2000))
 
 Format                  | `format=argument`         | Model
 ---                     | ---                       | ---
@@ -31,11 +34,13 @@ ExecuTorch              | `executorch`              | yolo11n_executorch_model/
 from __future__ import annotations
 
 import glob
+import json
 import os
 import platform
 import re
 import shutil
 import time
+from copy import copy, deepcopy
 from pathlib import Path
 
 import numpy as np
@@ -48,7 +53,7 @@ from ultralytics.utils import ARM64, ASSETS, ASSETS_URL, IS_JETSON, LINUX, LOGGE
 from ultralytics.utils.checks import IS_PYTHON_3_13, check_imgsz, check_requirements, check_yolo, is_rockchip
 from ultralytics.utils.downloads import safe_download
 from ultralytics.utils.files import file_size
-from ultralytics.utils.torch_utils import get_cpu_info, select_device
+from ultralytics.utils.torch_utils import get_cpu_info, select_device, time_sync
 
 
 def benchmark(
@@ -183,7 +188,7 @@ def benchmark(
             exported_model.predict(ASSETS / "bus.jpg", imgsz=imgsz, device=device, half=half, verbose=False)
 
             # Validate
-            results = exported_model.val(
+            val_args = dict(
                 data=data,
                 batch=1,
                 imgsz=imgsz,
@@ -194,9 +199,17 @@ def benchmark(
                 verbose=False,
                 conf=0.001,  # all the pre-set benchmark mAP values are based on conf=0.001
             )
+            results = exported_model.val(**val_args)
             metric, speed = results.results_dict[key], results.speed["inference"]
             fps = round(1000 / (speed + eps), 2)  # frames per second
             y.append([name, "✅", round(file_size(filename), 1), round(metric, 4), round(speed, 2), fps])
+
+            # PyTorch channels-last (NHWC) memory format, compared against the NCHW row above
+            if format == "-":
+                results = exported_model.val(**val_args, channels_last=True)
+                metric, speed = results.results_dict[key], results.speed["inference"]
+                fps = round(1000 / (speed + eps), 2)
+                y.append([f"{name} NHWC", "✅", round(file_size(filename), 1), round(metric, 4), round(speed, 2), fps])
         except Exception as e:
             if verbose:
                 assert type(e) is AssertionError, f"Benchmark failure for {name}: {e}"
@@ -225,6 +238,180 @@ def benchmark(
     return df_display
 
 
+def benchmark_nms(
+    batch_sizes=(1, 2, 4, 8, 16, 32, 64),
+    nc=80,
+    anchors=8400,
+    density=0.02,
+    conf_thres=0.25,
+    iou_thres=0.7,
+    device="cpu",
+    runs=10,
+    **kwargs,
+):
+    """Benchmark batched NMS against the per-image NMS loop on synthetic detection head outputs.
+
+    Random predictions with shape (batch_size, 4 + nc, anchors) are generated where a `density` fraction of anchors has
+    one class scoring above `conf_thres`, similar to the output of a trained detector. Both NMS paths are run on the
+    same inputs and their median latency and kept box counts are reported.
+
+    Args:
+        batch_sizes (tuple[int, ...]): Batch sizes to benchmark.
+        nc (int): Number of classes.
+        anchors (int): Number of anchors per image, i.e. 8400 for imgsz=640.
+        density (float): Fraction of anchors with a score above `conf_thres`.
+        conf_thres (float): Confidence threshold passed to NMS.
+        iou_thres (float): IoU threshold passed to NMS.
+        device (str): Device to run the benchmark on, either 'cpu' or 'cuda'.
+        runs (int): Number of timed runs per batch size and NMS path.
+        **kwargs (Any): Additional keyword arguments for `non_max_suppression`, i.e. `multi_label=True`.
+
+    Returns:
+        (polars.DataFrame): A Polars DataFrame with loop and batched latency in ms per batch, speedup and whether both
+            paths kept the same number of boxes for each batch size.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_nms
+        >>> benchmark_nms(batch_sizes=(1, 8, 32), anchors=2100)
+    """
+    import polars as pl  # scope for faster 'import ultralytics'
+
+    from ultralytics.utils.nms import non_max_suppression
+
+    device = select_device(device, verbose=False)
+    y = []
+    for bs in batch_sizes:
+        xy = torch.rand(bs, 2, anchors, device=device) * 640
+        wh = torch.rand(bs, 2, anchors, device=device) * 120 + 4
+        cls = torch.rand(bs, nc, anchors, device=device) * conf_thres
+        hot = torch.rand(bs, 1, anchors, device=device) < density
+        score = torch.where(hot, conf_thres + torch.rand(bs, 1, anchors, device=device) * (1 - conf_thres), 0.0)
+        cls.scatter_(1, torch.randint(nc, (bs, 1, anchors), device=device), score)
+        prediction = torch.cat((xy, wh, cls), 1)
+
+        t, n = {}, {}
+        for batched in (False, True):
+            out = non_max_suppression(prediction.clone(), conf_thres, iou_thres, batched=batched, **kwargs)  # warmup
+            times = []
+            for _ in range(runs):
+                x = prediction.clone()  # NMS converts boxes to xyxy in place
+                t0 = time_sync()
+                non_max_suppression(x, conf_thres, iou_thres, batched=batched, **kwargs)
+                times.append((time_sync() - t0) * 1000)
+            t[batched], n[batched] = float(np.median(times)), sum(len(x) for x in out)
+        y.append([bs, round(t[False], 2), round(t[True], 2), round(t[False] / t[True], 2), n[False] == n[True]])
+
+    df = pl.DataFrame(y, schema=["Batch", "Loop (ms)", "Batched (ms)", "Speedup", "Match"], orient="row")
+    LOGGER.info(f"\nNMS benchmark for nc={nc}, anchors={anchors}, density={density} on {device}\n{df}\n")
+    return df
+
+
+def benchmark_matching(track_counts=(10, 50, 100, 500, 1000, 2000), density=2e-4, thresh=0.8, runs=5):
+    """Benchmark dense against gated linear assignment of tracker cost matrices.
+
+    Tracks with random sizes are scattered over a square canvas whose area grows with the track count so that the
+    number of overlapping neighbours per track, set by `density` in boxes per pixel, stays constant as in a crowd scene.
+    Detections are jittered copies of 90% of the tracks plus 10% new boxes. The IoU cost matrix is computed with
+    `iou_distance` and solved by `linear_assignment` with and without gating.
+
+    Args:
+        track_counts (tuple[int, ...]): Numbers of tracks to benchmark.
+        density (float): Number of boxes per pixel of canvas area.
+        thresh (float): Cost threshold passed to `linear_assignment`.
+        runs (int): Number of timed runs per track count and assignment mode.
+
+    Returns:
+        (polars.DataFrame): A Polars DataFrame with IoU cost, dense and gated assignment latency in ms, speedup and
+            whether both modes found assignments of equal total cost for each track count.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_matching
+        >>> benchmark_matching(track_counts=(10, 100, 1000))
+    """
+    import polars as pl  # scope for faster 'import ultralytics'
+
+    from ultralytics.trackers.utils.matching import iou_distance, linear_assignment
+
+    rng = np.random.default_rng(0)
+    y = []
+    for n in track_counts:
+        side = (n / density) ** 0.5
+        xy, wh = rng.uniform(0, side, (n, 2)), rng.uniform(20, 80, (n, 2))
+        tracks = np.concatenate([xy, xy + wh], 1)
+        keep = rng.random(n) < 0.9
+        new = rng.uniform(0, side, (max(n // 10, 1), 2))
+        dets = np.concatenate([tracks[keep] + rng.normal(0, 4, (keep.sum(), 4)), np.concatenate([new, new + 40], 1)], 0)
+
+        t, found = {}, {}
+        t0 = time_sync()
+        for _ in range(runs):
+            dists = iou_distance(list(tracks), list(dets))
+        t["iou"] = (time_sync() - t0) * 1000 / runs
+        for gated in (False, True):
+            times = []
+            for _ in range(runs):
+                t0 = time_sync()
+                matches, _, _ = linear_assignment(dists, thresh, gated=gated)
+                times.append((time_sync() - t0) * 1000)
+            t[gated], found[gated] = float(np.median(times)), (len(matches), dists[tuple(matches.T)].sum())
+        match = bool(found[False][0] == found[True][0] and np.isclose(found[False][1], found[True][1]))
+        y.append([n, len(dets), *(round(t[k], 2) for k in ("iou", False, True)), round(t[False] / t[True], 2), match])
+
+    df = pl.DataFrame(
+        y, schema=["Tracks", "Detections", "IoU (ms)", "Dense (ms)", "Gated (ms)", "Speedup", "Match"], orient="row"
+    )
+    LOGGER.info(f"\nTracker matching benchmark for density={density}, thresh={thresh}\n{df}\n")
+    return df
+
+
+def benchmark_ap_per_class(class_counts=(1, 10, 80, 365, 1203), detections=200000, niou=10, runs=3):
+    """Benchmark vectorized against per-class looped `ap_per_class` on synthetic validation statistics.
+
+    Detections get uniform random classes and confidences, and are true positives with a probability that grows with
+    confidence and falls with the IoU threshold. Every true positive at the lowest threshold has a label, plus 20%
+    unmatched labels, so recall never exceeds 1 as with real validation statistics.
+
+    Args:
+        class_counts (tuple[int, ...]): Numbers of classes to benchmark, e.g. 80 for COCO and 1203 for LVIS.
+        detections (int): Total number of detections over all classes.
+        niou (int): Number of IoU thresholds.
+        runs (int): Number of timed runs per class count and implementation.
+
+    Returns:
+        (polars.DataFrame): A Polars DataFrame with loop and vectorized latency in ms, speedup and whether all outputs
+            match within 1e-6 for each class count.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_ap_per_class
+        >>> benchmark_ap_per_class(class_counts=(80, 1000), detections=50000)
+    """
+    import polars as pl  # scope for faster 'import ultralytics'
+
+    from ultralytics.utils.metrics import ap_per_class
+
+    rng = np.random.default_rng(0)
+    y = []
+    for nc in class_counts:
+        conf, pred_cls = rng.random(detections), rng.integers(0, nc, detections).astype(float)
+        tp = rng.random((detections, 1)) < conf[:, None] * np.linspace(0.9, 0.2, niou)
+        target_cls = np.concatenate([pred_cls[tp[:, 0]], rng.integers(0, nc, tp[:, 0].sum() // 5).astype(float)])
+
+        t, out = {}, {}
+        for vectorized in (False, True):
+            times = []
+            for _ in range(runs):
+                t0 = time_sync()
+                out[vectorized] = ap_per_class(tp, conf, pred_cls, target_cls, vectorized=vectorized)
+                times.append((time_sync() - t0) * 1000)
+            t[vectorized] = float(np.median(times))
+        match = all(np.allclose(a, b, rtol=0, atol=1e-6) for a, b in zip(out[False], out[True]))
+        y.append([nc, round(t[False], 2), round(t[True], 2), round(t[False] / t[True], 2), match])
+
+    df = pl.DataFrame(y, schema=["Classes", "Loop (ms)", "Vectorized (ms)", "Speedup", "Match"], orient="row")
+    LOGGER.info(f"\nap_per_class benchmark for {detections} detections and {niou} IoU thresholds\n{df}\n")
+    return df
+
+
 class RF100Benchmark:
     """Benchmark YOLO model performance across various formats for speed and accuracy.
 
@@ -726,3 +913,246 @@ class ProfileModels:
         LOGGER.info(separator)
         for row in table_rows:
             LOGGER.info(row)
+
+
+class ProfileBlocks:
+    """ProfileBlocks class for microbenchmarking the individual blocks of YOLO models.
+
+    Each model is built from its YAML (or taken as an in-memory module) and run once with forward pre-hooks to record
+    the exact input shapes every layer sees. Matching layers are then profiled in isolation, so custom blocks such as
+    C3_PConv are measured at the channel and resolution combinations they run at in the shipped models. Results are
+    saved as a JSON/CSV baseline and compared against a previous baseline to flag latency regressions.
+
+    Attributes:
+        models (list[str | torch.nn.Module]): Model YAMLs, weights or modules whose blocks are profiled.
+        blocks (set[str] | None): Block class names to profile, or None to profile every layer.
+        imgsz (int): Image size of the model input used to derive per-block input shapes.
+        batch (int): Batch size of the model input.
+        num_timed_runs (int): Number of timed runs per block.
+        num_warmup_runs (int): Number of warmup runs per block.
+        device (torch.device): Device used for profiling.
+        baseline (Path | None): Path to a previous JSON baseline to compare results against.
+        tolerance (float): Allowed fractional latency increase over the baseline before a block is flagged.
+        save_dir (Path): Directory where 'blocks.json' and 'blocks.csv' are written.
+
+    Methods:
+        run: Profile all matching blocks, save the results and compare them against the baseline.
+        get_blocks: Build a model and collect its matching layers with their recorded inputs.
+        profile_block: Measure latency, FLOPs, memory and allocations of a single block.
+        compare: Flag blocks whose latency regressed beyond the tolerance.
+        save: Write results to JSON and CSV.
+
+    Examples:
+        Profile the PConv blocks of the PConv model against a stored baseline
+        >>> from ultralytics.utils.benchmarks import ProfileBlocks
+        >>> profiler = ProfileBlocks(["yolo11-pconv.yaml"], blocks="C3_PConv,SPPF", baseline="blocks.json")
+        >>> results = profiler.run()
+    """
+
+    def __init__(
+        self,
+        models: list[str | torch.nn.Module] = ("yolo11n.yaml", "yolo11-pconv.yaml", "yolo12n.yaml"),
+        blocks: str | list[str] | None = None,
+        imgsz: int = 640,
+        batch: int = 1,
+        num_timed_runs: int = 50,
+        num_warmup_runs: int = 5,
+        device: torch.device | str | None = None,
+        baseline: str | Path | None = None,
+        tolerance: float = 0.2,
+        save_dir: str | Path = ".",
+    ):
+        """Initialize the ProfileBlocks class for profiling model blocks.
+
+        Args:
+            models (list[str | torch.nn.Module]): Model YAMLs, weights or modules whose blocks are profiled.
+            blocks (str | list[str], optional): Block class names to profile, as a list or comma-separated string.
+                None or 'all' profiles every layer.
+            imgsz (int): Image size of the model input used to derive per-block input shapes.
+            batch (int): Batch size of the model input.
+            num_timed_runs (int): Number of timed runs per block.
+            num_warmup_runs (int): Number of warmup runs per block.
+            device (torch.device | str, optional): Device used for profiling. If None, it is determined automatically.
+            baseline (str | Path, optional): Path to a previous JSON baseline to compare results against.
+            tolerance (float): Allowed fractional latency increase over the baseline, i.e. 0.2 flags blocks >20% slower.
+            save_dir (str | Path): Directory where 'blocks.json' and 'blocks.csv' are written.
+        """
+        if isinstance(blocks, str):
+            blocks = None if blocks == "all" else blocks.split(",")
+        self.models = [models] if isinstance(models, (str, Path, torch.nn.Module)) else list(models)
+        self.blocks = {b.strip() for b in blocks} if blocks else None
+        self.imgsz = imgsz
+        self.batch = batch
+        self.num_timed_runs = num_timed_runs
+        self.num_warmup_runs = num_warmup_runs
+        self.device = device if isinstance(device, torch.device) else select_device(device, verbose=False)
+        self.baseline = Path(baseline) if baseline else None
+        self.tolerance = tolerance
+        self.save_dir = Path(save_dir)
+
+    def run(self) -> list[dict]:
+        """Profile all matching blocks, save the results and compare them against the baseline.
+
+        Returns:
+            (list[dict]): One result dictionary per unique block configuration, including a 'regression' flag.
+        """
+        results, seen = [], set()
+        for model in self.models:
+            for name, m, x in self.get_blocks(model):
+                block = m.type.split(".")[-1]
+                shape = str(tuple(x.shape) if isinstance(x, torch.Tensor) else [tuple(xi.shape) for xi in x])
+                key = f"{block} {shape} {m.np}"
+                if key in seen:  # identical block configuration already profiled in an earlier model
+                    continue
+                seen.add(key)
+                info = {"model": name, "layer": m.i, "key": key, "block": block, "input": shape, "params": m.np}
+                results.append({**info, **self.profile_block(m, x)})
+
+        self.compare(results)
+        self.save(results)
+        self.print_table(results)
+        return results
+
+    def get_blocks(self, model: str | torch.nn.Module) -> list[tuple[str, torch.nn.Module, torch.Tensor]]:
+        """Build a model and collect its matching layers together with the inputs they receive.
+
+        Args:
+            model (str | torch.nn.Module): Model YAML, weights or module to collect blocks from.
+
+        Returns:
+            (list[tuple[str, torch.nn.Module, torch.Tensor]]): Model name, layer module and recorded layer input.
+        """
+        model = deepcopy(model) if isinstance(model, torch.nn.Module) else YOLO(model).model
+        name = Path(model.yaml.get("yaml_file", "model") if hasattr(model, "yaml") else "model").name
+        model = model.to(self.device).eval().fuse(verbose=False)  # profile the deploy-time graph
+        layers = [m for m in model.model if self.blocks is None or m.type.split(".")[-1] in self.blocks]
+
+        inputs = {}
+
+        def record(m, args):
+            """Store the first input of each layer, copying lists that heads such as Detect modify in place."""
+            inputs.setdefault(m.i, copy(args[0]))
+
+        hooks = [m.register_forward_pre_hook(record) for m in layers]
+        try:
+            ch = model.yaml.get("channels", 3)
+            with torch.no_grad():
+                model(torch.zeros(self.batch, ch, self.imgsz, self.imgsz, device=self.device))
+        finally:
+            for h in hooks:
+                h.remove()
+        return [(name, m, inputs[m.i]) for m in layers if m.i in inputs]
+
+    def profile_block(self, m: torch.nn.Module, x: torch.Tensor | list[torch.Tensor]) -> dict:
+        """Measure latency, FLOPs, memory and allocations of a single block.
+
+        Memory is the CUDA peak allocated on GPU devices, and the total bytes allocated per call on CPU.
+
+        Args:
+            m (torch.nn.Module): Block to profile.
+            x (torch.Tensor | list[torch.Tensor]): Block input as recorded during the model forward pass.
+
+        Returns:
+            (dict): GFLOPs, latency mean and std (ms), memory (MB) and number of allocations per call.
+        """
+        try:
+            import thop
+        except ImportError:
+            thop = None  # conda support without 'ultralytics-thop' installed
+
+        try:
+            flops = thop.profile(deepcopy(m), inputs=[copy(x)], verbose=False)[0] / 1e9 * 2 if thop else 0.0  # GFLOPs
+        except Exception:
+            flops = 0.0
+
+        def forward():
+            """Run the block on its recorded input, copying list inputs that heads such as Detect modify in place."""
+            return m(x if isinstance(x, torch.Tensor) else list(x))
+
+        with torch.no_grad():
+            for _ in range(self.num_warmup_runs):
+                forward()
+            run_times = []
+            for _ in range(self.num_timed_runs):
+                t0 = time_sync()
+                forward()
+                run_times.append((time_sync() - t0) * 1000)  # ms
+
+            cuda = self.device.type == "cuda"
+            activities = [torch.profiler.ProfilerActivity.CPU] + (
+                [torch.profiler.ProfilerActivity.CUDA] if cuda else []
+            )
+            if cuda:
+                torch.cuda.reset_peak_memory_stats(self.device)
+                start = torch.cuda.memory_allocated(self.device)
+            with torch.profiler.profile(activities=activities, profile_memory=True) as prof:
+                forward()
+        allocs = [e for e in prof.events() if (e.self_device_memory_usage if cuda else e.self_cpu_memory_usage) > 0]
+        if cuda:
+            mem = torch.cuda.max_memory_allocated(self.device) - start
+        else:
+            mem = sum(e.self_cpu_memory_usage for e in allocs)
+
+        run_times = ProfileModels.iterative_sigma_clipping(np.array(run_times), sigma=2, max_iters=3)
+        return {
+            "GFLOPs": round(flops, 4),
+            "latency_ms": round(float(np.mean(run_times)), 4),
+            "latency_std_ms": round(float(np.std(run_times)), 4),
+            "memory_MB": round(mem / 1e6, 3),
+            "allocations": len(allocs),
+        }
+
+    def compare(self, results: list[dict]) -> None:
+        """Flag blocks whose latency regressed beyond the tolerance relative to the baseline.
+
+        Adds 'baseline_ms' and 'regression' keys to each result in place and logs a warning for every regression.
+
+        Args:
+            results (list[dict]): Block profiling results from `profile_block`.
+        """
+        baseline = {}
+        if self.baseline and self.baseline.is_file():
+            baseline = {r["key"]: r for r in json.loads(self.baseline.read_text())}
+        elif self.baseline:
+            LOGGER.warning(f"Baseline '{self.baseline}' not found, results will be saved without comparison.")
+        for r in results:
+            b = baseline.get(r["key"])
+            r["baseline_ms"] = b["latency_ms"] if b else None
+            r["regression"] = bool(b) and r["latency_ms"] > b["latency_ms"] * (1 + self.tolerance)
+            if r["regression"]:
+                LOGGER.warning(
+                    f"Latency regression for {r['block']} {r['input']} in {r['model']}: "
+                    f"{r['latency_ms']:.3f} ms vs baseline {b['latency_ms']:.3f} ms (+{self.tolerance:.0%} allowed)"
+                )
+
+    def save(self, results: list[dict]) -> None:
+        """Write block profiling results to 'blocks.json' and 'blocks.csv' in `save_dir`.
+
+        Args:
+            results (list[dict]): Block profiling results.
+        """
+        import polars as pl  # scope for faster 'import ultralytics'
+
+        self.save_dir.mkdir(parents=True, exist_ok=True)
+        (self.save_dir / "blocks.json").write_text(json.dumps(results, indent=2))
+        if results:
+            pl.DataFrame(results).write_csv(self.save_dir / "blocks.csv")
+        LOGGER.info(f"Block benchmarks saved to {self.save_dir / 'blocks.json'} and {self.save_dir / 'blocks.csv'}")
+
+    def print_table(self, results: list[dict]) -> None:
+        """Log a formatted table of block profiling results.
+
+        Args:
+            results (list[dict]): Block profiling results.
+        """
+        LOGGER.info(
+            f"\n{'model':>20s}{'layer':>7s}{'block':>14s}{'params':>10s}{'GFLOPs':>10s}{'latency (ms)':>16s}"
+            f"{'memory (MB)':>13s}{'allocs':>8s}  {'input'}"
+        )
+        for r in results:
+            flag = "  ⚠️ regression" if r["regression"] else ""
+            latency = f"{r['latency_ms']:.3f}±{r['latency_std_ms']:.3f}"
+            LOGGER.info(
+                f"{r['model']:>20s}{r['layer']:>7}{r['block']:>14s}{r['params']:>10}{r['GFLOPs']:>10.3f}{latency:>16s}"
+                f"{r['memory_MB']:>13.3f}{r['allocations']:>8}  {r['input']}{flag}"
+            )
@@ -58,23 +58,23 @@ def box_iou(box1: torch.Tensor, box2: torch.Tensor, eps: float = 1e-7) -> torch.
     """Calculate intersection-over-union (IoU) of boxes.
 
     Args:
-        box1 (torch.Tensor): A tensor of shape (N, 4) representing N bounding boxes in (x1, y1, x2, y2) format.
-        box2 (torch.Tensor): A tensor of shape (M, 4) representing M bounding boxes in (x1, y1, x2, y2) format.
+        box1 (torch.Tensor): A tensor of shape (..., N, 4) representing N bounding boxes in (x1, y1, x2, y2) format.
+        box2 (torch.Tensor): A tensor of shape (..., M, 4) representing M bounding boxes in (x1, y1, x2, y2) format.
         eps (float, optional): A small value to avoid division by zero.
 
     Returns:
-        (torch.Tensor): An NxM tensor containing the pairwise IoU values for every element in box1 and box2.
+        (torch.Tensor): An (..., N, M) tensor containing the pairwise IoU values for every element in box1 and box2.
 
     References:
         https://github.com/pytorch/vision/blob/main/torchvision/ops/boxes.py
     """
     # NOTE: Need .float() to get accurate iou values
     # inter(N,M) = (rb(N,M,2) - lt(N,M,2)).clamp(0).prod(2)
-    (a1, a2), (b1, b2) = box1.float().unsqueeze(1).chunk(2, 2), box2.float().unsqueeze(0).chunk(2, 2)
-    inter = (torch.min(a2, b2) - torch.max(a1, b1)).clamp_(0).prod(2)
+    (a1, a2), (b1, b2) = box1.float().unsqueeze(-2).chunk(2, -1), box2.float().unsqueeze(-3).chunk(2, -1)
+    inter = (torch.min(a2, b2) - torch.max(a1, b1)).clamp_(0).prod(-1)
 
     # IoU = inter / (area1 + area2 - inter)
-    return inter / ((a2 - a1).prod(2) + (b2 - b1).prod(2) - inter + eps)
+    return inter / ((a2 - a1).prod(-1) + (b2 - b1).prod(-1) - inter + eps)
 
 
 def bbox_iou(
@@ -740,6 +740,117 @@ def compute_ap(recall: list[float], precision: list[float]) -> tuple[float, np.n
     return ap, mpre, mrec
 
 
+def _interp_segments(x: np.ndarray, xp: np.ndarray, fp: np.ndarray, n: np.ndarray, left: float | None = None):
+    """Evaluate `np.interp` of the same x-coordinates over many consecutive segments of data points at once.
+
+    Args:
+        x (np.ndarray): Evenly spaced ascending x-coordinates at which to evaluate, shared by all segments.
+        xp (np.ndarray): X-coordinates of the data points of all segments back to back, ascending within each segment.
+        fp (np.ndarray): Y-coordinates of the data points, same length as `xp`.
+        n (np.ndarray): Number of data points in each segment.
+        left (float, optional): Value for x below the first data point of a segment, defaults to its first y value.
+
+    Returns:
+        (np.ndarray): Interpolated values of shape (len(n), len(x)), identical to `np.interp` per segment.
+    """
+    nx, start = len(x), np.cumsum(n) - n
+    k = np.ceil((xp - x[0]) / (x[-1] - x[0]) * (nx - 1)).clip(0, nx).astype(int)  # first x >= xp, up to rounding
+    k -= (k > 0) & (x[k - 1] >= xp)
+    k += (k < nx) & (x[np.minimum(k, nx - 1)] < xp)  # exact np.searchsorted(x, xp)
+    k += np.repeat(np.arange(len(n)) * (nx + 1), n)
+    count = np.bincount(k, minlength=len(n) * (nx + 1)).reshape(-1, nx + 1).cumsum(1)[:, :-1]  # points <= x
+    j = start[:, None] + np.maximum(count - 1, 0)  # last point <= x, which np.interp interpolates from
+    j1 = np.minimum(j + 1, (start + n - 1)[:, None])
+    xj, fj = xp[j], fp[j]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = (fp[j1] - fj) / (xp[j1] - xj) * (x - xj) + fj
+    y = np.where((count == n[:, None]) | (xj == x), fj, y)
+    return np.where(count == 0, fp[start, None] if left is None else left, y)
+
+
+def _ap_curves(
+    tp: np.ndarray,
+    conf: np.ndarray,
+    pred_cls: np.ndarray,
+    n_pred: np.ndarray,
+    unique_classes: np.ndarray,
+    nt: np.ndarray,
+    x: np.ndarray,
+    eps: float = 1e-16,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute AP, precision and recall curves for all classes and IoU thresholds at once.
+
+    Detections sorted by descending confidence are stably grouped by class, so every class is a contiguous segment in
+    the same order a per-class loop would see it. Cumulative TP and FP counts, the precision envelope and all
+    interpolations are then computed per segment with array operations, matching `compute_ap` for each class.
+
+    Args:
+        tp (np.ndarray): True positives of the detections sorted by descending confidence, shape (N, niou).
+        conf (np.ndarray): Sorted confidence scores of the detections, shape (N,).
+        pred_cls (np.ndarray): Predicted classes of the sorted detections, shape (N,).
+        n_pred (np.ndarray): Number of detections each row stands for, shape (N, 1).
+        unique_classes (np.ndarray): Sorted classes that have labels, shape (nc,).
+        nt (np.ndarray): Number of labels of each class, shape (nc,).
+        x (np.ndarray): Evenly spaced confidence and recall values at which the curves are sampled.
+        eps (float, optional): A small value to avoid division by zero.
+
+    Returns:
+        ap (np.ndarray): Average precision for each class and IoU threshold, shape (nc, niou).
+        p_curve (np.ndarray): Precision curves for each class, shape (nc, len(x)).
+        r_curve (np.ndarray): Recall curves for each class, shape (nc, len(x)).
+        prec_values (np.ndarray): Precision at mAP@0.5 for each class with detections, shape (n, len(x)).
+    """
+    nc, niou = unique_classes.shape[0], tp.shape[1]
+    ap, p_curve, r_curve = np.zeros((nc, niou)), np.zeros((nc, len(x))), np.zeros((nc, len(x)))
+    ci = np.searchsorted(unique_classes, pred_cls).clip(max=max(nc - 1, 0))
+    i = np.flatnonzero(unique_classes[ci] == pred_cls) if nc else np.zeros(0, dtype=int)  # classes with labels
+    i = i[np.argsort(ci[i], kind="stable")]  # group by class, keeping the confidence order within each class
+    n = np.bincount(ci[i], minlength=nc)
+    c = np.flatnonzero(n)  # classes with detections
+    if not len(c):
+        return ap, p_curve, r_curve, np.zeros((0, len(x)))
+    n, start = n[c], np.cumsum(n[c]) - n[c]
+
+    def cumsum(a):
+        """Cumulative sum along the detections that restarts at every class."""
+        a = a.cumsum(1)
+        a[:, n[0] :] -= np.repeat(a[:, start[1:] - 1], n[1:], 1)
+        return a
+
+    # Accumulate FPs and TPs, one row per IoU threshold
+    tpc = cumsum(np.ascontiguousarray(tp[i].T))
+    fpc = cumsum(n_pred[i].T) - tpc
+    recall = tpc / (nt[ci[i]] + eps)
+    precision = tpc / (tpc + fpc)
+    r_curve[c] = _interp_segments(-x[::-1], -conf[i], recall[0], n, left=0)[:, ::-1]  # ascending -x as xp decreases
+    p_curve[c] = _interp_segments(-x[::-1], -conf[i], precision[0], n, left=1)[:, ::-1]
+
+    # Append sentinel values to beginning and end of every class, plus a zero column that absorbs padding
+    k = np.arange(len(c))
+    m, start = len(i) + 2 * len(c), start + 2 * k
+    mrec, mpre = np.zeros((niou, m)), np.zeros((niou, m + 1))
+    rows = np.arange(len(i)) + np.repeat(2 * k + 1, n)
+    mrec[:, rows], mpre[:, rows] = recall, precision
+    mrec[:, start + n + 1], mpre[:, start] = 1.0, 1.0
+
+    # Compute the precision envelopes, padding classes of similar length (within 2x) into one array per bucket
+    bucket = np.ceil(np.log2(n + 2)).astype(int)
+    for b in np.unique(bucket):
+        sb = np.flatnonzero(bucket == b)
+        idx = start[sb, None] + np.arange(n[sb].max() + 2)
+        idx[idx >= (start + n + 2)[sb, None]] = m  # zero padding after the end sentinel leaves the max unchanged
+        mpre[:, idx] = np.flip(np.maximum.accumulate(np.flip(mpre[:, idx], 2), 2), 2)
+        mpre[:, m] = 0.0
+    mpre = mpre[:, :m]
+
+    # Integrate area under all curves with 101-point interpolation (COCO)
+    x101 = np.linspace(0, 1, 101)
+    func = np.trapezoid if checks.check_version(np.__version__, ">=2.0") else np.trapz  # np.trapz deprecated
+    y = _interp_segments(x101, mrec.ravel(), mpre.ravel(), np.tile(n + 2, niou))
+    ap[c] = func(y, x101).reshape(niou, len(c)).T
+    return ap, p_curve, r_curve, _interp_segments(x, mrec[0], mpre[0], n + 2)
+
+
 def ap_per_class(
     tp: np.ndarray,
     conf: np.ndarray,
@@ -751,6 +862,8 @@ def ap_per_class(
     names: dict[int, str] = {},
     eps: float = 1e-16,
     prefix: str = "",
+    n_pred: np.ndarray | None = None,
+    vectorized: bool = True,
 ) -> tuple:
     """Compute the average precision per class for object detection evaluation.
 
@@ -765,6 +878,10 @@ def ap_per_class(
         names (dict[int, str], optional): Dictionary of class names to plot PR curves.
         eps (float, optional): A small value to avoid division by zero.
         prefix (str, optional): A prefix string for saving the plot files.
+        n_pred (np.ndarray, optional): Number of detections each row stands for when the inputs are binned, in which
+            case `tp` holds true positive counts instead of booleans.
+        vectorized (bool, optional): Whether to compute all classes and IoU thresholds at once instead of looping over
+            classes, with identical results.
 
     Returns:
         tp (np.ndarray): True positive counts at threshold given by max F1 metric for each class.
@@ -783,6 +900,7 @@ def ap_per_class(
     # Sort by objectness
     i = np.argsort(-conf)
     tp, conf, pred_cls = tp[i], conf[i], pred_cls[i]
+    n_pred = np.ones((len(i), 1)) if n_pred is None else n_pred[i, None]
 
     # Find unique classes
     unique_classes, nt = np.unique(target_cls, return_counts=True)
@@ -792,33 +910,36 @@ def ap_per_class(
     x, prec_values = np.linspace(0, 1, 1000), []
 
     # Average precision, precision and recall curves
-    ap, p_curve, r_curve = np.zeros((nc, tp.shape[1])), np.zeros((nc, 1000)), np.zeros((nc, 1000))
-    for ci, c in enumerate(unique_classes):
-        i = pred_cls == c
-        n_l = nt[ci]  # number of labels
-        n_p = i.sum()  # number of predictions
-        if n_p == 0 or n_l == 0:
-            continue
-
-        # Accumulate FPs and TPs
-        fpc = (1 - tp[i]).cumsum(0)
-        tpc = tp[i].cumsum(0)
-
-        # Recall
-        recall = tpc / (n_l + eps)  # recall curve
-        r_curve[ci] = np.interp(-x, -conf[i], recall[:, 0], left=0)  # negative x, xp because xp decreases
-
-        # Precision
-        precision = tpc / (tpc + fpc)  # precision curve
-        p_curve[ci] = np.interp(-x, -conf[i], precision[:, 0], left=1)  # p at pr_score
-
-        # AP from recall-precision curve
-        for j in range(tp.shape[1]):
-            ap[ci, j], mpre, mrec = compute_ap(recall[:, j], precision[:, j])
-            if j == 0:
-                prec_values.append(np.interp(x, mrec, mpre))  # precision at mAP@0.5
-
-    prec_values = np.array(prec_values) if prec_values else np.zeros((1, 1000))  # (nc, 1000)
+    if vectorized:
+        ap, p_curve, r_curve, prec_values = _ap_curves(tp, conf, pred_cls, n_pred, unique_classes, nt, x, eps)
+    else:
+        ap, p_curve, r_curve = np.zeros((nc, tp.shape[1])), np.zeros((nc, 1000)), np.zeros((nc, 1000))
+        for ci, c in enumerate(unique_classes):
+            i = pred_cls == c
+            n_l = nt[ci]  # number of labels
+            n_p = i.sum()  # number of predictions
+            if n_p == 0 or n_l == 0:
+                continue
+
+            # Accumulate FPs and TPs
+            fpc = (n_pred[i] - tp[i]).cumsum(0)
+            tpc = tp[i].cumsum(0)
+
+            # Recall
+            recall = tpc / (n_l + eps)  # recall curve
+            r_curve[ci] = np.interp(-x, -conf[i], recall[:, 0], left=0)  # negative x, xp because xp decreases
+
+            # Precision
+            precision = tpc / (tpc + fpc)  # precision curve
+            p_curve[ci] = np.interp(-x, -conf[i], precision[:, 0], left=1)  # p at pr_score
+
+            # AP from recall-precision curve
+            for j in range(tp.shape[1]):
+                ap[ci, j], mpre, mrec = compute_ap(recall[:, j], precision[:, j])
+                if j == 0:
+                    prec_values.append(np.interp(x, mrec, mpre))  # precision at mAP@0.5
+
+    prec_values = np.array(prec_values) if len(prec_values) else np.zeros((1, 1000))  # (nc, 1000)
 
     # Compute F1 (harmonic mean of precision and recall)
     f1_curve = 2 * p_curve * r_curve / (p_curve + r_curve + eps)
@@ -1012,11 +1133,16 @@ class DetMetrics(SimpleClass, DataExportMixin):
         task (str): The task type, set to 'detect'.
         stats (dict[str, list]): A dictionary containing lists for true positives, confidence scores, predicted classes,
             target classes, and target images.
+        bins (int): Number of confidence bins per class for constant-memory accumulation, 0 to keep exact stats.
+        hist (dict[str, np.ndarray]): Per-class confidence histograms of prediction and true positive counts, and
+            per-class target counts, used instead of `stats` when `bins > 0`.
         nt_per_class: Number of targets per class.
         nt_per_image: Number of targets per image.
 
     Methods:
         update_stats: Update statistics by appending new values to existing stat collections.
+        tp_keys: Return the stats keys holding true positive matrices.
+        binned_stats: Expand the confidence histograms into one weighted row per non-empty class and bin.
         process: Process predicted results for object detection and update metrics.
         clear_stats: Clear the stored statistics.
         keys: Return a list of keys for accessing specific metrics.
@@ -1031,29 +1157,78 @@ class DetMetrics(SimpleClass, DataExportMixin):
         summary: Generate a summarized representation of per-class detection metrics as a list of dictionaries.
     """
 
-    def __init__(self, names: dict[int, str] = {}) -> None:
+    def __init__(self, names: dict[int, str] = {}, bins: int = 0) -> None:
         """Initialize a DetMetrics instance with a save directory, plot flag, and class names.
 
         Args:
             names (dict[int, str], optional): Dictionary of class names.
+            bins (int, optional): Number of confidence bins per class, 0 to keep exact per-prediction stats.
         """
         self.names = names
         self.box = Metric()
         self.speed = {"preprocess": 0.0, "inference": 0.0, "loss": 0.0, "postprocess": 0.0}
         self.task = "detect"
         self.stats = dict(tp=[], conf=[], pred_cls=[], target_cls=[], target_img=[])
+        self.bins = bins
+        self.hist = {}
         self.nt_per_class = None
         self.nt_per_image = None
 
     def update_stats(self, stat: dict[str, Any]) -> None:
         """Update statistics by appending new values to existing stat collections.
 
+        With `bins > 0` the values are added to fixed-size per-class confidence histograms instead, so memory does not
+        grow with the number of validated images.
+
         Args:
             stat (dict[str, any]): Dictionary containing new statistical values to append. Keys should match existing
                 keys in self.stats.
         """
-        for k in self.stats.keys():
-            self.stats[k].append(stat[k])
+        if not self.bins:
+            for k in self.stats.keys():
+                self.stats[k].append(stat[k])
+            return
+
+        nc = len(self.names)
+        if not self.hist:  # allocate on first update once the number of IoU thresholds is known
+            self.hist = {k: np.zeros((nc, self.bins, stat[k].shape[1]), dtype=np.int64) for k in self.tp_keys}
+            self.hist["n_pred"] = np.zeros((nc, self.bins), dtype=np.int64)
+            self.hist["target_cls"] = np.zeros(nc, dtype=np.int64)
+            self.hist["target_img"] = np.zeros(nc, dtype=np.int64)
+        idx = stat["pred_cls"].astype(int), np.clip((stat["conf"] * self.bins).astype(int), 0, self.bins - 1)
+        np.add.at(self.hist["n_pred"], idx, 1)
+        for k in self.tp_keys:
+            np.add.at(self.hist[k], idx, stat[k])
+        self.hist["target_cls"] += np.bincount(stat["target_cls"].astype(int), minlength=nc)
+        self.hist["target_img"] += np.bincount(stat["target_img"].astype(int), minlength=nc)
+
+    @property
+    def tp_keys(self) -> list[str]:
+        """Return the stats keys holding true positive matrices."""
+        return [k for k in self.stats if k.startswith("tp")]
+
+    def binned_stats(self) -> dict[str, np.ndarray]:
+        """Expand the confidence histograms into one weighted row per non-empty class and bin.
+
+        Each row carries the bin center as confidence, its true positive counts and its prediction count in `n_pred`,
+        which `ap_per_class` accumulates exactly like the per-prediction rows of the exact mode.
+
+        Returns:
+            (dict[str, np.ndarray]): Statistics arrays in the layout of the exact mode plus `n_pred`.
+        """
+        if not self.hist:
+            return {}
+        n_pred = self.hist["n_pred"]
+        c, b = np.nonzero(n_pred)
+        classes = np.arange(len(n_pred))
+        return {
+            **{k: self.hist[k][c, b] for k in self.tp_keys},
+            "conf": (b + 0.5) / self.bins,
+            "pred_cls": c,
+            "n_pred": n_pred[c, b],
+            "target_cls": np.repeat(classes, self.hist["target_cls"]),
+            "target_img": np.repeat(classes, self.hist["target_img"]),
+        }
 
     def process(self, save_dir: Path = Path("."), plot: bool = False, on_plot=None) -> dict[str, np.ndarray]:
         """Process predicted results for object detection and update metrics.
@@ -1066,7 +1241,7 @@ class DetMetrics(SimpleClass, DataExportMixin):
         Returns:
             (dict[str, np.ndarray]): Dictionary containing concatenated statistics arrays.
         """
-        stats = {k: np.concatenate(v, 0) for k, v in self.stats.items()}  # to numpy
+        stats = self.binned_stats() if self.bins else {k: np.concatenate(v, 0) for k, v in self.stats.items()}
         if not stats:
             return stats
         results = ap_per_class(
@@ -1079,6 +1254,7 @@ class DetMetrics(SimpleClass, DataExportMixin):
             names=self.names,
             on_plot=on_plot,
             prefix="Box",
+            n_pred=stats.get("n_pred"),
         )[2:]
         self.box.nc = len(self.names)
         self.box.update(results)
@@ -1090,6 +1266,7 @@ class DetMetrics(SimpleClass, DataExportMixin):
         """Clear the stored statistics."""
         for v in self.stats.values():
             v.clear()
+        self.hist = {}
 
     @property
     def keys(self) -> list[str]:
@@ -1230,6 +1407,7 @@ class SegmentMetrics(DetMetrics):
             save_dir=save_dir,
             names=self.names,
             prefix="Mask",
+            n_pred=stats.get("n_pred"),
         )[2:]
         self.seg.nc = len(self.names)
         self.seg.update(results_mask)
@@ -1368,6 +1546,7 @@ class PoseMetrics(DetMetrics):
             save_dir=save_dir,
             names=self.names,
             prefix="Pose",
+            n_pred=stats.get("n_pred"),
         )[2:]
         self.pose.nc = len(self.names)
         self.pose.update(results_pose)
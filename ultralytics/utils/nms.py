@@ -1,5 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from __future__ import annotations
+
 import sys
 import time
 
@@ -26,6 +28,8 @@ def non_max_suppression(
     rotated: bool = False,
     end2end: bool = False,
     return_idxs: bool = False,
+    batched: bool | None = None,
+    nms_mode: str = "auto",
 ):
     """Perform non-maximum suppression (NMS) on prediction results.
 
@@ -49,6 +53,12 @@ def non_max_suppression(
         rotated (bool): Whether to handle Oriented Bounding Boxes (OBB).
         end2end (bool): Whether the model is end-to-end and doesn't require NMS.
         return_idxs (bool): Whether to return the indices of kept detections.
+        batched (bool | None): Whether to filter and suppress the whole batch at once instead of looping over images.
+            None enables it for batches larger than 1. Rotated boxes and a priori labels always use the per-image loop.
+        nms_mode (str): NMS candidate strategy for dense scenes, one of 'auto', 'topk' or 'tiled'. 'topk' runs NMS on
+            the top-k boxes of each class and grows k until the result is provably unchanged, 'tiled' runs NMS over
+            score-sorted tiles with bounded IoU memory and stops once max_det boxes are kept. Both return the same
+            detections as 'auto' and use the per-image loop.
 
     Returns:
         output (list[torch.Tensor]): List of detections per image with shape (num_boxes, 6 + num_masks) containing (x1,
@@ -58,6 +68,7 @@ def non_max_suppression(
     # Checks
     assert 0 <= conf_thres <= 1, f"Invalid Confidence threshold {conf_thres}, valid values are between 0.0 and 1.0"
     assert 0 <= iou_thres <= 1, f"Invalid IoU {iou_thres}, valid values are between 0.0 and 1.0"
+    assert nms_mode in {"auto", "topk", "tiled"}, f"Invalid nms_mode '{nms_mode}', valid values are auto, topk, tiled"
     if isinstance(prediction, (list, tuple)):  # YOLOv8 model in validation model, output = (inference_out, loss_out)
         prediction = prediction[0]  # select only inference output
     if classes is not None:
@@ -86,6 +97,16 @@ def non_max_suppression(
         prediction[..., :4] = xywh2xyxy(prediction[..., :4])  # xywh to xyxy
 
     t = time.time()
+    if batched is None:
+        batched = bs > 1
+    if batched and nms_mode == "auto" and not rotated and not labels:
+        output, keepi = _batched_nms(
+            prediction, xc, conf_thres, iou_thres, classes, agnostic, multi_label, max_det, nc, max_nms, max_wh
+        )
+        if (time.time() - t) > time_limit:
+            LOGGER.warning(f"NMS time limit {time_limit:.3f}s exceeded")
+        return (output, keepi) if return_idxs else output
+
     output = [torch.zeros((0, 6 + extra), device=prediction.device)] * bs
     keepi = [torch.zeros((0, 1), device=prediction.device)] * bs  # to store the kept idxs
     for xi, (x, xk) in enumerate(zip(prediction, xinds)):  # image index, (preds, preds indices)
@@ -144,16 +165,12 @@ def non_max_suppression(
         scores = x[:, 4]  # scores
         if rotated:
             boxes = torch.cat((x[:, :2] + c, x[:, 2:4], x[:, -1:]), dim=-1)  # xywhr
-            i = TorchNMS.fast_nms(boxes, scores, iou_thres, iou_func=batch_probiou)
         else:
             boxes = x[:, :4] + c  # boxes (offset by class)
-            # Speed strategy: torchvision for val or already loaded (faster), TorchNMS for predict (lower latency)
-            if "torchvision" in sys.modules:
-                import torchvision  # scope as slow import
-
-                i = torchvision.ops.nms(boxes, scores, iou_thres)
-            else:
-                i = TorchNMS.nms(boxes, scores, iou_thres)
+        if nms_mode == "topk":
+            i = _topk_nms(boxes, scores, x[:, 5] * (not agnostic), iou_thres, max_det, rotated)
+        else:
+            i = _nms(boxes, scores, iou_thres, rotated, nms_mode == "tiled", max_det)
         i = i[:max_det]  # limit detections
 
         output[xi] = x[i]
@@ -166,6 +183,169 @@ def non_max_suppression(
     return (output, keepi) if return_idxs else output
 
 
+def _nms(
+    boxes: torch.Tensor, scores: torch.Tensor, iou_thres: float, rotated: bool, tiled: bool = False, max_det: int = 0
+) -> torch.Tensor:
+    """Run the NMS kernel for one image and return kept indices in descending confidence order.
+
+    Args:
+        boxes (torch.Tensor): Class-offset boxes with shape (N, 4) in xyxy format, or (N, 5) in xywhr format if rotated.
+        scores (torch.Tensor): Confidence scores with shape (N,).
+        iou_thres (float): IoU threshold for NMS filtering.
+        rotated (bool): Whether boxes are Oriented Bounding Boxes (OBB).
+        tiled (bool): Whether to use `TorchNMS.tiled_nms` with bounded memory and early exit after `max_det` boxes.
+        max_det (int): Number of kept boxes after which tiled NMS may stop, 0 to keep all.
+
+    Returns:
+        (torch.Tensor): Indices of boxes to keep after NMS.
+    """
+    if tiled:
+        iou_func = batch_probiou if rotated else TorchNMS.box_iou
+        return TorchNMS.tiled_nms(boxes, scores, iou_thres, iou_func=iou_func, fast=rotated, max_det=max_det)
+    if rotated:
+        return TorchNMS.fast_nms(boxes, scores, iou_thres, iou_func=batch_probiou)
+    # Speed strategy: torchvision for val or already loaded (faster), TorchNMS for predict (lower latency)
+    if "torchvision" in sys.modules:
+        import torchvision  # scope as slow import
+
+        return torchvision.ops.nms(boxes, scores, iou_thres)
+    return TorchNMS.nms(boxes, scores, iou_thres)
+
+
+def _topk_nms(
+    boxes: torch.Tensor, scores: torch.Tensor, cls: torch.Tensor, iou_thres: float, max_det: int, rotated: bool
+) -> torch.Tensor:
+    """Run NMS on the top-k boxes of each class, growing k until the first `max_det` kept boxes are exact.
+
+    Boxes are offset by class, so NMS decisions for a box only depend on higher scoring boxes of its own class and the
+    kept boxes among the top-k of a class match a full NMS run. The result is final once every truncated class already
+    keeps `max_det` boxes, or once the `max_det`-th kept box scores above every dropped box.
+
+    Args:
+        boxes (torch.Tensor): Class-offset boxes with shape (N, 4) in xyxy format, or (N, 5) in xywhr format if rotated.
+        scores (torch.Tensor): Confidence scores with shape (N,).
+        cls (torch.Tensor): Class index of each box with shape (N,), all zeros for class-agnostic NMS.
+        iou_thres (float): IoU threshold for NMS filtering.
+        max_det (int): Maximum number of detections to keep.
+        rotated (bool): Whether boxes are Oriented Bounding Boxes (OBB).
+
+    Returns:
+        (torch.Tensor): Indices of boxes to keep after NMS, in descending confidence order.
+    """
+    cls = cls.long()
+    order = (cls.double() * 2 - scores.double()).argsort()  # by class, then descending confidence
+    counts = torch.bincount(cls)
+    rank = torch.empty_like(order)
+    rank[order] = torch.arange(len(order), device=order.device) - (counts.cumsum(0) - counts)[cls[order]]
+    k = max(max_det, 1)
+    while True:
+        sel = (rank < k).nonzero().view(-1)
+        i = sel[_nms(boxes[sel], scores[sel], iou_thres, rotated)]
+        if len(sel) == len(scores):
+            return i
+        if len(i) >= max_det and scores[i[max_det - 1]] > scores[rank >= k].max():
+            return i  # every dropped box scores below the last detection
+        if ((counts <= k) | (torch.bincount(cls[i], minlength=len(counts)) >= max_det)).all():
+            return i  # every truncated class already fills max_det
+        k *= 4
+
+
+def _batched_nms(
+    prediction: torch.Tensor,
+    xc: torch.Tensor,
+    conf_thres: float,
+    iou_thres: float,
+    classes: torch.Tensor | None,
+    agnostic: bool,
+    multi_label: bool,
+    max_det: int,
+    nc: int,
+    max_nms: int,
+    max_wh: int,
+) -> tuple[list[torch.Tensor], list[torch.Tensor]]:
+    """Run NMS over a whole batch at once and scatter the kept detections back to their images.
+
+    Candidates from all images are flattened into one set and filtered together. On CUDA with torchvision available,
+    boxes are offset by class (as in the per-image loop) and by image index in float64, so a single NMS call over the
+    flattened batch cannot suppress across images or classes. The CPU torchvision kernel scales with the total number
+    of boxes times kept boxes, so there it runs per image on the already filtered candidates, and without torchvision
+    all images are suppressed together by `TorchNMS.padded_nms`. The per-image `max_nms` and `max_det` limits match the
+    per-image loop in `non_max_suppression`.
+
+    Args:
+        prediction (torch.Tensor): Predictions with shape (batch_size, num_boxes, 4 + nc + num_extra) in xyxy format.
+        xc (torch.Tensor): Boolean candidate mask with shape (batch_size, num_boxes).
+        conf_thres (float): Confidence threshold for filtering detections.
+        iou_thres (float): IoU threshold for NMS filtering.
+        classes (torch.Tensor | None): Class indices to keep, or None for all classes.
+        agnostic (bool): Whether to perform class-agnostic NMS.
+        multi_label (bool): Whether each box can have multiple labels.
+        max_det (int): Maximum number of detections to keep per image.
+        nc (int): Number of classes.
+        max_nms (int): Maximum number of boxes per image passed to NMS.
+        max_wh (int): Maximum box width and height in pixels, used as the class offset.
+
+    Returns:
+        output (list[torch.Tensor]): Detections per image with shape (num_boxes, 6 + num_extra).
+        keepi (list[torch.Tensor]): Indices of kept detections into the original anchors for each image.
+    """
+    bs, device = prediction.shape[0], prediction.device
+    extra = prediction.shape[-1] - nc - 4
+    b, k = xc.nonzero(as_tuple=True)  # image and anchor index of each candidate
+    x = prediction[b, k]
+    box, cls, mask = x.split((4, nc, extra), 1)
+    if multi_label:
+        i, j = torch.where(cls > conf_thres)
+        x = torch.cat((box[i], x[i, 4 + j, None], j[:, None].float(), mask[i]), 1)
+        b, k = b[i], k[i]
+    else:  # best class only
+        conf, j = cls.max(1, keepdim=True)
+        filt = conf.view(-1) > conf_thres
+        x = torch.cat((box, conf, j.float(), mask), 1)[filt]
+        b, k = b[filt], k[filt]
+    if classes is not None:
+        filt = (x[:, 5:6] == classes).any(1)
+        x, b, k = x[filt], b[filt], k[filt]
+
+    # Sort by image then descending confidence, keeping the top max_nms boxes per image
+    order = (b.double() * 2 - x[:, 4].double()).argsort()
+    x, b, k = x[order], b[order], k[order]
+    counts = torch.bincount(b, minlength=bs)
+    rank = torch.arange(len(b), device=device) - (counts.cumsum(0) - counts)[b]  # position within each image
+    if len(b) and counts.max() > max_nms:
+        filt = rank < max_nms
+        x, b, k, rank, counts = x[filt], b[filt], k[filt], rank[filt], counts.clamp(max=max_nms)
+
+    boxes = x[:, :4] + x[:, 5:6] * (0 if agnostic else max_wh)  # class offsets
+    tv = "torchvision" in sys.modules
+    if tv and device.type == "cuda":  # one NMS over the flattened batch with image offsets
+        import torchvision  # scope as slow import
+
+        step = ((1 if agnostic else nc) + 1) * max_wh  # image offset larger than any class-offset box
+        boxes = boxes.double() + b[:, None].double() * step
+        i = torchvision.ops.nms(boxes, x[:, 4].double(), iou_thres).sort()[0]  # regroup by image in score order
+    elif not tv and (not len(b) or rank.max() < 2048):  # vectorized greedy NMS over padded images
+        i = TorchNMS.padded_nms(boxes, b, rank, iou_thres)
+    else:  # CPU greedy NMS scales with all boxes times kept boxes, so run it image by image on the candidates
+        if tv:
+            import torchvision  # scope as slow import
+
+            nms = torchvision.ops.nms
+        else:
+            nms = TorchNMS.nms
+        starts = (counts.cumsum(0) - counts).tolist()
+        i = torch.cat(
+            [nms(boxes[s : s + n], x[s : s + n, 4], iou_thres).sort()[0] + s for s, n in zip(starts, counts.tolist())]
+        )
+
+    # Limit detections per image
+    counts = torch.bincount(b[i], minlength=bs)
+    rank = torch.arange(len(i), device=device) - (counts.cumsum(0) - counts)[b[i]]
+    i = i[rank < max_det]
+    counts = counts.clamp(max=max_det).tolist()
+    return list(x[i].split(counts)), list(k[i].split(counts))
+
+
 class TorchNMS:
     """Ultralytics custom NMS implementation optimized for YOLO.
 
@@ -335,3 +515,141 @@ class TorchNMS:
             if use_fast_nms
             else TorchNMS.nms(boxes_for_nms, scores, iou_threshold)
         )
+
+    @staticmethod
+    def padded_nms(
+        boxes: torch.Tensor,
+        idxs: torch.Tensor,
+        rank: torch.Tensor,
+        iou_threshold: float,
+        max_elements: int = 2**22,
+    ) -> torch.Tensor:
+        """Greedy NMS for many images at once with boxes padded to a (num_images, max_boxes, 4) tensor.
+
+        Suppression is solved with the Cluster-NMS fixed-point iteration (https://arxiv.org/abs/2005.03572) on the
+        per-image IoU matrices, which gives exactly the greedy NMS result in a few vectorized steps instead of one
+        step per kept box. Images are processed in chunks so that each IoU tensor holds at most `max_elements` values.
+
+        Args:
+            boxes (torch.Tensor): Bounding boxes with shape (N, 4) in xyxy format, sorted by image index and then by
+                descending confidence within each image.
+            idxs (torch.Tensor): Image index of each box with shape (N,).
+            rank (torch.Tensor): Position of each box within its image with shape (N,).
+            iou_threshold (float): IoU threshold for suppression.
+            max_elements (int): Maximum number of IoU matrix elements computed at once.
+
+        Returns:
+            (torch.Tensor): Ascending indices of boxes to keep after NMS, grouped by image in descending confidence.
+
+        Examples:
+            Apply NMS to two images with two boxes each
+            >>> boxes = torch.tensor([[0, 0, 10, 10], [1, 1, 10, 10], [0, 0, 10, 10], [20, 20, 30, 30]]).float()
+            >>> keep = TorchNMS.padded_nms(boxes, torch.tensor([0, 0, 1, 1]), torch.tensor([0, 1, 0, 1]), 0.5)
+        """
+        if boxes.numel() == 0:
+            return torch.empty((0,), dtype=torch.int64, device=boxes.device)
+
+        n, m = int(idxs.max()) + 1, int(rank.max()) + 1
+        padded = boxes.new_zeros((n, m, 4))
+        padded[idxs, rank] = boxes
+        valid = torch.zeros((n, m), dtype=torch.bool, device=boxes.device)
+        valid[idxs, rank] = True
+        keep = torch.zeros_like(valid)
+        step = max(1, max_elements // (m * m))
+        for s in range(0, n, step):
+            x1, y1, x2, y2 = padded[s : s + step, :, None].unbind(-1)  # (b, m, 1) each
+            areas = (x2 - x1) * (y2 - y1)
+            w = (torch.minimum(x2, x2.mT) - torch.maximum(x1, x1.mT)).clamp_(min=0)
+            h = (torch.minimum(y2, y2.mT) - torch.maximum(y1, y1.mT)).clamp_(min=0)
+            inter = w * h
+            suppress = (inter / (areas + areas.mT - inter) > iou_threshold).triu_(diagonal=1)  # i suppresses j > i
+            v = valid[s : s + step]
+            k = v.clone()
+            for _ in range(m):  # converges to the greedy result in at most m iterations
+                k_new = v & ~(suppress & k[..., None]).any(1)
+                if torch.equal(k_new, k):
+                    break
+                k = k_new
+            keep[s : s + step] = k
+        return keep[idxs, rank].nonzero().view(-1)
+
+    @staticmethod
+    def box_iou(box1: torch.Tensor, box2: torch.Tensor) -> torch.Tensor:
+        """Calculate pairwise IoU with the same arithmetic as `TorchNMS.nms` and torchvision NMS.
+
+        Args:
+            box1 (torch.Tensor): Bounding boxes with shape (N, 4) in xyxy format.
+            box2 (torch.Tensor): Bounding boxes with shape (M, 4) in xyxy format.
+
+        Returns:
+            (torch.Tensor): IoU matrix with shape (N, M).
+        """
+        (a1, a2), (b1, b2) = box1[:, None].chunk(2, 2), box2[None].chunk(2, 2)
+        inter = (torch.minimum(a2, b2) - torch.maximum(a1, b1)).clamp_(min=0).prod(2)
+        return inter / ((a2 - a1).prod(2) + (b2 - b1).prod(2) - inter)
+
+    @staticmethod
+    def tiled_nms(
+        boxes: torch.Tensor,
+        scores: torch.Tensor,
+        iou_threshold: float,
+        iou_func=None,
+        fast: bool = False,
+        max_det: int = 0,
+        tile: int = 512,
+    ) -> torch.Tensor:
+        """NMS over score-sorted tiles with bounded memory and early exit once `max_det` boxes are kept.
+
+        Boxes are processed in tiles of `tile` boxes in descending confidence order. Each tile is first suppressed by
+        earlier boxes in blocks of at most `tile` x `tile` IoU values, then within itself. Greedy NMS uses the
+        Cluster-NMS fixed-point iteration inside a tile and gives the same result as `TorchNMS.nms`, while `fast=True`
+        reproduces `TorchNMS.fast_nms`. Kept boxes never depend on lower scoring boxes, so processing stops as soon as
+        `max_det` boxes are kept.
+
+        Args:
+            boxes (torch.Tensor): Bounding boxes with shape (N, 4) in xyxy format, or any format `iou_func` accepts.
+            scores (torch.Tensor): Confidence scores with shape (N,).
+            iou_threshold (float): IoU threshold for suppression.
+            iou_func (callable, optional): Function to compute the IoU matrix between two sets of boxes, defaults to
+                `TorchNMS.box_iou`.
+            fast (bool): Whether suppressed boxes may still suppress others, matching Fast-NMS semantics.
+            max_det (int): Number of kept boxes after which processing stops, 0 to process all boxes.
+            tile (int): Number of boxes per tile.
+
+        Returns:
+            (torch.Tensor): Indices of boxes to keep after NMS, in descending confidence order.
+
+        Examples:
+            Apply tiled NMS to a set of boxes
+            >>> boxes = torch.tensor([[0, 0, 10, 10], [5, 5, 15, 15], [1, 1, 10, 10]]).float()
+            >>> scores = torch.tensor([0.9, 0.8, 0.7])
+            >>> keep = TorchNMS.tiled_nms(boxes, scores, 0.5, tile=2)
+        """
+        iou_func = iou_func or TorchNMS.box_iou
+        order = scores.argsort(0, descending=True)
+        boxes = boxes[order]
+        keep, n_kept = [], 0
+        for s in range(0, len(boxes), tile):
+            b = boxes[s : s + tile]
+            earlier = boxes[:s] if fast else boxes[torch.cat(keep)] if keep else boxes[:0]
+            alive = torch.ones(len(b), dtype=torch.bool, device=boxes.device)
+            for r in range(0, len(earlier), tile):  # suppression by higher scoring tiles
+                iou = iou_func(earlier[r : r + tile], b)
+                alive &= ~(iou >= iou_threshold if fast else iou > iou_threshold).any(0)
+            iou = iou_func(b, b)
+            suppress = (iou >= iou_threshold if fast else iou > iou_threshold).triu_(diagonal=1)
+            if fast:
+                alive &= ~suppress.any(0)
+            else:
+                k = alive
+                for _ in range(len(b)):  # converges to the greedy result in at most len(b) iterations
+                    k_new = alive & ~(suppress & k[:, None]).any(0)
+                    if torch.equal(k_new, k):
+                        break
+                    k = k_new
+                alive = k
+            keep.append(alive.nonzero().view(-1) + s)
+            n_kept += len(keep[-1])
+            if max_det and n_kept >= max_det:
+                break
+        return order[torch.cat(keep)] if keep else order[:0]
@@ -895,8 +895,9 @@ def plot_results(file: str = "path/to/results.csv", dir: str = "", on_plot: Call
             x = data.select(data.columns[0]).to_numpy().flatten()
             for i, j in enumerate(columns):
                 y = data.select(j).to_numpy().flatten().astype("float")
-                ax[i].plot(x, y, marker=".", label=f.stem, linewidth=2, markersize=8)  # actual results
-                ax[i].plot(x, gaussian_filter1d(y, sigma=3), ":", label="smooth", linewidth=2)  # smoothing line
+                k = np.isfinite(y)  # skip blank epochs that were not validated
+                ax[i].plot(x[k], y[k], marker=".", label=f.stem, linewidth=2, markersize=8)  # actual results
+                ax[i].plot(x[k], gaussian_filter1d(y[k], sigma=3), ":", label="smooth", linewidth=2)  # smoothing line
                 ax[i].set_title(j, fontsize=12)
         except Exception as e:
             LOGGER.error(f"Plotting error for {f}: {e}")
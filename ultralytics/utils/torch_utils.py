@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import functools
 import gc
+import json
 import math
 import os
 import random
 import time
+from collections import deque
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime
@@ -854,6 +856,128 @@ def profile_ops(input, ops, n=10, device=None, max_num_obj=0):
     return results
 
 
+class LayerProfiler:
+    """Collect per-layer latency and activation memory of a model during inference using forward hooks.
+
+    Timings are kept in bounded rolling windows so the collector can stay attached to long-running streams, and every
+    layer call is also recorded as a Chrome trace event that can be opened in chrome://tracing or Perfetto.
+
+    Attributes:
+        layers (list[nn.Module]): Top-level model layers being timed, as built by `parse_model`.
+        times (dict[int, deque]): Recent per-call latencies in milliseconds keyed by layer index.
+        memory (dict[int, deque]): Recent per-call output tensor sizes in MB keyed by layer index.
+        last (dict[str, float]): Latency in milliseconds of each layer during the most recent forward pass.
+        events (deque): Recent Chrome trace events, one per layer call.
+
+    Methods:
+        attach: Register the timing hooks on all layers.
+        detach: Remove the timing hooks.
+        summary: Aggregate latency percentiles and memory per layer.
+        export_chrome_trace: Save recorded layer calls as a Chrome trace JSON file.
+
+    Examples:
+        >>> profiler = LayerProfiler(model).attach()
+        >>> for im in images:
+        ...     model(im)
+        >>> profiler.summary()["4 C3_PConv"]["p90"]
+        >>> profiler.export_chrome_trace("layers_trace.json")
+    """
+
+    def __init__(self, model: nn.Module, window: int = 1000, max_events: int = 100000):
+        """Initialize the LayerProfiler.
+
+        Args:
+            model (nn.Module): Model with a `model` attribute holding its layers, i.e. a DetectionModel.
+            window (int): Number of most recent calls per layer used for percentiles.
+            max_events (int): Maximum number of Chrome trace events kept in memory.
+        """
+        self.layers = list(model.model)
+        self.names = {m.i: f"{m.i} {m.type.split('.')[-1]}" for m in self.layers}
+        self.times = {m.i: deque(maxlen=window) for m in self.layers}
+        self.memory = {m.i: deque(maxlen=window) for m in self.layers}
+        self.last = {}
+        self.events = deque(maxlen=max_events)
+        self._t0 = {}
+        self._hooks = []
+        self._origin = time_sync()
+
+    def attach(self) -> LayerProfiler:
+        """Register pre- and post-forward hooks on all layers and return self."""
+        if not self._hooks:
+            for m in self.layers:
+                self._hooks += [m.register_forward_pre_hook(self._pre), m.register_forward_hook(self._post)]
+        return self
+
+    def detach(self) -> None:
+        """Remove all registered hooks, keeping the collected statistics."""
+        for h in self._hooks:
+            h.remove()
+        self._hooks = []
+
+    def _pre(self, m: nn.Module, args: tuple) -> None:
+        """Record the start time of a layer call."""
+        self._t0[m.i] = time_sync()
+
+    def _post(self, m: nn.Module, args: tuple, output: Any) -> None:
+        """Record latency, output size and a trace event for a finished layer call."""
+        t1 = time_sync()
+        t0 = self._t0.pop(m.i, t1)
+        dt = (t1 - t0) * 1e3  # ms
+        outputs = output if isinstance(output, (list, tuple)) else [output]
+        mb = sum(x.numel() * x.element_size() for x in outputs if isinstance(x, torch.Tensor)) / 1e6
+        name = self.names[m.i]
+        self.times[m.i].append(dt)
+        self.memory[m.i].append(mb)
+        self.last[name] = dt
+        self.events.append(
+            {
+                "name": name,
+                "ph": "X",  # complete event
+                "ts": (t0 - self._origin) * 1e6,  # us
+                "dur": dt * 1e3,  # us
+                "pid": 0,
+                "tid": 0,
+                "args": {"output_MB": round(mb, 4)},
+            }
+        )
+
+    def summary(self, percentiles: tuple[int, ...] = (50, 90, 99)) -> dict[str, dict[str, float]]:
+        """Aggregate latency statistics and output memory for every layer that has been called.
+
+        Args:
+            percentiles (tuple[int, ...]): Latency percentiles to report.
+
+        Returns:
+            (dict[str, dict[str, float]]): Per-layer 'calls', 'mean', 'p{N}' latencies (ms) and 'output_MB', keyed by
+                layer name such as '4 C3_PConv'.
+        """
+        stats = {}
+        for i, t in self.times.items():
+            if t:
+                t = np.array(t)
+                stats[self.names[i]] = {
+                    "calls": len(t),
+                    "mean": float(t.mean()),
+                    **{f"p{p}": float(np.percentile(t, p)) for p in percentiles},
+                    "output_MB": float(np.mean(self.memory[i])),
+                }
+        return stats
+
+    def export_chrome_trace(self, file: str | Path) -> Path:
+        """Save recorded layer calls as a Chrome trace JSON file.
+
+        Args:
+            file (str | Path): Output JSON file path.
+
+        Returns:
+            (Path): Path to the saved trace file.
+        """
+        file = Path(file)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(json.dumps({"traceEvents": list(self.events), "displayTimeUnit": "ms"}))
+        return file
+
+
 class EarlyStopping:
     """Early stopping class that stops training when a specified number of epochs have passed without improvement.
 